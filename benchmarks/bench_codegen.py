@@ -0,0 +1,80 @@
+"""Скорость функций `Program.to_function` против стекового вычисления.
+
+Для выражений с переменными разной длины выводится время одного
+вычисления `ReversePolishCalculator.get_result` со списком токенов,
+в который подставлены значения, `Program.evaluate` и сгенерированной
+функции, а также время её генерации. Константы свёрнуты одинаково
+для программы и функции.
+
+Запуск: `python -m benchmarks.bench_codegen`
+"""
+import argparse
+import random
+import time
+import timeit
+
+from benchmarks.workloads import flat_rpn, nested_rpn
+from calculator import ReversePolishCalculator
+
+VARIABLES = ("x", "y", "z")
+
+
+def with_variables(rpn: str, seed: int) -> list:
+    """Заменяет часть чисел выражения переменными `VARIABLES`."""
+    rng = random.Random(seed)
+    return [
+        rng.choice(VARIABLES)
+        if token.isdecimal() and rng.random() < 0.3 else token
+        for token in rpn.split()
+    ]
+
+
+def best_us(function, number, repeat) -> float:
+    return min(timeit.repeat(function, number=number, repeat=repeat)) \
+        / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    calculator = ReversePolishCalculator()
+    values = {"x": 7, "y": 3, "z": 5}
+    print(
+        f"{'expression':>14} {'stack, us':>10} {'program, us':>12} "
+        f"{'function, us':>13} {'x stack':>8} {'codegen, us':>12}"
+    )
+    expressions = {"x 2 * y +": "x 2 * y +".split()}
+    for operators in (8, 64, 512):
+        expressions[f"flat/{operators}"] = with_variables(
+            flat_rpn(operators, operators), operators
+        )
+        expressions[f"nested/{operators}"] = with_variables(
+            nested_rpn(operators, operators), operators
+        )
+    for name, tokens in expressions.items():
+        program = calculator.compile(tokens)
+        variables = {key: values[key] for key in program.variables}
+        substituted = [str(values.get(token, token)) for token in tokens]
+        start = time.perf_counter()
+        function = program.to_function()
+        generate = (time.perf_counter() - start) * 1e6
+        number = max(1, 50_000 // len(tokens))
+        stack = best_us(
+            lambda: calculator.get_result(substituted), number, args.repeat
+        )
+        interpreted = best_us(
+            lambda: program(**variables), number, args.repeat
+        )
+        native = best_us(
+            lambda: function(**variables), number, args.repeat
+        )
+        print(
+            f"{name:>14} {stack:>10.2f} {interpreted:>12.2f} "
+            f"{native:>13.3f} {stack / native:>8.1f} {generate:>12.0f}"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""Сравнение ядра вычислений с исходной реализацией на общем `Stack`.
+
+Запуск: `python -m benchmarks.bench_core`
+"""
+import argparse
+import timeit
+
+from benchmarks.workloads import flat_rpn
+from calculator import Calculator, ReversePolishCalculator, Stack
+
+
+class LegacyReversePolishCalculator:
+    """Исходная реализация: общий стек и список операндов на операцию."""
+    def __init__(self) -> None:
+        self.numbers = Stack()
+
+    def get_result(self, data, typ=int):
+        for value in list(data):
+            if value[-1].isdecimal():
+                self.numbers.add(typ(value))
+                continue
+            operands = list(reversed(
+                list(reversed(self.numbers.get_operands(2)))
+            ))
+            self.numbers.add(Calculator.calculation(value, operands))
+        result = self.numbers.last()
+        # Сброс только для честного замера: исходный стек рос бы между
+        # вызовами.
+        self.numbers.clear()
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'operators':>10} {'legacy, us':>12} {'core, us':>10} {'x':>6}")
+    for operators in (4, 64, 1024):
+        tokens = flat_rpn(operators).split()
+        number = max(1, 20_000 // operators)
+        timings = []
+        for calculator in (
+            LegacyReversePolishCalculator(), ReversePolishCalculator()
+        ):
+            best = min(timeit.repeat(
+                lambda: calculator.get_result(tokens),
+                number=number, repeat=args.repeat
+            ))
+            timings.append(best / number * 1e6)
+        legacy, core = timings
+        print(
+            f"{operators:>10} {legacy:>12.2f} {core:>10.2f} "
+            f"{legacy / core:>6.2f}"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""Пакетные операции `deck.Deck` против поэлементных, нс/элемент.
+
+Заполняет и опустошает дек пачками по `--batch` элементов: сначала
+циклом `push_back`/`pop_front`, затем одним вызовом
+`extend_back`/`pop_front_many`.
+
+Запуск: `python -m benchmarks.bench_deck`
+"""
+import argparse
+import timeit
+
+from deck import Deck
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch", type=int, default=1000)
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    values = list(range(args.batch))
+    deck = Deck(args.batch * 2)
+    # Сдвигаем указатели, чтобы пачки переходили через конец буфера.
+    deck.extend_back(values)
+    deck.pop_front_many(args.batch)
+
+    def single():
+        for value in values:
+            deck.push_back(value)
+        for _ in values:
+            deck.pop_front()
+
+    def batch():
+        deck.extend_back(values)
+        deck.pop_front_many(args.batch)
+
+    print(f"{'mode':>8} {'ns/item':>10}")
+    results = {}
+    for name, function in (("single", single), ("batch", batch)):
+        best = min(timeit.repeat(
+            function, number=args.number, repeat=args.repeat
+        ))
+        results[name] = best / (args.number * args.batch) * 1e9
+        print(f"{name:>8} {results[name]:>10.1f}")
+    print(f"speedup: {results['single'] / results['batch']:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
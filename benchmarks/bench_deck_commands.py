@@ -0,0 +1,74 @@
+"""Скорость интерпретатора команд `deck.main`, команд/с.
+
+Генерирует файл из `--commands` команд и запускает на нём исходный
+построчный `input()`-цикл и `deck.main` в отдельных процессах,
+перенаправляя файл на stdin.
+
+Запуск: `python -m benchmarks.bench_deck_commands --commands 10000000`
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.workloads import deck_commands
+
+PROGRAMS = {
+    "legacy": "from benchmarks.bench_deck_commands import legacy_main; "
+              "legacy_main()",
+    "engine": "import deck; deck.main()",
+}
+
+
+def legacy_main():
+    """Исходный цикл `deck.main` с исправленными ошибками результата."""
+    from deck import Deck
+
+    results = []
+    commands = int(input())
+    deck = Deck(int(input()))
+    for _ in range(commands):
+        command, *args = input().split()
+        result = getattr(deck, command)(*map(int, args))
+        if result is not None:
+            results.append(str(result))
+    print('\n'.join(results))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--commands", type=int, default=10_000_000)
+    parser.add_argument("--size", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.NamedTemporaryFile(
+        "w", suffix=".txt", delete=False
+    ) as file:
+        for line in deck_commands(args.commands, args.size):
+            file.write(line)
+            file.write("\n")
+    try:
+        outputs = {}
+        print(f"{'program':>8} {'seconds':>8} {'commands/s':>12}")
+        for name, code in PROGRAMS.items():
+            with open(file.name, "rb") as stdin:
+                started = time.perf_counter()
+                outputs[name] = subprocess.run(
+                    [sys.executable, "-c", code], stdin=stdin,
+                    stdout=subprocess.PIPE, check=True
+                ).stdout
+                elapsed = time.perf_counter() - started
+            print(
+                f"{name:>8} {elapsed:>8.2f} "
+                f"{args.commands / elapsed:>12,.0f}"
+            )
+        if outputs["legacy"] != outputs["engine"]:
+            sys.exit("Результаты программ различаются.")
+    finally:
+        os.remove(file.name)
+
+
+if __name__ == '__main__':
+    main()
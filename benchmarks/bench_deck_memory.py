@@ -0,0 +1,66 @@
+"""Память и скорость `deck.Deck` против `deck.TypedDeck`.
+
+Заполняет очереди `--items` новыми числами, как при накоплении
+результатов вычислений, и измеряет через `tracemalloc` память на
+элемент вместе с объектами значений. Время заполнения и опустошения
+измеряется отдельным прогоном без трассировки.
+
+Запуск: `python -m benchmarks.bench_deck_memory`
+"""
+import argparse
+import time
+import tracemalloc
+
+from deck import Deck, TypedDeck
+
+PAYLOADS = {
+    "float": ("d", 0.5),
+    "int": ("q", 1 << 40),
+}
+
+
+def fill(factory, items, scale):
+    deck = factory(items)
+    for value in range(items):
+        deck.push_back(value * scale)
+    return deck
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=1_000_000)
+    args = parser.parse_args()
+    items = args.items
+
+    print(
+        f"{'payload':>8} {'deck':>10} {'bytes/item':>11} "
+        f"{'push ns':>8} {'pop ns':>8}"
+    )
+    for payload, (typecode, scale) in PAYLOADS.items():
+        factories = {
+            "Deck": Deck,
+            "TypedDeck": lambda size: TypedDeck(typecode, size),
+        }
+        for name, factory in factories.items():
+            tracemalloc.start()
+            deck = fill(factory, items, scale)
+            memory, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del deck
+
+            start = time.perf_counter()
+            deck = fill(factory, items, scale)
+            filled = time.perf_counter() - start
+            start = time.perf_counter()
+            for _ in range(items):
+                deck.pop_front()
+            emptied = time.perf_counter() - start
+            print(
+                f"{payload:>8} {name:>10} {memory / items:>11.1f} "
+                f"{filled / items * 1e9:>8.1f} "
+                f"{emptied / items * 1e9:>8.1f}"
+            )
+
+
+if __name__ == '__main__':
+    main()
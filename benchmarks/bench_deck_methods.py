@@ -0,0 +1,94 @@
+"""Скорость методов `deck.Deck`, операций/с.
+
+Для каждого метода выполняется `--operations` вызовов в обычном
+режиме и в режиме `strict`, а также вызовы на пустой или заполненной
+последовательности: возврат `error` против поднятия и перехвата
+`DeckEmpty`/`DeckFull`.
+
+Запуск: `python -m benchmarks.bench_deck_methods`
+"""
+import argparse
+import time
+
+from deck import Deck, DeckError
+
+
+def best_rate(function, operations, repeat) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        elapsed = function()
+        best = min(best, elapsed)
+    return operations / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--operations", type=int, default=300_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    values = range(args.operations)
+
+    def push(name, strict):
+        def run():
+            method = getattr(Deck(args.operations, strict=strict), name)
+            start = time.perf_counter()
+            for value in values:
+                method(value)
+            return time.perf_counter() - start
+        return run
+
+    def pop(name, strict):
+        def run():
+            deck = Deck(args.operations, strict=strict)
+            deck.extend_back(values)
+            method = getattr(deck, name)
+            start = time.perf_counter()
+            for _ in values:
+                method()
+            return time.perf_counter() - start
+        return run
+
+    def get(name, strict):
+        def run():
+            deck = Deck(1, strict=strict)
+            deck.push_back(0)
+            method = getattr(deck, name)
+            start = time.perf_counter()
+            for _ in values:
+                method()
+            return time.perf_counter() - start
+        return run
+
+    def failure(strict):
+        def run():
+            method = Deck(1, strict=strict).pop_front
+            start = time.perf_counter()
+            for _ in values:
+                try:
+                    method()
+                except DeckError:
+                    pass
+            return time.perf_counter() - start
+        return run
+
+    methods = {
+        "push_back": push, "push_front": push,
+        "pop_back": pop, "pop_front": pop,
+        "get_back": get, "get_front": get,
+    }
+    print(f"{'method':>16} {'default':>12} {'strict':>12}")
+    for name, factory in methods.items():
+        rates = [
+            best_rate(factory(name, strict), args.operations, args.repeat)
+            for strict in (False, True)
+        ]
+        print(f"{name:>16} {rates[0]:>12,.0f} {rates[1]:>12,.0f}")
+    rates = [
+        best_rate(failure(strict), args.operations, args.repeat)
+        for strict in (False, True)
+    ]
+    print(f"{'pop_front/empty':>16} {rates[0]:>12,.0f} {rates[1]:>12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
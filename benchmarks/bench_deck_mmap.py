@@ -0,0 +1,49 @@
+"""Стоимость надёжности `deck_mmap.MappedDeck`, операций/с.
+
+Выполняет пары `push_back`/`pop_front` на `deck.Deck` и на
+`MappedDeck` с разной политикой `sync_every`.
+
+Запуск: `python -m benchmarks.bench_deck_mmap --operations 100000`
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from deck import Deck
+from deck_mmap import MappedDeck
+
+
+def run(deck, operations) -> float:
+    start = time.perf_counter()
+    for value in range(operations // 2):
+        deck.push_back(value)
+        deck.pop_front()
+    return operations / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--operations", type=int, default=100_000)
+    parser.add_argument("--size", type=int, default=1024)
+    parser.add_argument(
+        "--dir", default=None, help="Каталог для файла очереди."
+    )
+    args = parser.parse_args()
+
+    print(f"{'deck':>28} {'ops/s':>12}")
+    print(f"{'Deck':>28} {run(Deck(args.size), args.operations):>12,.0f}")
+    with tempfile.TemporaryDirectory(dir=args.dir) as directory:
+        for sync_every in (0, 1000, 1):
+            path = os.path.join(directory, f"deck-{sync_every}")
+            with MappedDeck(path, args.size, sync_every=sync_every) as deck:
+                # Операций с надёжным сбросом меньше: каждая ждёт диск.
+                operations = args.operations // (100 if sync_every == 1
+                                                 else 1)
+                rate = run(deck, operations)
+            name = f"MappedDeck(sync_every={sync_every})"
+            print(f"{name:>28} {rate:>12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""`deck_shm.SharedDeck` против `multiprocessing.Queue`, элементов/с.
+
+Производители и потребители в отдельных процессах передают `--items`
+целых чисел через очередь размера `--size`.
+
+Запуск: `python -m benchmarks.bench_deck_shm --producers 2 --consumers 2`
+"""
+import argparse
+import multiprocessing
+import time
+
+from deck_shm import SharedDeck
+
+
+def deck_producer(deck, count):
+    for value in range(count):
+        deck.push_back(value, timeout=None)
+
+
+def deck_consumer(deck, count):
+    for _ in range(count):
+        deck.pop_front(timeout=None)
+
+
+def queue_producer(queue, count):
+    for value in range(count):
+        queue.put(value)
+
+
+def queue_consumer(queue, count):
+    for _ in range(count):
+        queue.get()
+
+
+def run(channel, producer, consumer, args) -> float:
+    processes = [
+        multiprocessing.Process(
+            target=producer, args=(channel, args.items // args.producers)
+        )
+        for _ in range(args.producers)
+    ] + [
+        multiprocessing.Process(
+            target=consumer, args=(channel, args.items // args.consumers)
+        )
+        for _ in range(args.consumers)
+    ]
+    start = time.perf_counter()
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    return args.items / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=200_000)
+    parser.add_argument("--size", type=int, default=1024)
+    parser.add_argument("--producers", type=int, default=1)
+    parser.add_argument("--consumers", type=int, default=1)
+    args = parser.parse_args()
+    if args.items % args.producers or args.items % args.consumers:
+        parser.error("`--items` должно делиться на количество процессов.")
+
+    print(f"{'queue':>22} {'items/s':>12}")
+    with SharedDeck(args.size) as deck:
+        rate = run(deck, deck_producer, deck_consumer, args)
+    print(f"{'SharedDeck':>22} {rate:>12,.0f}")
+    rate = run(
+        multiprocessing.Queue(args.size), queue_producer, queue_consumer, args
+    )
+    print(f"{'multiprocessing.Queue':>22} {rate:>12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
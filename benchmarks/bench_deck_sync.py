@@ -0,0 +1,101 @@
+"""Пропускная способность очередей производитель/потребитель, элементов/с.
+
+Сравнивает `deck_sync.BlockingDeck` с `queue.Queue` на потоках и
+`deck_sync.AsyncDeck` с `asyncio.Queue` на сопрограммах при нескольких
+производителях и потребителях и маленьком буфере, где заметна
+backpressure.
+
+Запуск: `python -m benchmarks.bench_deck_sync`
+"""
+import argparse
+import asyncio
+import queue
+import threading
+import time
+
+from deck_sync import AsyncDeck, BlockingDeck
+
+
+def run_threads(put, get, producers, consumers, items) -> float:
+    def produce(count):
+        for value in range(count):
+            put(value)
+
+    def consume():
+        while get() is not None:
+            pass
+
+    share = items // producers
+    threads = [
+        threading.Thread(target=produce, args=(share,))
+        for _ in range(producers)
+    ] + [threading.Thread(target=consume) for _ in range(consumers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads[:producers]:
+        thread.join()
+    for _ in range(consumers):
+        put(None)
+    for thread in threads[producers:]:
+        thread.join()
+    return share * producers / (time.perf_counter() - start)
+
+
+async def run_tasks(put, get, producers, consumers, items) -> float:
+    async def produce(count):
+        for value in range(count):
+            await put(value)
+
+    async def consume():
+        while await get() is not None:
+            pass
+
+    share = items // producers
+    start = time.perf_counter()
+    tasks = [asyncio.create_task(consume()) for _ in range(consumers)]
+    await asyncio.gather(*(produce(share) for _ in range(producers)))
+    for _ in range(consumers):
+        await put(None)
+    await asyncio.gather(*tasks)
+    return share * producers / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=200_000)
+    parser.add_argument("--producers", type=int, default=4)
+    parser.add_argument("--consumers", type=int, default=4)
+    parser.add_argument("--size", type=int, default=64)
+    args = parser.parse_args()
+    workers = (args.producers, args.consumers, args.items)
+
+    print(f"{'queue':>14} {'items/s':>12}")
+    blocking = BlockingDeck(args.size)
+    results = {
+        "BlockingDeck": run_threads(
+            blocking.push_back, blocking.pop_front, *workers
+        ),
+    }
+    std_queue = queue.Queue(args.size)
+    results["queue.Queue"] = run_threads(
+        std_queue.put, std_queue.get, *workers
+    )
+
+    async def run_async():
+        async_deck = AsyncDeck(args.size)
+        results["AsyncDeck"] = await run_tasks(
+            async_deck.push_back, async_deck.pop_front, *workers
+        )
+        async_queue = asyncio.Queue(args.size)
+        results["asyncio.Queue"] = await run_tasks(
+            async_queue.put, async_queue.get, *workers
+        )
+
+    asyncio.run(run_async())
+    for name, rate in results.items():
+        print(f"{name:>14} {rate:>12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""Стоимость перевода инфиксных формул в обратную польскую нотацию.
+
+Для формул с разным количеством операций (плоских и глубоко
+вложенных) выводится время перевода без кэша на формулу и на токен,
+время повторного перевода из кэша и время `InfixCalculator.get_result`
+по сравнению с `ReversePolishCalculator.get_result` той же формулы.
+
+Запуск: `python -m benchmarks.bench_infix`
+"""
+import argparse
+import timeit
+
+import infix
+from benchmarks.workloads import flat_rpn, nested_rpn, to_infix
+from calculator import ReversePolishCalculator
+
+
+def best_us(function, number, repeat) -> float:
+    return min(timeit.repeat(function, number=number, repeat=repeat)) \
+        / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'formula':>12} {'tokens':>7} {'parse, us':>10} {'ns/token':>9} "
+        f"{'cached, us':>11} {'infix, us':>10} {'rpn, us':>8}"
+    )
+    infix_calculator = infix.InfixCalculator()
+    rpn_calculator = ReversePolishCalculator()
+    for kind, generate in (("flat", flat_rpn), ("nested", nested_rpn)):
+        for operators in (4, 16, 64, 256, 1024):
+            rpn = generate(operators)
+            formula = to_infix(rpn)
+            tokens = len(infix._lex(formula))
+            number = max(1, 20_000 // tokens)
+            parse = best_us(
+                lambda: infix._to_rpn(formula), number, args.repeat
+            )
+            infix.to_rpn(formula)
+            cached = best_us(
+                lambda: infix.to_rpn(formula), number, args.repeat
+            )
+            evaluate_infix = best_us(
+                lambda: infix_calculator.get_result(formula), number,
+                args.repeat
+            )
+            evaluate_rpn = best_us(
+                lambda: rpn_calculator.get_result(rpn), number, args.repeat
+            )
+            print(
+                f"{kind + '/' + str(operators):>12} {tokens:>7} "
+                f"{parse:>10.1f} {parse / tokens * 1e3:>9.0f} "
+                f"{cached:>11.2f} {evaluate_infix:>10.2f} "
+                f"{evaluate_rpn:>8.2f}"
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""Стоимость вызова каждой операции `Calculator.ACTIONS`, нс/операцию.
+
+Сравнивает проверяющий `Calculator.calculation` с прямым вызовом
+заранее найденной функции операции - непроверяющим путём, которым
+вычислители калькуляторов вызывают операции.
+
+Запуск: `python -m benchmarks.bench_operators`
+"""
+import argparse
+import timeit
+
+from calculator import Calculator
+
+OPERANDS = (13, 4, 7, 9)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    def measure(function, *call_args) -> float:
+        best = min(timeit.repeat(
+            lambda: function(*call_args),
+            number=args.number, repeat=args.repeat
+        ))
+        return best / args.number * 1e9
+
+    print(f"{'operator':>8} {'checked':>10} {'direct':>10}")
+    for symbol, action in Calculator.ACTIONS.entries.items():
+        if action.variadic:
+            symbol = f"{symbol}/{len(OPERANDS)}"
+            action = Calculator.ACTIONS.resolve(symbol)
+        operands = OPERANDS[:action.arity]
+        checked = measure(Calculator.calculation, symbol, operands)
+        direct = measure(action.function, *operands)
+        print(f"{symbol:>8} {checked:>10.0f} {direct:>10.0f}")
+
+
+if __name__ == '__main__':
+    main()
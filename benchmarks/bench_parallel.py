@@ -0,0 +1,48 @@
+"""Масштабирование `parallel.evaluate_file` по количеству процессов.
+
+Запуск: `python -m benchmarks.bench_parallel --lines 1000000`
+"""
+import argparse
+import io
+import os
+import tempfile
+import time
+
+import parallel
+from benchmarks.workloads import rpn_lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=200_000)
+    parser.add_argument("--chunk-size", type=int, default=parallel.CHUNK_SIZE)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    with tempfile.NamedTemporaryFile(
+        "w", suffix=".txt", delete=False
+    ) as file:
+        file.write("\n".join(rpn_lines(args.lines)))
+        file.write("\n")
+    try:
+        workers = sorted(
+            {1, args.max_workers}
+            | {2 ** power for power in range(args.max_workers.bit_length())}
+        )
+        base = None
+        print(f"{'workers':>8} {'lines/s':>12} {'speedup':>8}")
+        for count in workers:
+            started = time.perf_counter()
+            parallel.evaluate_file(
+                file.name, io.StringIO(), workers=count,
+                chunk_size=args.chunk_size
+            )
+            rate = args.lines / (time.perf_counter() - started)
+            base = base or rate
+            print(f"{count:>8} {rate:>12,.0f} {rate / base:>8.2f}")
+    finally:
+        os.remove(file.name)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+"""Нагрузочный клиент сервера `server.py`: запросы/с, p50 и p99.
+
+Запускает сервер в отдельном процессе на Unix-сокете (или на TCP с
+`--tcp`) и открывает `--connections` соединений. Каждое держит до
+`--depth` неотвеченных запросов. Задержка запроса - время от отправки
+строки до получения ответа. Для сравнения `--spawn` запросов
+выполняются запуском `python calculator.py` на каждый запрос.
+
+Запуск: `python -m benchmarks.bench_server --connections 8 --depth 32`
+"""
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from collections import deque
+from statistics import quantiles
+
+from benchmarks.workloads import rpn_lines
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+async def client(connect, lines, requests, depth, latencies):
+    reader, writer = await connect()
+    window = asyncio.Semaphore(depth)
+    sent: deque = deque()
+
+    async def send():
+        for number in range(requests):
+            await window.acquire()
+            sent.append(time.perf_counter())
+            writer.write(lines[number % len(lines)])
+            # Запись в буфер не уступает управление, поэтому ждём
+            # отправки, только если буфер вырос.
+            await writer.drain()
+
+    sender = asyncio.create_task(send())
+    for _ in range(requests):
+        if not await reader.readline():
+            raise ConnectionError("Сервер закрыл соединение.")
+        latencies.append(time.perf_counter() - sent.popleft())
+        window.release()
+    await sender
+    writer.close()
+
+
+async def load(connect, args):
+    lines = [f"{line}\n".encode() for line in rpn_lines(1000)]
+    latencies: list = []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        client(connect, lines, args.requests, args.depth, latencies)
+        for _ in range(args.connections)
+    ))
+    return latencies, time.perf_counter() - start
+
+
+async def wait_ready(connect, process):
+    for _ in range(200):
+        if process.poll() is not None:
+            raise RuntimeError("Сервер не запустился.")
+        try:
+            _, writer = await connect()
+        except OSError:
+            await asyncio.sleep(0.05)
+            continue
+        writer.close()
+        return
+    raise RuntimeError("Сервер не отвечает.")
+
+
+def report(name, latencies, elapsed):
+    percentiles = quantiles(latencies, n=100)
+    print(
+        f"{name:>8} {len(latencies) / elapsed:>12,.0f} "
+        f"{percentiles[49] * 1e3:>9.3f} {percentiles[98] * 1e3:>9.3f}"
+    )
+
+
+def spawn_baseline(count):
+    latencies = []
+    start = time.perf_counter()
+    for line in rpn_lines(count):
+        started = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "calculator.py"], input=f"{line}\n",
+            text=True, capture_output=True, check=True, cwd=ROOT
+        )
+        latencies.append(time.perf_counter() - started)
+    return latencies, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--connections", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=20_000,
+                        help="Запросов на соединение.")
+    parser.add_argument("--depth", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--tcp", action="store_true")
+    parser.add_argument("--spawn", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        if args.tcp:
+            address = ["--port", "8765"]
+
+            def connect():
+                return asyncio.open_connection("127.0.0.1", 8765)
+        else:
+            path = os.path.join(directory, "socket")
+            address = ["--unix", path]
+
+            def connect():
+                return asyncio.open_unix_connection(path)
+
+        process = subprocess.Popen(
+            [sys.executable, "server.py", *address,
+             "--workers", str(args.workers),
+             "--batch-size", str(args.batch_size)],
+            cwd=ROOT
+        )
+        try:
+            asyncio.run(wait_ready(connect, process))
+            latencies, elapsed = asyncio.run(load(connect, args))
+        finally:
+            process.terminate()
+            process.wait()
+
+    print(f"{'mode':>8} {'requests/s':>12} {'p50, ms':>9} {'p99, ms':>9}")
+    report("server", latencies, elapsed)
+    if args.spawn > 1:
+        report("spawn", *spawn_baseline(args.spawn))
+
+
+if __name__ == '__main__':
+    main()
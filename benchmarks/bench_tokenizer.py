@@ -0,0 +1,54 @@
+"""Сравнение `calculator.tokenize` с `str.split` и проверкой `isdecimal`.
+
+Запуск: `python -m benchmarks.bench_tokenizer --operators 1000000`
+"""
+import argparse
+import time
+
+from benchmarks.workloads import flat_rpn
+from calculator import ReversePolishCalculator, tokenize
+
+
+def split_isdecimal(data: str) -> list:
+    """Исходный разбор: список токенов и приведение по последнему символу."""
+    return [
+        int(token) if token[-1].isdecimal() else token
+        for token in data.split()
+    ]
+
+
+def measure(function, *args) -> float:
+    started = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--operators", type=int, default=500_000)
+    args = parser.parse_args()
+
+    text = flat_rpn(args.operators)
+    data = text.encode()
+    megabytes = len(data) / 2 ** 20
+    cases = (
+        ("split + isdecimal (str)", split_isdecimal, text),
+        ("tokenize (str)", lambda value: list(tokenize(value)), text),
+        ("tokenize (bytes)", lambda value: list(tokenize(value)), data),
+        (
+            "tokenize (memoryview)",
+            lambda value: list(tokenize(value)), memoryview(data)
+        ),
+        (
+            "get_result (bytes)",
+            ReversePolishCalculator().get_result, data
+        ),
+    )
+    print(f"expression: {megabytes:.1f} MB")
+    for name, function, value in cases:
+        seconds = measure(function, value)
+        print(f"{name:>26}: {seconds:7.3f} s {megabytes / seconds:8.1f} MB/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""Скользящие агрегаты `window` против повторного просмотра окна.
+
+Для каждого размера окна поток значений проходит через `SlidingMin`,
+`SlidingMax`, `SlidingSum` и через наивный вариант, который на каждом
+значении заново считает агрегат по `collections.deque(maxlen=size)`.
+Наивный вариант замеряется на ограниченном числе значений после
+заполнения окна, иначе окна размера 10^6 считались бы часами.
+
+Запуск: `python -m benchmarks.bench_window`
+"""
+import argparse
+import random
+import time
+from collections import deque
+
+from window import SlidingMax, SlidingMin, SlidingSum
+
+WINDOW_SIZES = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+AGGREGATES = {"min": (SlidingMin, min), "max": (SlidingMax, max),
+              "sum": (SlidingSum, sum)}
+
+
+def per_value(function, values) -> float:
+    start = time.perf_counter()
+    function(values)
+    return (time.perf_counter() - start) / len(values) * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--values", type=int, default=200_000)
+    parser.add_argument(
+        "--naive-budget", type=int, default=20_000_000,
+        help="Наибольшее число просмотренных элементов наивного варианта."
+    )
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(
+        f"{'window':>9} {'aggregate':>9} {'sliding ns':>11} "
+        f"{'naive ns':>12} {'x':>9}"
+    )
+    for size in WINDOW_SIZES:
+        values = [rng.random() for _ in range(max(args.values, 2 * size))]
+        fill, stream = values[:size], values[size:]
+        steps = max(1, min(len(stream), args.naive_budget // size))
+        for name, (cls, aggregate) in AGGREGATES.items():
+            sliding = cls(size)
+            sliding.extend(fill)
+            fast = per_value(sliding.extend, stream)
+
+            naive_window = deque(fill, maxlen=size)
+
+            def naive(chunk):
+                for value in chunk:
+                    naive_window.append(value)
+                    aggregate(naive_window)
+
+            slow = per_value(naive, stream[:steps])
+            print(
+                f"{size:>9} {name:>9} {fast:>11.1f} {slow:>12.1f} "
+                f"{slow / fast:>9.1f}"
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,320 @@
+"""Воспроизводимый набор бенчмарков `Stack`, `Deck` и калькуляторов.
+
+Нагрузки генерируются с фиксированным `--seed`, для каждого случая
+сохраняется лучшее из `--repeat` время одной операции (для
+калькуляторов - вычисления одного выражения). Случаи:
+
+- `stack/*` - добавление и удаление значений `Stack` и `ArrayStack`;
+- `deck/*` и `deque/*` - каждый метод `Deck` и его аналог
+  `collections.deque` на малом кольцевом буфере, указатели которого
+  постоянно переходят через границу массива;
+- `polish/*` и `rpn/*` - `PolishCalculator` и `ReversePolishCalculator`
+  на коротком, длинном и глубоко вложенном выражении: списком токенов
+  (вычисление на стеке) и строкой (кешированная компиляция).
+
+`run` выводит результаты и сохраняет их в JSON, `compare` сравнивает
+результаты с сохранённой базой и завершается с кодом 1, если какой-то
+случай медленнее базы больше чем на `--threshold`.
+
+Запуск: `python -m benchmarks.suite run --output baseline.json`,
+`python -m benchmarks.suite compare baseline.json [current.json]`
+"""
+import argparse
+import json
+import platform
+import sys
+import timeit
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
+
+from benchmarks.workloads import flat_rpn, nested_rpn, to_polish
+from calculator import (
+    ArrayStack, PolishCalculator, ReversePolishCalculator, Stack
+)
+from deck import Deck
+
+RING_SIZE = 64
+CHUNK_SIZE = 48
+THRESHOLD = 0.1
+
+Case = Tuple[Callable[[], None], int]
+
+
+def stack_cases(operations: int) -> Dict[str, Case]:
+    values = range(operations)
+
+    def push_pop(stack):
+        add, pop = stack.add, stack.pop
+
+        def run():
+            for value in values:
+                add(value)
+            for _ in values:
+                pop()
+        return run, 2 * operations
+
+    return {
+        "stack/push_pop": push_pop(Stack()),
+        "stack/array_push_pop": push_pop(ArrayStack()),
+    }
+
+
+def _wrapped_deck(position: int = RING_SIZE - 3) -> Deck:
+    """Пустая `Deck`, указатели которой стоят на индексе `position`."""
+    deck = Deck(RING_SIZE)
+    for value in range(position):
+        deck.push_back(value)
+        deck.pop_front()
+    return deck
+
+
+def deck_cases(operations: int) -> Dict[str, Case]:
+    """Пары методов, при которых кольцевой буфер переходит через границу.
+
+    Каждый случай `deck/*` имеет аналог `deque/*` с той же нагрузкой.
+    Очереди в одном направлении обходят весь буфер, а пары на одном
+    конце переходят через границу массива при каждом вызове.
+    """
+    rounds = max(1, operations // RING_SIZE)
+    chunk = list(range(CHUNK_SIZE))
+    cases: Dict[str, Case] = {}
+
+    def pairs(name, methods, position, fill):
+        """Попеременно вызывает первый и второй метод пары."""
+        for prefix, target, (first, second) in (
+            ("deck", _wrapped_deck(position), methods[0]),
+            ("deque", deque(maxlen=RING_SIZE), methods[1]),
+        ):
+            put, take = getattr(target, first), getattr(target, second)
+            for value in range(fill):
+                put(value)
+
+            def run(put=put, take=take):
+                for value in range(rounds * RING_SIZE):
+                    put(value)
+                    take()
+            cases[f"{prefix}/{name}"] = run, 2 * rounds * RING_SIZE
+
+    pairs(
+        "push_back+pop_front",
+        (("push_back", "pop_front"), ("append", "popleft")),
+        0, RING_SIZE // 2
+    )
+    pairs(
+        "push_front+pop_back",
+        (("push_front", "pop_back"), ("appendleft", "pop")),
+        0, RING_SIZE // 2
+    )
+    pairs(
+        "push_back+pop_back",
+        (("push_back", "pop_back"), ("append", "pop")),
+        RING_SIZE - 1, 0
+    )
+    pairs(
+        "push_front+pop_front",
+        (("push_front", "pop_front"), ("appendleft", "popleft")),
+        0, 0
+    )
+
+    deck, deque_ = _wrapped_deck(), deque(maxlen=RING_SIZE)
+    deck.extend_back(range(8))
+    deque_.extend(range(8))
+
+    def get_deck():
+        get_front, get_back = deck.get_front, deck.get_back
+        for _ in range(rounds * RING_SIZE):
+            get_front()
+            get_back()
+
+    def get_deque():
+        for _ in range(rounds * RING_SIZE):
+            deque_[0]
+            deque_[-1]
+
+    cases["deck/get_front+get_back"] = get_deck, 2 * rounds * RING_SIZE
+    cases["deque/get_front+get_back"] = get_deque, 2 * rounds * RING_SIZE
+
+    def bulk(name, extend, pop_many):
+        deck = _wrapped_deck()
+
+        def run():
+            for _ in range(rounds):
+                getattr(deck, extend)(chunk)
+                getattr(deck, pop_many)(CHUNK_SIZE)
+        cases[f"deck/{name}"] = run, 2 * rounds * CHUNK_SIZE
+
+    def bulk_deque(name, extend, pop):
+        deque_ = deque(maxlen=RING_SIZE)
+
+        def run():
+            for _ in range(rounds):
+                extend(deque_, chunk)
+                take = getattr(deque_, pop)
+                [take() for _ in range(CHUNK_SIZE)]
+        cases[f"deque/{name}"] = run, 2 * rounds * CHUNK_SIZE
+
+    bulk("extend_back+pop_front_many", "extend_back", "pop_front_many")
+    bulk("extend_front+pop_back_many", "extend_front", "pop_back_many")
+    bulk_deque("extend_back+pop_front_many", deque.extend, "popleft")
+    bulk_deque(
+        "extend_front+pop_back_many",
+        lambda target, values: target.extendleft(reversed(values)), "pop"
+    )
+    return cases
+
+
+def calculator_cases(operations: int, seed: int) -> Dict[str, Case]:
+    """Короткое, длинное и вложенное выражение в обеих нотациях."""
+    expressions = {
+        "short": flat_rpn(4, seed),
+        "long": flat_rpn(256, seed),
+        "nested": nested_rpn(256, seed),
+    }
+    cases: Dict[str, Case] = {}
+    for prefix, calculator, notation in (
+        ("polish", PolishCalculator(), to_polish),
+        ("rpn", ReversePolishCalculator(), str),
+    ):
+        for name, rpn in expressions.items():
+            data = notation(rpn)
+            tokens = data.split()
+            number = max(1, operations // len(tokens))
+            # Операция - вычисление всего выражения.
+            for kind, value in (("tokens", tokens), ("str", data)):
+                def run(
+                    get_result=calculator.get_result, value=value,
+                    number=number
+                ):
+                    for _ in range(number):
+                        get_result(value)
+                cases[f"{prefix}/{name}/{kind}"] = run, number
+    return cases
+
+
+def run_suite(
+    operations: int = 100_000, repeat: int = 5, seed: int = 0,
+    only: Optional[str] = None
+) -> dict:
+    """Выполняет бенчмарки и возвращает результаты для JSON.
+
+    Args:
+        operations (int, optional): Примерное количество операций в
+        одном замере. Defaults to 100_000.
+        repeat (int, optional): Количество замеров. Defaults to 5.
+        seed (int, optional): Зерно генерации выражений. Defaults to 0.
+        only (str, optional): Подстрока имён выполняемых случаев.
+
+    Returns:
+        dict: Окружение и секунды на операцию по именам случаев.
+    """
+    cases = {
+        **stack_cases(operations),
+        **deck_cases(operations),
+        **calculator_cases(operations, seed),
+    }
+    results = {}
+    for name, (run, count) in cases.items():
+        if only and only not in name:
+            continue
+        # `timeit` отключает сборщик мусора на время замера.
+        best = min(timeit.Timer(run).repeat(repeat, number=1))
+        results[name] = {"seconds_per_op": best / count, "operations": count}
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "operations": operations,
+        "repeat": repeat,
+        "seed": seed,
+        "results": results,
+    }
+
+
+def compare(
+    baseline: dict, current: dict, threshold: float = THRESHOLD
+) -> List[tuple]:
+    """Сравнивает результаты с базой.
+
+    Returns:
+        list: Кортежи (имя, база, текущее, отношение, регрессия) для
+        случаев, которые есть в обоих результатах.
+
+    Examples:
+        >>> base = {"results": {"a": {"seconds_per_op": 1.0},
+        ...                     "b": {"seconds_per_op": 2.0}}}
+        >>> new = {"results": {"a": {"seconds_per_op": 1.05},
+        ...                    "b": {"seconds_per_op": 3.0}}}
+        >>> compare(base, new, threshold=0.1)
+        [('a', 1.0, 1.05, 1.05, False), ('b', 2.0, 3.0, 1.5, True)]
+    """
+    rows = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        old, new = base["seconds_per_op"], result["seconds_per_op"]
+        ratio = new / old
+        rows.append((name, old, new, ratio, ratio > 1 + threshold))
+    return rows
+
+
+def print_results(report: dict) -> None:
+    print(f"{'case':<42} {'ns/op':>10}")
+    for name, result in report["results"].items():
+        print(f"{name:<42} {result['seconds_per_op'] * 1e9:>10.1f}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    for command in ("run", "compare"):
+        subparser = commands.add_parser(command)
+        if command == "compare":
+            subparser.add_argument("baseline")
+            subparser.add_argument(
+                "current", nargs="?",
+                help="Результаты для сравнения, иначе набор выполняется."
+            )
+            subparser.add_argument(
+                "--threshold", type=float, default=THRESHOLD,
+                help="Допустимое относительное замедление."
+            )
+        subparser.add_argument("--output", help="Сохранить результаты.")
+        subparser.add_argument("--operations", type=int, default=100_000)
+        subparser.add_argument("--repeat", type=int, default=5)
+        subparser.add_argument("--seed", type=int, default=0)
+        subparser.add_argument("--only", help="Подстрока имён случаев.")
+    args = parser.parse_args(argv)
+
+    if args.command == "compare" and args.current:
+        with open(args.current) as file:
+            report = json.load(file)
+    else:
+        report = run_suite(args.operations, args.repeat, args.seed, args.only)
+        if args.command == "run":
+            print_results(report)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    if args.command == "run":
+        return 0
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    rows = compare(baseline, report, args.threshold)
+    print(f"{'case':<42} {'base':>8} {'now':>8} {'x':>6}")
+    for name, old, new, ratio, regressed in rows:
+        print(
+            f"{name:<42} {old * 1e9:>8.1f} {new * 1e9:>8.1f} {ratio:>6.2f}"
+            + ("  REGRESSION" if regressed else "")
+        )
+    regressions = sum(row[-1] for row in rows)
+    print(f"{regressions} regression(s) beyond {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
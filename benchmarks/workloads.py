@@ -0,0 +1,111 @@
+"""Генераторы воспроизводимых нагрузок для бенчмарков."""
+import random
+from typing import Iterator, List
+
+NUMBERS = range(1, 100)
+OPERATORS = ("+", "-", "*", "/")
+
+
+def flat_rpn(operators: int, seed: int = 0) -> str:
+    """Возвращает выражение вида `a b op c op ...`.
+
+    Правый операнд каждой операции - ненулевая константа, поэтому
+    выражение вычисляется без деления на ноль.
+
+    Examples:
+        >>> flat_rpn(2, seed=1)
+        '18 73 + 33 +'
+    """
+    rng = random.Random(seed)
+    tokens: List[str] = [str(rng.choice(NUMBERS))]
+    for _ in range(operators):
+        tokens.append(str(rng.choice(NUMBERS)))
+        tokens.append(rng.choice(OPERATORS))
+    return " ".join(tokens)
+
+
+def nested_rpn(depth: int, seed: int = 0) -> str:
+    """Возвращает выражение, стек которого растёт до `depth + 1`.
+
+    Examples:
+        >>> nested_rpn(2, seed=1)
+        '18 73 98 + -'
+    """
+    rng = random.Random(seed)
+    numbers = [str(rng.choice(NUMBERS)) for _ in range(depth + 1)]
+    operators = [rng.choice(OPERATORS[:3]) for _ in range(depth)]
+    return " ".join(numbers + operators)
+
+
+def to_polish(rpn: str) -> str:
+    """Переводит выражение из обратной польской нотации в польскую.
+
+    Examples:
+        >>> to_polish("18 73 98 + -")
+        '- 18 + 73 98'
+    """
+    operands: List[str] = []
+    for token in rpn.split():
+        if token in OPERATORS:
+            right = operands.pop()
+            operands.append(f"{token} {operands.pop()} {right}")
+        else:
+            operands.append(token)
+    return operands.pop()
+
+
+def to_infix(rpn: str) -> str:
+    """Переводит выражение из обратной польской нотации в инфиксную.
+
+    Составные операнды берутся в скобки там, где без них изменился бы
+    порядок вычисления.
+
+    Examples:
+        >>> to_infix("18 73 98 + -")
+        '18 - (73 + 98)'
+        >>> to_infix("1 2 + 3 * 4 -")
+        '(1 + 2) * 3 - 4'
+    """
+    operands: List[str] = []
+    for token in rpn.split():
+        if token in OPERATORS:
+            right = operands.pop()
+            left = operands.pop()
+            if " " in right:
+                right = f"({right})"
+            if " " in left and token in "*/":
+                left = f"({left})"
+            operands.append(f"{left} {token} {right}")
+        else:
+            operands.append(token)
+    return operands.pop()
+
+
+def rpn_lines(lines: int, operators: int = 8, seed: int = 0) -> List[str]:
+    """Возвращает список независимых выражений для построчной обработки."""
+    return [
+        flat_rpn(operators, seed=seed + number) for number in range(lines)
+    ]
+
+
+def deck_commands(
+    commands: int, size: int = 1000, seed: int = 0
+) -> Iterator[str]:
+    """Возвращает строки входных данных `deck.main`.
+
+    Первые две строки - количество команд и размер последовательности.
+
+    Examples:
+        >>> list(deck_commands(2, size=4, seed=1))
+        ['2', '4', 'push_front 73', 'push_back 33']
+    """
+    rng = random.Random(seed)
+    yield str(commands)
+    yield str(size)
+    names = ("push_back", "push_front", "pop_back", "pop_front")
+    for _ in range(commands):
+        name = names[rng.randrange(4)]
+        if name.startswith("push"):
+            yield f"{name} {rng.choice(NUMBERS)}"
+        else:
+            yield name
@@ -1,4 +1,168 @@
-from typing import Any, Sequence, Union
+import argparse
+import codecs
+import keyword
+import math
+import operator
+import sys
+from array import array
+from collections.abc import Mapping
+from functools import lru_cache
+from itertools import chain, count
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, NamedTuple, Optional, Sequence,
+    TextIO, Tuple, Union
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+COMPILE_CACHE_SIZE = 1024
+COMPILE_TEXT_LIMIT = 4096
+TOKENIZE_BLOCK_SIZE = 1 << 16
+
+
+def tokenize(
+    data: Union[str, bytes, bytearray, memoryview], typ=int,
+    block_size: int = TOKENIZE_BLOCK_SIZE
+) -> Iterator[Union[str, int, float, complex]]:
+    """Лениво разбивает выражение на токены за один проход.
+
+    Токен, начинающийся с цифры или точки (возможно, после знака),
+    считается числом и сразу приводится к `typ`, поэтому поддерживаются
+    отрицательные и дробные числа, а для `float` и `complex` - и
+    экспоненциальная запись. Операции и имена переменных возвращаются
+    строками. Данные читаются блоками по `block_size`, поэтому большие
+    байтовые данные и `memoryview` не копируются и не декодируются
+    целиком.
+
+    Args:
+        data (str | bytes | bytearray | memoryview): Выражение.
+        typ (_type_, optional): Тип чисел. Defaults to int.
+        block_size (int, optional): Размер блока.
+        Defaults to TOKENIZE_BLOCK_SIZE.
+
+    Raises:
+        TypeError: Неподдерживаемый тип входных данных.
+        ValueError: Число не записывается типом `typ`, например `1e3`
+            или `1.5` для `int`.
+
+    Returns:
+        Iterator: Итератор токенов.
+
+    Examples:
+        >>> list(tokenize("-3 x - 4 *"))
+        [-3, 'x', '-', 4, '*']
+        >>> list(tokenize(memoryview(b"1.5e3 -.5 +"), float, block_size=4))
+        [1500.0, -0.5, '+']
+        >>> list(tokenize("1e3"))
+        Traceback (most recent call last):
+        ...
+        ValueError: Токен `1e3` не является числом типа `int`
+    """
+    if isinstance(data, str):
+        blocks = (
+            data[start:start + block_size]
+            for start in range(0, len(data), block_size)
+        )
+    elif isinstance(data, (bytes, bytearray, memoryview)):
+        blocks = _decode_blocks(memoryview(data), block_size)
+    else:
+        raise TypeError("На ввод ожидается str/bytes/memoryview")
+    return chain.from_iterable(_tokenize(blocks, typ))
+
+
+def _decode_blocks(data: memoryview, block_size: int) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for start in range(0, len(data), block_size):
+        yield decoder.decode(data[start:start + block_size])
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def _tokenize(blocks: Iterator[str], typ) -> Iterator[list]:
+    """Возвращает списки токенов для каждого блока."""
+    carry: str = ""
+    for block in blocks:
+        if not block:
+            continue
+        words: list = (carry + block).split()
+        carry = ""
+        if words and not block[-1].isspace():
+            carry = words.pop()
+        yield _convert_words(words, typ)
+    if carry:
+        yield _convert_words([carry], typ)
+
+
+def _convert_words(words: list, typ) -> list:
+    """Приводит к `typ` числовые строки из `str.split`.
+
+    Однобуквенная строка - число, только если это цифра, поэтому
+    операции `+ - * /` не доходят до `_is_number`.
+
+    Examples:
+        >>> _convert_words(["-7", "12", "x1", "-", ".5"], float)
+        [-7.0, 12.0, 'x1', '-', 0.5]
+    """
+    return [
+        typ(word) if word.isdecimal()
+        else _to_number(word, typ) if len(word) > 1 and _is_number(word)
+        else word
+        for word in words
+    ]
+
+
+def _convert_tokens(tokens: Iterable, typ) -> list:
+    """Приводит к `typ` числовые токены, остальные возвращает как есть.
+
+    Examples:
+        >>> _convert_tokens(["-7", "x1", "-", 2.5], int)
+        [-7, 'x1', '-', 2.5]
+    """
+    return [
+        _to_number(token, typ)
+        if isinstance(token, str) and _is_number(token) else token
+        for token in tokens
+    ]
+
+
+def _is_number(token: str) -> bool:
+    """Проверяет, что токен записывает число.
+
+    Число начинается с цифры или точки, возможно после знака. Целые
+    без знака распознаются одним вызовом `isdecimal`.
+
+    Examples:
+        >>> _is_number("-7"), _is_number(".5"), _is_number("-")
+        (True, True, False)
+    """
+    if token.isdecimal():
+        return True
+    head = token[:1]
+    if head in "+-":
+        head = token[1:2]
+    return head.isdecimal() or head == "."
+
+
+def _to_number(token: str, typ):
+    """Приводит числовой токен к `typ`.
+
+    Raises:
+        ValueError: Токен не записывается типом `typ`.
+
+    Examples:
+        >>> _to_number("-2.5", float)
+        -2.5
+    """
+    try:
+        return typ(token)
+    except ValueError:
+        raise ValueError(
+            f"Токен `{token}` не является числом типа `{typ.__name__}`"
+        ) from None
 
 
 class Stack:
@@ -145,18 +309,357 @@ class Stack:
         return operands
 
 
+class ArrayStack:
+    """Стек чисел одного типа на основе `array.array`.
+
+    Хранит значения без упаковки в объекты Python, поэтому глубокий стек
+    занимает в несколько раз меньше памяти и не нагружает сборщик мусора.
+    Методы совпадают с `Stack`.
+
+    Attributes:
+        __array: Массив, хранящий данные.
+
+    Examples:
+        >>> stack = ArrayStack("q")
+        >>> stack.extend([1, 3, 5, 7])
+        >>> stack
+        ArrayStack: [..., 7]
+        >>> stack.get_operands()
+        [5, 7]
+        >>> stack.pop()
+        3
+        >>> len(stack)
+        1
+    """
+    __slots__ = ("__array",)
+
+    def __init__(self, typecode: str = "q") -> None:
+        self.__array: array = array(typecode)
+
+    def __repr__(self) -> str:
+        if not self.__array:
+            return f"{self.__class__.__name__}: [...]"
+        return f"{self.__class__.__name__}: [..., {self.__array[-1]}]"
+
+    def __len__(self) -> int:
+        return len(self.__array)
+
+    @property
+    def typecode(self) -> str:
+        """Код типа элементов `array.array`.
+
+        Examples:
+            >>> ArrayStack("d").typecode
+            'd'
+        """
+        return self.__array.typecode
+
+    def add(self, value) -> None:
+        """Добавляет число в стек.
+
+        Args:
+            value (int | float): Число, которое необходимо добавить.
+
+        Raises:
+            OverflowError: Целое число не помещается в элемент массива.
+            TypeError: Значение не приводится к типу элементов.
+
+        Examples:
+            >>> stack = ArrayStack("q")
+            >>> stack.add(7)
+            >>> stack
+            ArrayStack: [..., 7]
+        """
+        self.__array.append(value)
+
+    def extend(self, __iterable) -> None:
+        """Добавляет в стек числа переданной последовательности.
+
+        Args:
+            __iterable (_type_): Передаваемая последовательность.
+
+        Examples:
+            >>> stack = ArrayStack("d")
+            >>> stack.extend([1, 2.5])
+            >>> stack
+            ArrayStack: [..., 2.5]
+        """
+        self.__array.extend(__iterable)
+
+    def last(self) -> Any:
+        """Возвращает последний элемент в стеке.
+
+        Raises:
+            IndexError: Если стек пустой.
+
+        Returns:
+            Any (int | float): Последний элемент в стеке.
+
+        Examples:
+            >>> stack = ArrayStack("q")
+            >>> stack.extend([3, 5, 7])
+            >>> stack.last()
+            7
+        """
+        if not self.__array:
+            raise IndexError("Stack is empty")
+        return self.__array[-1]
+
+    def pop(self) -> Any:
+        """Удаляет и возвращает последний элемент стека.
+
+        Raises:
+            IndexError: Если стек пустой.
+
+        Returns:
+            Any (int | float): Последний элемент в стеке.
+
+        Examples:
+            >>> stack = ArrayStack("q")
+            >>> stack.extend([3, 5, 7])
+            >>> stack.pop()
+            7
+            >>> stack
+            ArrayStack: [..., 5]
+        """
+        if not self.__array:
+            raise IndexError("Stack is empty")
+        return self.__array.pop()
+
+    def clear(self) -> None:
+        """Очищает стек.
+
+        Examples:
+            >>> stack = ArrayStack("q")
+            >>> stack.extend([3, 5, 7])
+            >>> stack.clear()
+            >>> stack
+            ArrayStack: [...]
+        """
+        del self.__array[:]
+
+    def get_operands(self, amount: int = 2) -> list:
+        """Удаляет и возвращает требуемое количество элементов стека.
+
+        Args:
+            amount (int, optional): Количество требуемых значений.
+            Defaults to 2.
+
+        Raises:
+            ValueError:
+                Запрошено не натуральное число.
+            IndexError:
+                Запрошено количество больше, чем имеется элементов в списке.
+
+        Returns:
+            operands (list): Список из требуемых значений.
+
+        Examples:
+            >>> stack = ArrayStack("q")
+            >>> stack.extend([1, 3, 5, 7])
+            >>> stack.get_operands(3)
+            [3, 5, 7]
+        """
+        if amount < 1:
+            raise ValueError(
+                "Значение `amount` должно быть натуральным числом."
+            )
+        if amount > len(self.__array):
+            raise IndexError(
+                "Значение `amount` больше, чем элементов в стеке."
+            )
+        operands: list = self.__array[-amount:].tolist()
+        del self.__array[-amount:]
+        return operands
+
+
+class Operator(NamedTuple):
+    """Операция калькулятора.
+
+    Attributes:
+        function: Функция, принимающая `arity` операндов.
+        arity: Количество операндов.
+        variadic: Количество операндов можно указать в токене: `sum/3`.
+        vectorized: Функция поэлементно работает с массивами NumPy.
+        min_arity: Наименьшее количество операндов в токене `имя/N`.
+    """
+    function: Callable
+    arity: int = 2
+    variadic: bool = False
+    vectorized: bool = True
+    min_arity: int = 1
+
+
+class OperatorRegistry(Mapping):
+    """Реестр операций с количеством операндов.
+
+    Как отображение возвращает функцию операции по её символу. Для
+    вариативных операций токен `имя/N` задаёт количество операндов.
+
+    Attributes:
+        version: Номер изменения реестра, входит в ключ кэша компиляции.
+            Номера берутся из общего для всех реестров счётчика, поэтому
+            версии разных реестров не совпадают.
+        __versions: Счётчик версий всех реестров процесса.
+        __entries: Словарь символ -> `Operator`.
+        __resolved: Кэш разобранных токенов вида `имя/N`.
+
+    Examples:
+        >>> registry = OperatorRegistry()
+        >>> mod = registry.register("mod", operator.mod)
+        >>> registry["mod"](7, 3)
+        1
+        >>> @registry.register("avg", variadic=True)
+        ... def average(*operands):
+        ...     return sum(operands) // len(operands)
+        >>> registry.resolve("avg/3").arity
+        3
+        >>> registry.resolve("mod/3") is None
+        True
+        >>> registry.resolve("avg/0") is None
+        True
+    """
+    __versions = count()
+
+    def __init__(self, operators: Optional[Dict[str, Operator]] = None):
+        self.__entries: Dict[str, Operator] = dict(operators or {})
+        self.__resolved: Dict[str, Operator] = {}
+        self.version: int = next(OperatorRegistry.__versions)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}: {list(self.__entries)}"
+
+    def __getitem__(self, symbol: str) -> Callable:
+        return self.__entries[symbol].function
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__entries)
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    @property
+    def entries(self) -> Dict[str, Operator]:
+        """Словарь символ -> `Operator` для быстрого поиска в циклах."""
+        return self.__entries
+
+    def register(
+        self, symbol: str, function: Optional[Callable] = None,
+        arity: int = 2, variadic: bool = False, vectorized: bool = True,
+        min_arity: int = 1
+    ):
+        """Добавляет или заменяет операцию.
+
+        Может использоваться как декоратор, если `function` не передана.
+
+        Args:
+            symbol (str): Токен операции.
+            function (Callable, optional): Функция операции.
+            arity (int, optional): Количество операндов. Defaults to 2.
+            variadic (bool, optional): Разрешить токены `symbol/N`.
+            Defaults to False.
+            vectorized (bool, optional): Функция работает с массивами
+            NumPy. Defaults to True.
+            min_arity (int, optional): Наименьшее количество операндов
+            в токене `symbol/N`. Defaults to 1.
+
+        Raises:
+            ValueError: Некорректный символ или количество операндов.
+
+        Returns:
+            Callable: Зарегистрированная функция или декоратор.
+        """
+        if function is None:
+            return lambda function: self.register(
+                symbol, function, arity, variadic, vectorized, min_arity
+            )
+        if (
+            not isinstance(symbol, str) or not symbol
+            or symbol.split() != [symbol] or _is_number(symbol)
+        ):
+            raise ValueError(f"Некорректный символ операции: `{symbol}`")
+        if arity < 1 or min_arity < 1:
+            raise ValueError(
+                "Значения `arity` и `min_arity` должны быть натуральными "
+                "числами."
+            )
+        self.__entries[symbol] = Operator(
+            function, arity, variadic, vectorized, min_arity
+        )
+        self.__resolved.clear()
+        self.version = next(OperatorRegistry.__versions)
+        return function
+
+    def unregister(self, symbol: str) -> None:
+        """Удаляет операцию.
+
+        Raises:
+            KeyError: Операция не зарегистрирована.
+        """
+        del self.__entries[symbol]
+        self.__resolved.clear()
+        self.version = next(OperatorRegistry.__versions)
+
+    def resolve(self, symbol: str) -> Optional[Operator]:
+        """Возвращает операцию для токена или None.
+
+        Args:
+            symbol (str): Токен операции, в том числе вида `имя/N`.
+
+        Returns:
+            Optional[Operator]: Операция с итоговым количеством операндов.
+        """
+        entry = self.__entries.get(symbol)
+        if entry is not None:
+            return entry
+        entry = self.__resolved.get(symbol)
+        if entry is not None:
+            return entry
+        name, _, count = symbol.rpartition("/")
+        base = self.__entries.get(name)
+        if base is None or not base.variadic or not count.isdecimal():
+            return None
+        if int(count) < base.min_arity:
+            return None
+        entry = base._replace(arity=int(count))
+        self.__resolved[symbol] = entry
+        return entry
+
+
+def _sqrt(value):
+    """Целый квадратный корень для `int`, иначе обычный.
+
+    Examples:
+        >>> _sqrt(17), _sqrt(2.25)
+        (4, 1.5)
+    """
+    if isinstance(value, int):
+        return math.isqrt(value)
+    return math.sqrt(value)
+
+
+def _sum(*operands):
+    return sum(operands)
+
+
 class Calculator:
     """Сборник арифметических методов.
 
     Attributes:
-        ACTIONS: Словарь с доступными операциями.
+        ACTIONS: Реестр доступных операций `OperatorRegistry`. Основные
+            операции вызывают встроенные функции модуля `operator`.
     """
-    ACTIONS = {
-        "+": lambda x, y: x + y,
-        "-": lambda x, y: x - y,
-        "*": lambda x, y: x * y,
-        "/": lambda x, y: x // y,
-    }
+    ACTIONS = OperatorRegistry({
+        "+": Operator(operator.add),
+        "-": Operator(operator.sub),
+        "*": Operator(operator.mul),
+        "/": Operator(operator.floordiv),
+        "neg": Operator(operator.neg, 1),
+        "sqrt": Operator(_sqrt, 1, vectorized=False),
+        "sum": Operator(_sum, 2, variadic=True),
+        "max": Operator(max, 2, variadic=True, vectorized=False, min_arity=2),
+        "min": Operator(min, 2, variadic=True, vectorized=False, min_arity=2),
+    })
 
     @staticmethod
     def calculation(
@@ -184,72 +687,854 @@ class Calculator:
             17
             >>> Calculator.calculation("-", (13, 4))
             9
+            >>> Calculator.calculation("max/3", (13, 4, 20))
+            20
         """
-        if len(operands) != 2:
+        action = Calculator.ACTIONS.resolve(symbol)
+
+        if action is None:
+            raise AttributeError(f"Не поддерживаемая операция: `{symbol}`")
+
+        if len(operands) != action.arity:
             raise ValueError(
-                "`operands` должно быть последовательностью из двух элементов"
+                "`operands` должно быть последовательностью из "
+                f"{action.arity} элементов"
             )
 
         for operand in operands:
             if not isinstance(operand, (int, float)):
                 raise ValueError("Переданы не числовые значения")
 
-        action = Calculator.ACTIONS.get(symbol)
+        return action.function(*operands)
+
+    @classmethod
+    def _evaluate(
+        cls, tokens: Iterable, typ, numbers: Union[Stack, ArrayStack],
+        postfix: bool
+    ) -> None:
+        """Вычисляет нормализованные токены на переданном стеке.
+
+        Операнды снимаются со стека сразу в аргументы операции, без
+        промежуточных списков.
+
+        Args:
+            tokens (Iterable): Токены в порядке обработки стеком.
+            typ (_type_): Тип чисел для вычислений.
+            numbers (Stack | ArrayStack): Пустой стек для промежуточных
+            значений.
+            postfix (bool): Токены в обратной польской нотации (на
+            вершине стека последний операнд), иначе - перевёрнутая
+            прямая нотация.
+
+        Raises:
+            IndexError: Операции не хватает операндов.
+            AttributeError: Неподдерживаемое математическое действие.
+        """
+        push = numbers.add
+        pop = numbers.pop
+        entries = cls.ACTIONS.entries
+        resolve = cls.ACTIONS.resolve
+        for value in tokens:
+            action = entries.get(value)
+            if action is None:
+                if not isinstance(value, str):
+                    push(value)
+                    continue
+                if value.isdecimal():
+                    push(typ(value))
+                    continue
+                if _is_number(value):
+                    push(_to_number(value, typ))
+                    continue
+                action = resolve(value)
+                if action is None:
+                    raise AttributeError(
+                        f"Не поддерживаемая операция: `{value}`"
+                    )
+            function, arity, _, _, _ = action
+            if arity == 2:
+                if postfix:
+                    y = pop()
+                    push(function(pop(), y))
+                else:
+                    push(function(pop(), pop()))
+            elif arity == 1:
+                push(function(pop()))
+            else:
+                operands: list = numbers.get_operands(arity)
+                if not postfix:
+                    operands.reverse()
+                push(function(*operands))
+
+
+_PUSH = object()
+_LOAD = object()
+_UNARY = object()
+_CALL = object()
+
+# Операции, которые генератор кода записывает операторами Python:
+# функция -> (оператор, приоритет).
+_PYTHON_OPERATORS = {
+    operator.add: ("+", 1),
+    operator.sub: ("-", 1),
+    operator.mul: ("*", 2),
+    operator.floordiv: ("//", 2),
+}
+_NEG_PRECEDENCE = 3
+_ATOM_PRECEDENCE = 4
+# Наибольшая вложенность выражения до выноса во временную переменную:
+# компилятор Python ограничивает глубину выражений.
+CODEGEN_NESTING_LIMIT = 32
+# Наибольший модуль целого результата операции по модулям операндов.
+# При модулях не больше `_INT64_MAX` деление и `neg` не переполняются.
+_INT_BOUNDS = {
+    operator.add: lambda x, y: x + y,
+    operator.sub: lambda x, y: x + y,
+    operator.mul: lambda x, y: x * y,
+    operator.floordiv: lambda x, y: x,
+    operator.neg: lambda x: x,
+    _sum: lambda *bounds: sum(bounds),
+}
+_INT64_MAX = 2 ** 63 - 1
+
+
+class Program:
+    """Скомпилированное выражение в обратной польской нотации.
+
+    Разбор строки, преобразование чисел и поиск операций в
+    `Calculator.ACTIONS` выполняются один раз при создании объекта,
+    поэтому повторные вычисления не тратят время на токенизацию.
+    Токены могут быть строками или уже приведёнными числами.
+    Токены, являющиеся идентификаторами, считаются именованными
+    переменными и подставляются при вычислении.
+
+    Attributes:
+        tokens: Кортеж токенов в порядке обратной польской нотации.
+        variables: Кортеж имён переменных в порядке появления.
+        typ: Тип, к которому приведены числовые константы.
+        __code: Кортеж инструкций `(действие, аргумент)`.
+        __vectorized: Все операции работают с массивами NumPy.
+        __function: Функция Python из `to_function`.
+
+    Examples:
+        >>> program = Program(["x", "2", "*", "y", "+"])
+        >>> program
+        Program: x 2 * y +
+        >>> program.variables
+        ('x', 'y')
+        >>> program(x=7, y=3)
+        17
+        >>> program.evaluate(x=1, y=1)
+        3
+    """
+    __slots__ = (
+        "tokens", "variables", "typ", "__code", "__vectorized", "__function"
+    )
+
+    def __init__(
+        self, tokens: Sequence[str], typ=int,
+        actions: Optional[OperatorRegistry] = None
+    ) -> None:
+        if actions is None:
+            actions = Calculator.ACTIONS
+        code: list = []
+        variables: list = []
+        depth: int = 0
+        vectorized: bool = True
+        for token in tokens:
+            action = (
+                actions.resolve(token) if isinstance(token, str) else None
+            )
+            if action is not None:
+                function, arity, _, action_vectorized, _ = action
+                if depth < arity:
+                    raise IndexError(
+                        f"Недостаточно операндов для операции `{token}`"
+                    )
+                if arity == 2:
+                    code.append((function, token))
+                elif arity == 1:
+                    code.append((_UNARY, function))
+                else:
+                    code.append((_CALL, (function, arity)))
+                vectorized = vectorized and action_vectorized
+                depth -= arity - 1
+                continue
+            if not isinstance(token, str):
+                code.append((_PUSH, token))
+            elif _is_number(token):
+                code.append((_PUSH, _to_number(token, typ)))
+            elif token.isidentifier():
+                code.append((_LOAD, token))
+                if token not in variables:
+                    variables.append(token)
+            else:
+                raise AttributeError(f"Не поддерживаемая операция: `{token}`")
+            depth += 1
+        if not depth:
+            raise IndexError("Stack is empty")
+
+        self.tokens: Tuple[str, ...] = tuple(
+            token if isinstance(token, str) else str(token)
+            for token in tokens
+        )
+        self.variables: Tuple[str, ...] = tuple(variables)
+        self.typ = typ
+        self.__code: Tuple[tuple, ...] = tuple(code)
+        self.__vectorized: bool = vectorized
+        self.__function: Optional[Callable] = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}: {' '.join(self.tokens)}"
+
+    def evaluate(self, **variables) -> Union[int, float, complex]:
+        """Вычисляет выражение с переданными значениями переменных.
+
+        Args:
+            **variables: Значения именованных переменных выражения.
+
+        Raises:
+            NameError: Не передано значение одной из переменных.
+
+        Returns:
+            Union[int, float, complex]: Вычисленное значение.
+
+        Examples:
+            >>> program = Program("3 4 * x +".split())
+            >>> program.evaluate(x=5)
+            17
+            >>> program.evaluate()
+            Traceback (most recent call last):
+            ...
+            NameError: Не задано значение переменной: `x`
+        """
+        stack: list = []
+        push = stack.append
+        pop = stack.pop
+        try:
+            for action, arg in self.__code:
+                if action is _PUSH:
+                    push(arg)
+                elif action is _LOAD:
+                    push(variables[arg])
+                elif action is _UNARY:
+                    push(arg(pop()))
+                elif action is _CALL:
+                    function, arity = arg
+                    operands = stack[-arity:]
+                    del stack[-arity:]
+                    push(function(*operands))
+                else:
+                    y = pop()
+                    push(action(pop(), y))
+        except KeyError as error:
+            raise NameError(
+                f"Не задано значение переменной: `{error.args[0]}`"
+            ) from None
+        return stack[-1]
+
+    __call__ = evaluate
+
+    def to_function(self) -> Callable:
+        """Переводит выражение в обычную функцию Python.
+
+        Функция генерируется и компилируется один раз: её параметры -
+        переменные выражения в порядке появления, а тело - одно
+        выражение Python без стека и интерпретации токенов. `+`, `-`,
+        `*`, `/` (как `//`) и `neg` из стандартного `Calculator.ACTIONS`
+        записываются операторами Python, остальные операции вызываются
+        теми же функциями, что и в `evaluate`. Глубоко вложенные
+        подвыражения выносятся во временные переменные. Исходный код
+        доступен в `source_code`.
+
+        Raises:
+            ValueError: Имя переменной - ключевое слово Python.
+
+        Returns:
+            Callable: Функция, принимающая значения переменных
+            позиционно или по именам.
+
+        Examples:
+            >>> function = Program("x 2 * y +".split()).to_function()
+            >>> function(7, 3), function(x=1, y=1)
+            (17, 3)
+            >>> print(function.source_code, end="")
+            def expression(x, y):
+                return x * 2 + y
+            >>> program = Program("a b c - - neg 7 /".split())
+            >>> program.to_function()(1, 2, 3), program(a=1, b=2, c=3)
+            (-1, -1)
+            >>> print(program.to_function().source_code, end="")
+            def expression(a, b, c):
+                return -(a - (b - c)) // 7
+        """
+        if self.__function is None:
+            for name in self.variables:
+                if keyword.iskeyword(name):
+                    raise ValueError(
+                        f"Имя переменной - ключевое слово Python: `{name}`"
+                    )
+            source, namespace = _generate_source(self.__code, self.variables)
+            exec(compile(source, f"<{self!r}>", "exec"), namespace)
+            function = namespace["expression"]
+            function.source_code = source
+            self.__function = function
+        return self.__function
+
+    def evaluate_batch(self, **columns) -> Union[list, Any]:
+        """Вычисляет выражение сразу для колонок значений переменных.
+
+        При наличии NumPy каждая операция выполняется один раз над всей
+        колонкой, иначе (или если одна из операций не поддерживает
+        массивы) выражение вычисляется построчно. Деление остаётся
+        целочисленным (`//`), а деление на ноль в любой строке вызывает
+        `ZeroDivisionError`, как и при скалярном вычислении. Для целых
+        колонок перед каждой операцией оценивается наибольший модуль
+        результата: если он может выйти за пределы `int64` (или операция
+        не из стандартных `+ - * / neg sum`), выражение вычисляется
+        построчно с целыми числами произвольной длины, как в `evaluate`.
+
+        Args:
+            **columns: Последовательности значений переменных
+            одинаковой длины.
+
+        Raises:
+            NameError: Не передана колонка одной из переменных.
+            ValueError: Колонки имеют разную длину.
+            ZeroDivisionError: Деление на ноль в одной из строк.
+
+        Returns:
+            numpy.ndarray | list: Результаты для каждой строки.
+
+        Examples:
+            >>> program = Program("x 2 * y /".split())
+            >>> [int(value) for value in program.evaluate_batch(
+            ...     x=[1, 2, -3], y=[1, 3, 4]
+            ... )]
+            [2, 1, -2]
+        """
+        missing = [name for name in self.variables if name not in columns]
+        if missing:
+            raise NameError(f"Не задано значение переменной: `{missing[0]}`")
+        if len({len(columns[name]) for name in self.variables}) > 1:
+            raise ValueError("Колонки должны быть одинаковой длины")
+        if not self.variables:
+            return self.evaluate()
+
+        if np is not None and self.__vectorized:
+            result = self.__evaluate_arrays(columns)
+            if result is not None:
+                return result
+        names = self.variables
+        return [
+            self.evaluate(**dict(zip(names, row)))
+            for row in zip(*(columns[name] for name in names))
+        ]
+
+    def __evaluate_arrays(self, columns: dict) -> Optional[Any]:
+        """Вычисляет выражение над массивами NumPy.
 
+        Returns:
+            numpy.ndarray | None: Результат или None, если целое
+            значение может не поместиться в `int64`.
+        """
+        stack: list = []
+        # Наибольший модуль целых элементов стека, None - не целые.
+        bounds: list = []
+        push = stack.append
+        for action, arg in self.__code:
+            if action is _PUSH or action is _LOAD:
+                value = arg if action is _PUSH else np.asarray(columns[arg])
+                array = np.asarray(value)
+                kind = array.dtype.kind
+                if kind == "O":
+                    return None
+                if kind in "iub":
+                    bound = (
+                        max(abs(int(array.min())), abs(int(array.max())))
+                        if array.size else 0
+                    )
+                    if bound > _INT64_MAX:
+                        return None
+                    # `int8`, `uint` и `bool` переполняются раньше `int64`.
+                    value = array.astype(np.int64)
+                else:
+                    bound = None
+                push(value)
+                bounds.append(bound)
+                continue
+            if action is _UNARY:
+                function, arity = arg, 1
+            elif action is _CALL:
+                function, arity = arg
+            else:
+                function, arity = action, 2
+            operands = stack[-arity:]
+            del stack[-arity:]
+            operand_bounds = bounds[-arity:]
+            del bounds[-arity:]
+            bound = None
+            if None not in operand_bounds:
+                estimate = _INT_BOUNDS.get(function)
+                if estimate is None:
+                    return None
+                bound = estimate(*operand_bounds)
+                if bound > _INT64_MAX:
+                    return None
+            if arg == "/" and not np.all(operands[1]):
+                raise ZeroDivisionError("Деление на ноль")
+            push(function(*operands))
+            bounds.append(bound)
+        return stack[-1]
+
+
+def _generate_source(code: tuple, variables: tuple) -> Tuple[str, dict]:
+    """Генерирует исходный код функции `expression` по инструкциям.
+
+    Args:
+        code (tuple): Инструкции `Program`.
+        variables (tuple): Имена параметров функции.
+
+    Returns:
+        Tuple[str, dict]: Исходный код и глобальные имена функции
+        (операции и константы, не записываемые литералами).
+    """
+    # Служебные имена не совпадают с переменными выражения.
+    prefix = "_"
+    while any(name.startswith(prefix) for name in variables):
+        prefix += "_"
+    namespace: dict = {}
+    lines: list = []
+    # Элементы стека: (исходный код, приоритет, вложенность).
+    stack: list = []
+    push = stack.append
+
+    def bind(value, kind: str) -> str:
+        name = f"{prefix}{kind}{len(namespace)}"
+        namespace[name] = value
+        return name
+
+    def store(entry: tuple) -> tuple:
+        if not entry[2]:
+            return entry
+        name = f"{prefix}t{len(lines)}"
+        lines.append(f"    {name} = {entry[0]}\n")
+        return name, _ATOM_PRECEDENCE, 0
+
+    # Элементы стека ниже `stored` уже вынесены во временные переменные.
+    stored = 0
+
+    def take(arity: int) -> list:
+        """Снимает операнды и выносит вложенные выражения при пределе.
+
+        Вместе с операндами выносятся все выражения ниже на стеке, чтобы
+        подвыражения вычислялись в том же порядке, что и в `evaluate`.
+        Каждый элемент стека выносится не больше одного раза.
+        """
+        nonlocal stored
+        entries = stack[-arity:]
+        del stack[-arity:]
+        stored = min(stored, len(stack))
+        if any(entry[2] >= CODEGEN_NESTING_LIMIT for entry in entries):
+            stack[stored:] = [store(entry) for entry in stack[stored:]]
+            stored = len(stack)
+            entries = [store(entry) for entry in entries]
+        return entries
+
+    def operand(entry: tuple, precedence: int) -> str:
+        if entry[1] < precedence:
+            return f"({entry[0]})"
+        return entry[0]
+
+    def call(function: Callable, entries: list) -> None:
+        arguments = ", ".join(operand(entry, 0) for entry in entries)
+        depth = max(entry[2] for entry in entries) + 1
+        push((f"{bind(function, 'f')}({arguments})", _ATOM_PRECEDENCE, depth))
+
+    for action, arg in code:
+        if action is _PUSH:
+            if (
+                type(arg) is int and arg.bit_length() <= 64
+                or type(arg) is float and math.isfinite(arg)
+            ):
+                source = repr(arg)
+                precedence = (
+                    _NEG_PRECEDENCE if source[0] == "-" else _ATOM_PRECEDENCE
+                )
+                push((source, precedence, 0))
+            else:
+                push((bind(arg, "c"), _ATOM_PRECEDENCE, 0))
+        elif action is _LOAD:
+            push((arg, _ATOM_PRECEDENCE, 0))
+        elif action is _UNARY:
+            entry, = take(1)
+            if arg is operator.neg:
+                push((
+                    f"-{operand(entry, _NEG_PRECEDENCE)}", _NEG_PRECEDENCE,
+                    entry[2] + 1
+                ))
+            else:
+                call(arg, [entry])
+        elif action is _CALL:
+            function, arity = arg
+            call(function, take(arity))
+        else:
+            left, right = take(2)
+            python_operator = _PYTHON_OPERATORS.get(action)
+            if python_operator is None:
+                call(action, [left, right])
+                continue
+            symbol, precedence = python_operator
+            push((
+                f"{operand(left, precedence)} {symbol} "
+                f"{operand(right, precedence + 1)}",
+                precedence, max(left[2], right[2]) + 1
+            ))
+    body = "".join(lines)
+    return (
+        f"def expression({', '.join(variables)}):\n{body}"
+        f"    return {stack[-1][0]}\n"
+    ), namespace
+
+
+def _is_literal(value, typ) -> bool:
+    """Проверяет, что значение без потерь записывается числовым токеном.
+
+    Целые длиннее предела `sys.set_int_max_str_digits` не записываются
+    строкой, такие значения не сворачиваются.
+    """
+    try:
+        text = str(value)
+        return _is_number(text) and typ(text) == value
+    except (ValueError, TypeError):
+        return False
+
+
+def _build_tree(
+    tokens: Sequence, actions: OperatorRegistry, postfix: bool, typ=None
+) -> list:
+    """Строит деревья выражения из токенов, читаемых с конца стека.
+
+    Узел дерева - кортеж `(операция, *операнды)`, лист - токен.
+    Если передан `typ`, поддеревья из одних чисел сворачиваются по
+    правилам `actions`. Поддерево не сворачивается, если вычисление
+    вызывает ошибку или результат нельзя без потерь записать токеном.
+
+    Args:
+        tokens (Sequence): Токены в порядке обработки стеком, числа
+            уже приведены к своему типу.
+        actions (OperatorRegistry): Доступные операции.
+        postfix (bool): Токены в обратной польской нотации (на вершине
+            стека последний операнд), иначе - перевёрнутая прямая нотация.
+        typ (_type_, optional): Тип числовых констант для свёртки.
+        Defaults to None.
+
+    Raises:
+        IndexError: Операции не хватает операндов.
+
+    Returns:
+        list: Корни деревьев в порядке стека.
+    """
+    nodes: list = []
+    for token in tokens:
+        action = actions.resolve(token) if isinstance(token, str) else None
         if action is None:
-            raise AttributeError(f"Не поддерживаемая операция: `{symbol}`")
+            nodes.append(token)
+            continue
+        arity = action.arity
+        if len(nodes) < arity:
+            raise IndexError(
+                f"Недостаточно операндов для операции `{token}`"
+            )
+        operands: list = nodes[-arity:]
+        del nodes[-arity:]
+        if not postfix:
+            operands.reverse()
+        if typ is not None and not any(
+            isinstance(operand, (str, tuple)) for operand in operands
+        ):
+            try:
+                value = action.function(*operands)
+            except (ArithmeticError, ValueError):
+                pass
+            else:
+                if _is_literal(value, typ):
+                    nodes.append(value)
+                    continue
+        nodes.append((token, *operands))
+    return nodes
+
+
+def _emit_postfix(roots: list) -> list:
+    """Записывает деревья в обратной польской нотации.
+
+    Examples:
+        >>> _emit_postfix([("-", ("*", 5, "x"), ("neg", 3))])
+        [5, 'x', '*', 3, 'neg', '-']
+    """
+    tokens: list = []
+    for root in roots:
+        pending: list = [root]
+        while pending:
+            node = pending.pop()
+            if isinstance(node, tuple):
+                pending.append(node[0])
+                pending.extend(reversed(node[1:]))
+            else:
+                tokens.append(node)
+    return tokens
+
+
+def _emit_prefix(roots: list) -> list:
+    """Записывает деревья в прямой польской нотации.
 
-        return action(*operands)
+    Examples:
+        >>> _emit_prefix([("-", ("*", 5, "x"), ("neg", 3))])
+        ['-', '*', 5, 'x', 'neg', 3]
+    """
+    tokens: list = []
+    for root in reversed(roots):
+        pending: list = [root]
+        while pending:
+            node = pending.pop()
+            if isinstance(node, tuple):
+                tokens.append(node[0])
+                pending.extend(reversed(node[1:]))
+            else:
+                tokens.append(node)
+    return tokens
 
 
 class PolishCalculator(Calculator):
     """Калькулятор, считающий по правилам польской нотации.
 
     Attributes:
-        __numbers: Стек, хранящий вводимые числа и результаты.
+        STACK_TYPECODES: Коды `array.array` для типов чисел, которые
+            хранятся в `ArrayStack`. Остальные типы используют `Stack`.
+        _POSTFIX: Токены обрабатываются в обратной польской нотации.
+        __stacks: Стеки для промежуточных значений по типам чисел.
+            Очищаются после каждого вычисления.
+        __seen: Строки `get_result`, уже вычисленные один раз (не
+            больше `COMPILE_CACHE_SIZE`).
 
     Examples:
         >>> calculator = PolishCalculator()
         >>> calculator.get_result("- * 5 8 3")
         37
     """
+    STACK_TYPECODES = {int: "q", float: "d"}
+    _POSTFIX = False
+
     def __init__(self) -> None:
-        self.__numbers: Stack = Stack()
+        self.__stacks: dict = {}
+        self.__seen: dict = {}
 
-    def _get_operands(self, amount: int = 2) -> list:
-        """Получает неообходимые числа для вычислений.
+    def _get_stack(self, typ) -> Union[Stack, ArrayStack]:
+        """Возвращает стек, подходящий для чисел типа `typ`.
 
         Args:
-            amount (int, optional): Количество необходимых значений.
-            Defaults to 2.
+            typ (_type_): Тип чисел для вычислений.
 
         Returns:
-            list: Список с числами для вычислений.
+            Union[Stack, ArrayStack]: Стек для промежуточных значений.
+
+        Examples:
+            >>> calculator = PolishCalculator()
+            >>> calculator._get_stack(float)
+            ArrayStack: [...]
+            >>> calculator._get_stack(complex)
+            Stack: [...]
         """
-        return list(reversed(self.__numbers.get_operands(amount)))
+        numbers = self.__stacks.get(typ)
+        if numbers is None:
+            typecode = self.STACK_TYPECODES.get(typ)
+            numbers = Stack() if typecode is None else ArrayStack(typecode)
+            self.__stacks[typ] = numbers
+        return numbers
+
+    def _run(
+        self, tokens: Iterable, typ, numbers: Union[Stack, ArrayStack]
+    ) -> Union[int, float, complex]:
+        try:
+            self._evaluate(tokens, typ, numbers, self._POSTFIX)
+            return numbers.last()
+        finally:
+            numbers.clear()
 
     @staticmethod
-    def _normal_input_data(data: Sequence) -> list:
+    def _normal_input_data(data: Sequence, typ=int) -> list:
         """Нормализует введённую последовательность под правила калькулятора.
 
+        Числовые токены строки приводятся к `typ`, элементы списка и
+        кортежа остаются как есть.
+
         Args:
             data (Sequnce): Последовательность с входными данными.
+            typ (_type_, optional): Тип чисел. Defaults to int.
 
         Returns:
             list: Нормализованный список.
         """
         if isinstance(data, (list, tuple)):
             return list(reversed(data))
-        if isinstance(data, str):
-            return list(reversed(data.split()))
-        raise TypeError("На ввод ожидается str/list/tuple")
+        tokens: list = list(tokenize(data, typ))
+        tokens.reverse()
+        return tokens
+
+    @classmethod
+    def _to_tree(cls, tokens: list, typ=None) -> list:
+        """Строит деревья выражения из нормализованных токенов.
+
+        Args:
+            tokens (list): Результат `_normal_input_data`.
+            typ (_type_, optional): Тип констант для свёртки.
+            Defaults to None.
+
+        Returns:
+            list: Корни деревьев в порядке стека.
+        """
+        return _build_tree(tokens, cls.ACTIONS, cls._POSTFIX, typ)
+
+    @staticmethod
+    def _emit(roots: list) -> list:
+        return _emit_prefix(roots)
+
+    @classmethod
+    def _to_postfix(cls, tokens: list) -> list:
+        """Переставляет нормализованные токены в порядок обратной нотации.
+
+        Args:
+            tokens (list): Результат `_normal_input_data`.
+
+        Raises:
+            IndexError: Операции не хватает операндов.
+
+        Returns:
+            list: Токены в порядке обратной польской нотации.
+        """
+        return _emit_postfix(cls._to_tree(tokens))
+
+    @classmethod
+    def _compile(cls, data: Sequence, typ, optimize: bool = True) -> Program:
+        tokens: list = _convert_tokens(cls._normal_input_data(data, typ), typ)
+        if optimize:
+            tokens = _emit_postfix(cls._to_tree(tokens, typ))
+        else:
+            tokens = cls._to_postfix(tokens)
+        return Program(tokens, typ, cls.ACTIONS)
+
+    @classmethod
+    @lru_cache(maxsize=COMPILE_CACHE_SIZE)
+    def _compile_cached(
+        cls, data: str, typ, optimize: bool, version: int
+    ) -> Program:
+        return cls._compile(data, typ, optimize)
+
+    def optimize(self, data: Sequence, typ=int) -> list:
+        """Сворачивает константные подвыражения.
+
+        Подвыражения из одних чисел вычисляются заранее по правилам
+        `Calculator.ACTIONS` (включая целочисленное `/`). Результат
+        записывается в нотации калькулятора.
+
+        Args:
+            data (Sequence): Строка/список/кортеж с выражением.
+            typ (_type_, optional): Тип числовых констант.
+            Defaults to int.
+
+        Returns:
+            list: Токены упрощённого выражения.
+
+        Examples:
+            >>> PolishCalculator().optimize("+ * 3 4 x")
+            ['+', '12', 'x']
+            >>> PolishCalculator().optimize("- x / 7 2")
+            ['-', 'x', '3']
+        """
+        tokens: list = _convert_tokens(
+            self._normal_input_data(data, typ), typ
+        )
+        return [
+            token if isinstance(token, str) else str(token)
+            for token in self._emit(self._to_tree(tokens, typ))
+        ]
+
+    def compile(
+        self, data: Sequence, typ=int, optimize: bool = True
+    ) -> Program:
+        """Разбирает выражение один раз для многократных вычислений.
+
+        Строковые выражения не длиннее `COMPILE_TEXT_LIMIT` кэшируются
+        по тексту (LRU на `COMPILE_CACHE_SIZE` записей), поэтому
+        повторная компиляция той же строки возвращает уже готовую
+        программу. Изменение реестра
+        `ACTIONS` делает кэш неактуальным. По умолчанию константные
+        подвыражения сворачиваются (см. `optimize`).
+
+        Args:
+            data (Sequence): Строка/список/кортеж с выражением.
+            typ (_type_, optional): Тип числовых констант.
+            Defaults to int.
+            optimize (bool, optional): Сворачивать константы.
+            Defaults to True.
+
+        Returns:
+            Program: Скомпилированное выражение.
+
+        Examples:
+            >>> calculator = PolishCalculator()
+            >>> program = calculator.compile("+ * a 8 3")
+            >>> program
+            Program: a 8 * 3 +
+            >>> program(a=5)
+            43
+            >>> calculator.compile("+ * a 8 3") is program
+            True
+            >>> calculator.compile("+ * 2 8 a")
+            Program: 16 a +
+        """
+        if isinstance(data, str) and len(data) <= COMPILE_TEXT_LIMIT:
+            return self._compile_cached(
+                data, typ, optimize, self.ACTIONS.version
+            )
+        return self._compile(data, typ, optimize)
+
+    def get_batch_result(self, data: Sequence, typ=int, **columns):
+        """Вычисляет выражение для колонок значений переменных.
+
+        Args:
+            data (Sequence): Строка/список/кортеж с выражением.
+            typ (_type_, optional): Тип числовых констант.
+            Defaults to int.
+            **columns: Последовательности или массивы NumPy значений
+            переменных.
+
+        Returns:
+            numpy.ndarray | list: Результаты для каждой строки.
+
+        Examples:
+            >>> calculator = PolishCalculator()
+            >>> [int(value) for value in calculator.get_batch_result(
+            ...     "- * a 8 b", a=[1, 2], b=[3, 4]
+            ... )]
+            [5, 12]
+        """
+        return self.compile(data, typ).evaluate_batch(**columns)
 
     def get_result(self, data: str, typ=int) -> Union[int, float, complex]:
         """Производит вычисления согласно введённой строки.
 
-        Ожидает данные в форми строки/списка/кортежа, и проводит вычисления
-        согласно переданным данным с требуемым типом чисел.
-        По умолчанию использует тип `int`.
+        Ожидает данные в форми строки/списка/кортежа (или байтов и
+        `memoryview`), и проводит вычисления согласно переданным данным с
+        требуемым типом чисел. По умолчанию использует тип `int`.
+
+        Строка вычисляется сразу на стеке. Повторно переданная строка не
+        длиннее `COMPILE_TEXT_LIMIT` компилируется (см. `compile`), и
+        следующие вычисления берут программу из кэша. Если промежуточное
+        значение не помещается в `ArrayStack` (целое больше `int64` или
+        значение другого типа, например `float` от зарегистрированной
+        операции), вычисление повторяется на `Stack`, который
+        используется и для следующих вычислений.
 
         Args:
             data (str): Строка с числами и операторами.
@@ -258,16 +1543,40 @@ class PolishCalculator(Calculator):
 
         Returns:
             Union[int, float, complex]: Вычисленное значение.
-        """
-        for value in self._normal_input_data(data):
-            if value[-1].isdecimal():
-                self.__numbers.add(typ(value))
-                continue
-            operands: list = self._get_operands(2)
-            result: int = self.calculation(value, operands)
-            self.__numbers.add(result)
 
-        return self.__numbers.last()
+        Examples:
+            >>> calculator = ReversePolishCalculator()
+            >>> calculator.get_result(b"-1.5 2 * 1e1 +", float)
+            7.0
+        """
+        if isinstance(data, str) and len(data) <= COMPILE_TEXT_LIMIT:
+            seen = self.__seen
+            version = self.ACTIONS.version
+            key = (data, typ, version)
+            if key in seen:
+                return self._compile_cached(
+                    data, typ, True, version
+                ).evaluate()
+            result = self.__get_stack_result(data, typ)
+            # Запоминаются только вычисленные без ошибок строки, поэтому
+            # ошибки всегда сообщает вычисление на стеке.
+            if len(seen) >= COMPILE_CACHE_SIZE:
+                del seen[next(iter(seen))]
+            seen[key] = None
+            return result
+        return self.__get_stack_result(data, typ)
+
+    def __get_stack_result(
+        self, data: Sequence, typ
+    ) -> Union[int, float, complex]:
+        numbers = self._get_stack(typ)
+        try:
+            return self._run(self._normal_input_data(data, typ), typ, numbers)
+        except (OverflowError, TypeError):
+            if isinstance(numbers, Stack):
+                raise
+        self.__stacks[typ] = numbers = Stack()
+        return self._run(self._normal_input_data(data, typ), typ, numbers)
 
 
 class ReversePolishCalculator(PolishCalculator):
@@ -278,24 +1587,105 @@ class ReversePolishCalculator(PolishCalculator):
         >>> calculator.get_result("7 2 + 4 * 2 +")
         38
     """
+    _POSTFIX = True
 
     @staticmethod
-    def _normal_input_data(data: Sequence) -> list:
+    def _normal_input_data(data: Sequence, typ=int) -> Iterable:
         if isinstance(data, (list, tuple)):
-            return list(data)
-        if isinstance(data, str):
-            return data.split()
-        raise TypeError("На ввод ожидается str/list/tuple")
+            return data
+        return tokenize(data, typ)
+
+    @staticmethod
+    def _emit(roots: list) -> list:
+        return _emit_postfix(roots)
+
+    @classmethod
+    def _to_postfix(cls, tokens: list) -> list:
+        return tokens
+
 
-    def _get_operands(self, amount: int = 2) -> list:
-        return list(reversed(super()._get_operands(amount)))
+def evaluate_stream(
+    lines: Iterable[str], output: TextIO,
+    errors: Optional[TextIO] = None, typ=int
+) -> int:
+    """Построчно вычисляет поток выражений в обратной польской нотации.
 
+    Каждая непустая строка считается отдельным выражением. Строки
+    читаются по одной, поэтому расход памяти не зависит от размера
+    входных данных. Для строки с ошибкой в `output` пишется `error`,
+    а описание ошибки с номером строки - в `errors`.
 
-def main():
+    Args:
+        lines (Iterable[str]): Источник строк (файл, stdin, список).
+        output (TextIO): Поток для результатов.
+        errors (TextIO, optional): Поток для описания ошибок.
+        Defaults to None.
+        typ (_type_, optional): Тип чисел для вычислений.
+        Defaults to int.
+
+    Returns:
+        int: Количество строк с ошибками.
+
+    Examples:
+        >>> evaluate_stream(["7 2 +", "", "1 0 /", "4 13 5 / +"], sys.stdout)
+        9
+        error
+        6
+        1
+    """
     calculator = ReversePolishCalculator()
-    data = input().split()
-    result = calculator.get_result(data)
-    print(int(result))
+    write = output.write
+    failed: int = 0
+    for number, line in enumerate(lines, 1):
+        if not line or line.isspace():
+            continue
+        try:
+            result = calculator.get_result(line, typ)
+        except Exception as error:
+            failed += 1
+            write("error\n")
+            if errors is not None:
+                errors.write(f"{number}: {error!r}\n")
+            continue
+        write(f"{result}\n")
+    return failed
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Калькулятор обратной польской нотации."
+    )
+    parser.add_argument(
+        "file", nargs="?",
+        help="Файл с выражениями, по одному на строку (`-` - stdin)."
+    )
+    parser.add_argument(
+        "-s", "--stream", action="store_true",
+        help="Построчно вычислять все выражения из stdin."
+    )
+    args = parser.parse_args(argv)
+
+    if args.file is None and not args.stream:
+        calculator = ReversePolishCalculator()
+        data = input().split()
+        result = calculator.get_result(data)
+        print(int(result))
+        return
+
+    # `sys.stdout` буферизуется блоками, если вывод не терминал.
+    output = sys.stdout
+    source = (
+        sys.stdin if args.file in (None, "-")
+        else open(args.file, encoding="utf-8")
+    )
+    try:
+        failed = evaluate_stream(source, output, sys.stderr)
+    finally:
+        output.flush()
+        if source is not sys.stdin:
+            source.close()
+    if failed:
+        sys.exit(1)
 
 
 if __name__ == '__main__':
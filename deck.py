@@ -1,4 +1,26 @@
+import operator
+import sys
+from array import array
 from functools import total_ordering
+from itertools import islice
+
+COMMANDS = (
+    "push_back", "push_front", "pop_back", "pop_front",
+    "get_back", "get_front", "size", "clear",
+)
+READ_BLOCK_SIZE = 1 << 16
+
+
+class DeckError(Exception):
+    """Базовая ошибка `Deck` в режиме `strict`."""
+
+
+class DeckFull(DeckError):
+    """Последовательность заполнена."""
+
+
+class DeckEmpty(DeckError):
+    """В последовательности недостаточно элементов."""
 
 
 @total_ordering
@@ -8,25 +30,59 @@ class Deck:
     Упорядоченная последовательность заданного размера с возможностью
     добавления и удаления элементов в начале и в конце последовательности.
 
+    В режиме `growable` заполненная последовательность удваивает
+    выделенный массив вместо возврата `error`, а при заполненности не
+    больше `SHRINK_THRESHOLD` уменьшает его вдвое, но не меньше
+    исходного размера. Добавление и удаление остаются амортизированно O(1).
+
+    В режиме `strict` вместо возврата `error` поднимаются `DeckFull` и
+    `DeckEmpty`, поэтому строку `error` можно хранить как обычный
+    элемент.
+
     Attributes:
+        SHRINK_THRESHOLD (float): Доля заполненности для уменьшения массива.
         __array (list): Python-list заданного размера.
         __head (int): Указатель на начало последовательности.
         __tail (int): Указатель на первое пустое место в последовательности.
         __size (int): Размер выделенного массива.
         __empty (int): Количество пустых мест в последовательности.
+        __growable (bool): Изменять размер массива по заполненности.
+        __min_size (int): Исходный размер массива.
+        __version (int): Счётчик изменений для обнаружения изменения
+        последовательности во время итерации.
+        __strict (bool): Поднимать исключения вместо возврата `error`.
 
     Examples:
         >>> deck = Deck(5)
         >>> deck
         Deck: size=5, fullness=0
+        >>> deck = Deck(2, growable=True)
+        >>> for value in range(5):
+        ...     deck.push_front(value)
+        >>> deck
+        Deck: size=8, fullness=5
+        >>> [deck.pop_back() for _ in range(4)]
+        [0, 1, 2, 3]
+        >>> deck
+        Deck: size=2, fullness=1
+        >>> Deck(1, strict=True).pop_back()
+        Traceback (most recent call last):
+        ...
+        deck.DeckEmpty: Недостаточно элементов в последовательности.
     """
-    def __init__(self, __size):
+    SHRINK_THRESHOLD = 0.25
+
+    def __init__(self, __size, growable=False, strict=False):
         self.__array = [None] * __size
         self.__empty = __size
         self.__head = 0
         self.__tail = 0
         self.__size = __size
         self.__empty = __size
+        self.__growable = growable
+        self.__min_size = __size
+        self.__version = 0
+        self.__strict = strict
 
     def __str__(self):
         """
@@ -71,12 +127,114 @@ class Deck:
         >>> deck_1.push_back(9)
         >>> deck_1 == deck_2
         False
+        >>> deck_2.push_back(8)
+        >>> deck_1 == deck_2
+        False
         """
         if not isinstance(__o, Deck):
             return False
-        if self.__size != __o.__size:
+        if self.__size != __o.__size or len(self) != len(__o):
             return False
-        return len(self) == len(__o)
+        for left, right in zip(self, __o):
+            if left is not right and left != right:
+                return False
+        return True
+
+    def __iter__(self):
+        """Обходит элементы от начала к концу без копирования.
+
+        Raises:
+            RuntimeError: Последовательность изменилась во время обхода.
+
+        Examples:
+        >>> deck = Deck(3)
+        >>> deck.extend_back([1, 2, 3])
+        >>> deck.pop_front()
+        1
+        >>> deck.push_back(4)
+        >>> list(deck), list(reversed(deck))
+        ([2, 3, 4], [4, 3, 2])
+        """
+        return self.__walk(self.__head, 1)
+
+    def __reversed__(self):
+        return self.__walk(self.__tail - 1, -1)
+
+    def __walk(self, index, step):
+        version = self.__version
+        array = self.__array
+        size = self.__size
+        remaining = size - self.__empty
+        while True:
+            if self.__version != version:
+                raise RuntimeError("Deck mutated during iteration")
+            if not remaining:
+                return
+            yield array[index % size]
+            index += step
+            remaining -= 1
+
+    def __getitem__(self, index):
+        """Возвращает элемент по номеру от начала последовательности.
+
+        Отрицательные номера отсчитываются от конца, как у `list`.
+
+        Raises:
+            IndexError: Номер вне последовательности.
+
+        Examples:
+        >>> deck = Deck(3)
+        >>> deck.extend_front([1, 2, 3])
+        >>> deck[0], deck[-1]
+        (3, 1)
+        """
+        index = operator.index(index)
+        length = self.__size - self.__empty
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("Deck index out of range")
+        return self.__array[(self.__head + index) % self.__size]
+
+    def __contains__(self, value):
+        """
+        Examples:
+        >>> deck = Deck(3)
+        >>> deck.extend_back([1, 2])
+        >>> 2 in deck, None in deck
+        (True, False)
+        """
+        length = self.__size - self.__empty
+        first = min(length, self.__size - self.__head)
+        for start, stop in (
+            (self.__head, self.__head + first), (0, length - first)
+        ):
+            if start < stop:
+                try:
+                    self.__array.index(value, start, stop)
+                except ValueError:
+                    continue
+                return True
+        return False
+
+    def to_list(self):
+        """Возвращает элементы от начала к концу.
+
+        Элементы копируются не больше чем двумя срезами.
+
+        Examples:
+        >>> deck = Deck(3)
+        >>> deck.extend_back([1, 2, 3])
+        >>> deck.pop_front()
+        1
+        >>> deck.push_back(4)
+        >>> deck.to_list()
+        [2, 3, 4]
+        """
+        length = self.__size - self.__empty
+        if self.__head + length <= self.__size:
+            return self.__array[self.__head:self.__head + length]
+        return self.__array[self.__head:] + self.__array[:self.__tail]
 
     def __lt__(self, __o):
         """
@@ -113,9 +271,62 @@ class Deck:
         """
         return self.__size
 
+    def __resize(self, size):
+        """Переносит элементы в новый массив размера `size`.
+
+        Элементы копируются не больше чем двумя срезами и располагаются
+        с начала нового массива.
+        """
+        length = self.__size - self.__empty
+        values = self.to_list()
+        values.extend([None] * (size - length))
+        self.__array = values
+        self.__head = 0
+        self.__tail = length if length < size else 0
+        self.__size = size
+        self.__empty = size - length
+
+    def __fail(self, error):
+        """Возвращает `error` или, в режиме `strict`, поднимает `error`."""
+        if self.__strict:
+            raise error(
+                "Последовательность заполнена." if error is DeckFull
+                else "Недостаточно элементов в последовательности."
+            )
+        return 'error'
+
+    def __grow(self):
+        self.__resize(max(1, self.__size * 2))
+
+    def __shrink(self):
+        length = self.__size - self.__empty
+        size = self.__size
+        threshold = self.SHRINK_THRESHOLD
+        while size > self.__min_size and length <= size * threshold:
+            size = max(self.__min_size, size // 2)
+        if size != self.__size:
+            self.__resize(size)
+
+    def __reserve(self, amount):
+        """Проверяет, что в последовательность поместится `amount` элементов.
+
+        В режиме `growable` при необходимости увеличивает массив.
+        """
+        if amount <= self.__empty:
+            return True
+        if not self.__growable:
+            return False
+        size = max(1, self.__size * 2)
+        while size - (self.__size - self.__empty) < amount:
+            size *= 2
+        self.__resize(size)
+        return True
+
     def clear(self):
         """Очищает последовательность.
 
+        В режиме `growable` возвращает исходный размер массива.
+
         Examples:
         >>> deck = Deck(5)
         >>> deck.push_back(9)
@@ -123,9 +334,12 @@ class Deck:
         >>> deck
         Deck: size=5, fullness=0
         """
-        __size = len(self.__array)
+        if self.__growable:
+            self.__size = self.__min_size
+        __size = self.__size
         self.__array = [None] * __size
         self.__empty = __size
+        self.__version += 1
         self.__head = 0
         self.__tail = 0
 
@@ -148,13 +362,18 @@ class Deck:
         '[4, ..., 9]'
 
         """
-        if not self.__empty:
-            return 'error'
-        self.__array[self.__tail] = value
-        self.__empty -= 1
-        self.__tail += 1
-        if self.__tail == len(self.__array):
-            self.__tail = 0
+        empty = self.__empty
+        if not empty:
+            if not self.__growable:
+                return self.__fail(DeckFull)
+            self.__grow()
+            empty = self.__empty
+        tail = self.__tail
+        self.__array[tail] = value
+        tail += 1
+        self.__tail = 0 if tail == self.__size else tail
+        self.__empty = empty - 1
+        self.__version += 1
 
     def push_front(self, value):
         """Добавляет элемент в начало последовательности.
@@ -173,13 +392,17 @@ class Deck:
         >>> str(deck)
         '[9, ..., 4]'
         """
-        if not self.__empty:
-            return 'error'
-        self.__head -= 1
-        if self.__head < 0:
-            self.__head = len(self.__array) - 1
-        self.__array[self.__head] = value
-        self.__empty -= 1
+        empty = self.__empty
+        if not empty:
+            if not self.__growable:
+                return self.__fail(DeckFull)
+            self.__grow()
+            empty = self.__empty
+        head = (self.__head or self.__size) - 1
+        self.__array[head] = value
+        self.__head = head
+        self.__empty = empty - 1
+        self.__version += 1
 
     def pop_back(self):
         """Удаляет и возвращает элемент в конце последовательности.
@@ -197,14 +420,19 @@ class Deck:
         >>> deck
         Deck: size=5, fullness=1
         """
-        if self.__empty == len(self.__array):
-            return 'error'
-        self.__tail -= 1
-        if self.__tail < 0:
-            self.__tail = len(self.__array) - 1
-        value = self.__array[self.__tail]
-        self.__array[self.__tail] = None
-        self.__empty += 1
+        empty = self.__empty
+        size = self.__size
+        if empty == size:
+            return self.__fail(DeckEmpty)
+        tail = (self.__tail or size) - 1
+        array = self.__array
+        value = array[tail]
+        array[tail] = None
+        self.__tail = tail
+        self.__empty = empty + 1
+        self.__version += 1
+        if self.__growable:
+            self.__shrink()
         return value
 
     def pop_front(self):
@@ -223,16 +451,169 @@ class Deck:
         >>> deck
         Deck: size=5, fullness=1
         """
-        if self.__empty == len(self.__array):
-            return 'error'
-        value = self.__array[self.__head]
-        self.__array[self.__head] = None
-        self.__empty += 1
-        self.__head += 1
-        if self.__head == len(self.__array):
-            self.__head = 0
+        empty = self.__empty
+        size = self.__size
+        if empty == size:
+            return self.__fail(DeckEmpty)
+        head = self.__head
+        array = self.__array
+        value = array[head]
+        array[head] = None
+        head += 1
+        self.__head = 0 if head == size else head
+        self.__empty = empty + 1
+        self.__version += 1
+        if self.__growable:
+            self.__shrink()
         return value
 
+    def extend_back(self, values):
+        """Добавляет элементы в конец последовательности.
+
+        Элементы копируются не больше чем двумя срезами, указатели
+        обновляются один раз на весь пакет.
+
+        Args:
+            values (iterable): Добавляемые объекты.
+
+        Returns:
+            str: `error`, если элементы не помещаются (ничего не добавлено).
+
+        Examples:
+        >>> deck = Deck(5)
+        >>> deck.push_back(1)
+        >>> deck.extend_back([2, 3, 4])
+        >>> str(deck)
+        '[1, ..., 4]'
+        >>> deck.extend_back([5, 6])
+        'error'
+        """
+        values = list(values)
+        amount = len(values)
+        if not amount:
+            return None
+        if not self.__reserve(amount):
+            return self.__fail(DeckFull)
+        tail = self.__tail
+        first = min(amount, self.__size - tail)
+        self.__array[tail:tail + first] = values[:first]
+        if first < amount:
+            self.__array[:amount - first] = values[first:]
+        self.__tail = (tail + amount) % self.__size
+        self.__empty -= amount
+        self.__version += 1
+
+    def extend_front(self, values):
+        """Добавляет элементы в начало последовательности.
+
+        Как и `collections.deque.extendleft`, работает как
+        последовательные вызовы `push_front`: последний элемент окажется
+        первым.
+
+        Args:
+            values (iterable): Добавляемые объекты.
+
+        Returns:
+            str: `error`, если элементы не помещаются (ничего не добавлено).
+
+        Examples:
+        >>> deck = Deck(5)
+        >>> deck.push_back(1)
+        >>> deck.extend_front([2, 3, 4])
+        >>> deck.pop_front_many(4)
+        [4, 3, 2, 1]
+        """
+        values = list(values)
+        amount = len(values)
+        if not amount:
+            return None
+        if not self.__reserve(amount):
+            return self.__fail(DeckFull)
+        values.reverse()
+        head = (self.__head - amount) % self.__size
+        first = min(amount, self.__size - head)
+        self.__array[head:head + first] = values[:first]
+        if first < amount:
+            self.__array[:amount - first] = values[first:]
+        self.__head = head
+        self.__empty -= amount
+        self.__version += 1
+
+    def __take(self, start, amount):
+        """Удаляет и возвращает `amount` элементов, начиная с `start`."""
+        first = min(amount, self.__size - start)
+        values = self.__array[start:start + first]
+        self.__array[start:start + first] = [None] * first
+        if first < amount:
+            values += self.__array[:amount - first]
+            self.__array[:amount - first] = [None] * (amount - first)
+        self.__empty += amount
+        self.__version += 1
+        return values
+
+    def pop_front_many(self, amount):
+        """Удаляет и возвращает `amount` элементов из начала.
+
+        Args:
+            amount (int): Количество элементов.
+
+        Returns:
+            str: `error`, если элементов меньше, чем запрошено.
+            values (list): Удалённые элементы в порядке удаления.
+
+        Examples:
+        >>> deck = Deck(5)
+        >>> deck.extend_back([1, 2, 3])
+        >>> deck.pop_front_many(2)
+        [1, 2]
+        >>> deck.pop_front_many(2)
+        'error'
+        """
+        if not 0 <= amount <= self.__size - self.__empty:
+            if amount < 0 and self.__strict:
+                raise ValueError("Значение `amount` не может быть меньше 0.")
+            return self.__fail(DeckEmpty)
+        if not amount:
+            return []
+        head = self.__head
+        values = self.__take(head, amount)
+        self.__head = (head + amount) % self.__size
+        if self.__growable:
+            self.__shrink()
+        return values
+
+    def pop_back_many(self, amount):
+        """Удаляет и возвращает `amount` элементов из конца.
+
+        Args:
+            amount (int): Количество элементов.
+
+        Returns:
+            str: `error`, если элементов меньше, чем запрошено.
+            values (list): Удалённые элементы в порядке удаления.
+
+        Examples:
+        >>> deck = Deck(5)
+        >>> deck.extend_back([1, 2, 3])
+        >>> deck.pop_back_many(2)
+        [3, 2]
+        >>> deck
+        Deck: size=5, fullness=1
+        """
+        if not 0 <= amount <= self.__size - self.__empty:
+            if amount < 0 and self.__strict:
+                raise ValueError("Значение `amount` не может быть меньше 0.")
+            return self.__fail(DeckEmpty)
+        if not amount:
+            return []
+        tail = (self.__tail - amount) % self.__size
+        values = self.__take(tail, amount)
+        values.reverse()
+        self.__tail = tail
+        if self.__growable:
+            self.__shrink()
+        return values
+
     def get_back(self):
         """Возвращает последний элемет последовательности.
 
@@ -249,10 +630,9 @@ class Deck:
         >>> deck
         Deck: size=5, fullness=2
         """
-        if self.__empty == len(self.__array):
-            return 'error'
-        value = self.__array[self.__tail - 1]
-        return value
+        if self.__empty == self.__size:
+            return self.__fail(DeckEmpty)
+        return self.__array[self.__tail - 1]
 
     def get_front(self):
         """Возвращает первый элемет последовательности.
@@ -270,27 +650,357 @@ class Deck:
         >>> deck
         Deck: size=5, fullness=2
         """
-        if self.__empty == len(self.__array):
+        if self.__empty == self.__size:
+            return self.__fail(DeckEmpty)
+        return self.__array[self.__head]
+
+
+class TypedDeck:
+    """Двунаправленная очередь чисел одного типа на основе `array.array`.
+
+    Методы добавления, удаления и чтения совпадают с `Deck`, но значения
+    хранятся без упаковки в объекты Python по коду типа `typecode`
+    (как в `array.array`), поэтому миллионы чисел занимают в несколько
+    раз меньше памяти. Размер массива фиксирован: массив не
+    перевыделяется, а содержимое доступно без копирования через
+    `segments`.
+
+    Attributes:
+        __array (array): Массив заданного размера.
+        __head (int): Указатель на начало последовательности.
+        __tail (int): Указатель на первое пустое место в последовательности.
+        __size (int): Размер массива.
+        __empty (int): Количество пустых мест в последовательности.
+
+    Examples:
+        >>> deck = TypedDeck("d", 3)
+        >>> deck.push_back(1.5)
+        >>> deck.push_front(0.5)
+        >>> deck
+        TypedDeck('d'): size=3, fullness=2
+        >>> [segment.tolist() for segment in deck.segments()]
+        [[0.5], [1.5]]
+        >>> deck.pop_back()
+        1.5
+    """
+    __slots__ = ("__array", "__head", "__tail", "__size", "__empty")
+
+    def __init__(self, typecode, __size):
+        self.__array = array(typecode, [0]) * __size
+        self.__head = 0
+        self.__tail = 0
+        self.__size = __size
+        self.__empty = __size
+
+    def __str__(self):
+        """
+        Examples:
+        >>> deck = TypedDeck("q", 5)
+        >>> deck.extend_back([4, 9])
+        >>> str(deck)
+        '[4, ..., 9]'
+        """
+        if self.__empty == self.__size:
+            return "[]"
+        return (
+            f"[{self.__array[self.__head]}, ..., "
+            f"{self.__array[self.__tail - 1]}]"
+        )
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}({self.typecode!r}): "
+            f"size={self.__size}, fullness={len(self)}"
+        )
+
+    def __len__(self):
+        return self.__size - self.__empty
+
+    @property
+    def typecode(self):
+        return self.__array.typecode
+
+    def size(self):
+        return self.__size
+
+    def clear(self):
+        """Очищает последовательность без перевыделения массива."""
+        self.__empty = self.__size
+        self.__head = 0
+        self.__tail = 0
+
+    def segments(self):
+        """Возвращает содержимое без копирования.
+
+        Returns:
+            tuple: Не больше двух `memoryview` над массивом, которые
+            вместе дают элементы от начала до конца последовательности.
+            Представления действительны до следующего изменения.
+
+        Examples:
+        >>> deck = TypedDeck("q", 4)
+        >>> deck.segments()
+        ()
+        >>> deck.extend_back([1, 2, 3])
+        >>> deck.pop_front_many(2)
+        [1, 2]
+        >>> deck.extend_back([4, 5])
+        >>> [segment.tolist() for segment in deck.segments()]
+        [[3, 4], [5]]
+        """
+        length = self.__size - self.__empty
+        if not length:
+            return ()
+        view = memoryview(self.__array)
+        end = self.__head + length
+        if end <= self.__size:
+            return (view[self.__head:end],)
+        return (view[self.__head:], view[:end - self.__size])
+
+    def push_back(self, value):
+        """Добавляет элемент в конец последовательности.
+
+        Returns:
+            str: `error`, если последовательность заполнена.
+        """
+        if not self.__empty:
+            return 'error'
+        self.__array[self.__tail] = value
+        self.__empty -= 1
+        self.__tail += 1
+        if self.__tail == self.__size:
+            self.__tail = 0
+
+    def push_front(self, value):
+        """Добавляет элемент в начало последовательности.
+
+        Returns:
+            str: `error`, если последовательность заполнена.
+        """
+        if not self.__empty:
+            return 'error'
+        head = (self.__head or self.__size) - 1
+        self.__array[head] = value
+        self.__head = head
+        self.__empty -= 1
+
+    def pop_back(self):
+        """Удаляет и возвращает элемент в конце последовательности.
+
+        Returns:
+            str: `error`, если последовательность пустая.
+            value (int | float): Удалённый из последовательности элемент.
+        """
+        if self.__empty == self.__size:
+            return 'error'
+        self.__tail = (self.__tail or self.__size) - 1
+        self.__empty += 1
+        return self.__array[self.__tail]
+
+    def pop_front(self):
+        """Удаляет и возвращает элемент в начале последовательности.
+
+        Returns:
+            str: `error`, если последовательность пустая.
+            value (int | float): Удалённый из последовательности элемент.
+        """
+        if self.__empty == self.__size:
             return 'error'
         value = self.__array[self.__head]
+        self.__empty += 1
+        self.__head += 1
+        if self.__head == self.__size:
+            self.__head = 0
         return value
 
+    def __put(self, start, values):
+        """Записывает `values` с позиции `start` двумя срезами или меньше."""
+        first = min(len(values), self.__size - start)
+        self.__array[start:start + first] = values[:first]
+        if first < len(values):
+            self.__array[:len(values) - first] = values[first:]
 
-def main():
+    def extend_back(self, values):
+        """Добавляет элементы в конец последовательности.
+
+        Returns:
+            str: `error`, если элементы не помещаются (ничего не добавлено).
+        """
+        values = array(self.typecode, values)
+        if not values:
+            return None
+        if len(values) > self.__empty:
+            return 'error'
+        self.__put(self.__tail, values)
+        self.__tail = (self.__tail + len(values)) % self.__size
+        self.__empty -= len(values)
+
+    def extend_front(self, values):
+        """Добавляет элементы в начало, как `collections.deque.extendleft`.
+
+        Returns:
+            str: `error`, если элементы не помещаются (ничего не добавлено).
+        """
+        values = array(self.typecode, values)
+        if not values:
+            return None
+        if len(values) > self.__empty:
+            return 'error'
+        values.reverse()
+        head = (self.__head - len(values)) % self.__size
+        self.__put(head, values)
+        self.__head = head
+        self.__empty -= len(values)
+
+    def __take(self, start, amount):
+        first = min(amount, self.__size - start)
+        values = self.__array[start:start + first].tolist()
+        if first < amount:
+            values += self.__array[:amount - first].tolist()
+        self.__empty += amount
+        return values
+
+    def pop_front_many(self, amount):
+        """Удаляет и возвращает `amount` элементов из начала.
+
+        Returns:
+            str: `error`, если элементов меньше, чем запрошено.
+            values (list): Удалённые элементы в порядке удаления.
+        """
+        if not 0 <= amount <= self.__size - self.__empty:
+            return 'error'
+        if not amount:
+            return []
+        values = self.__take(self.__head, amount)
+        self.__head = (self.__head + amount) % self.__size
+        return values
+
+    def pop_back_many(self, amount):
+        """Удаляет и возвращает `amount` элементов из конца.
+
+        Returns:
+            str: `error`, если элементов меньше, чем запрошено.
+            values (list): Удалённые элементы в порядке удаления.
+        """
+        if not 0 <= amount <= self.__size - self.__empty:
+            return 'error'
+        if not amount:
+            return []
+        tail = (self.__tail - amount) % self.__size
+        values = self.__take(tail, amount)
+        values.reverse()
+        self.__tail = tail
+        return values
+
+    def get_back(self):
+        """Возвращает последний элемент последовательности.
+
+        Returns:
+            str: `error`, если последовательность пустая.
+        """
+        if self.__empty == self.__size:
+            return 'error'
+        return self.__array[self.__tail - 1]
+
+    def get_front(self):
+        """Возвращает первый элемент последовательности.
+
+        Returns:
+            str: `error`, если последовательность пустая.
+        """
+        if self.__empty == self.__size:
+            return 'error'
+        return self.__array[self.__head]
+
+
+def read_lines(stream, block_size=READ_BLOCK_SIZE):
+    """Читает строки из байтового потока блоками.
+
+    Вместо построчного `input()` поток читается блоками по `block_size`
+    байт и делится на строки целиком. Неполная последняя строка блока
+    переносится в следующий.
+
+    Args:
+        stream (BinaryIO): Поток для чтения, например `sys.stdin.buffer`.
+        block_size (int, optional): Размер блока в байтах.
+        Defaults to READ_BLOCK_SIZE.
+
+    Yields:
+        bytes: Строки без символа перевода строки.
+
+    Examples:
+        >>> import io
+        >>> list(read_lines(io.BytesIO(b"3\\npush_back 1\\nsize"), 4))
+        [b'3', b'push_back 1', b'size']
+    """
+    carry = b""
+    while True:
+        block = stream.read(block_size)
+        if not block:
+            break
+        lines = (carry + block).split(b"\n")
+        carry = lines.pop()
+        yield from lines
+    if carry:
+        yield carry
+
+
+def execute(deck, commands):
+    """Выполняет команды над последовательностью.
+
+    Команды - строки вида `push_back 5` или `pop_front`. Методы
+    `COMMANDS` заранее связываются в таблицу, поэтому команда без
+    аргументов находится по всей строке без разбиения. Аргументы
+    преобразуются в `int`.
+
+    Args:
+        deck (Deck): Последовательность.
+        commands (Iterable[bytes]): Строки с командами.
+
+    Raises:
+        ValueError: Неизвестная команда или некорректный аргумент.
+
+    Returns:
+        list: Строковые результаты команд, вернувших значение.
+
+    Examples:
+        >>> execute(Deck(2), [b"pop_back", b"push_front 7", b"get_back"])
+        ['error', '7']
+    """
+    table = {name.encode(): getattr(deck, name) for name in COMMANDS}
+    get = table.get
     results = []
-    commands = int(input())
-    deck_size = int(input())
-    deck = Deck(deck_size)
-    for _ in range(commands):
-        command, *args = input().split()
-        attr = getattr(deck, command)
-        if attr:
-            result = attr(*args)
+    append = results.append
+    for line in commands:
+        method = get(line)
+        if method is not None:
+            result = method()
+        else:
+            name, _, argument = line.partition(b" ")
+            method = get(name)
+            if method is None or not argument:
+                # Лишние пробелы или неизвестная команда.
+                name, *arguments = line.split() or (b"",)
+                if not name:
+                    continue
+                method = get(name)
+                if method is None:
+                    raise ValueError(f"Неизвестная команда: {line!r}")
+                result = method(*map(int, arguments))
+            else:
+                result = method(int(argument))
         if result is not None:
-            results.append(result)
+            append(str(result))
+    return results
+
 
-    results = '\n'.join(results)
-    print(results)
+def main():
+    lines = read_lines(sys.stdin.buffer)
+    commands = int(next(lines))
+    deck = Deck(int(next(lines)))
+    results = execute(deck, islice(lines, commands))
+    sys.stdout.write("\n".join(results) + "\n")
+    sys.stdout.flush()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,270 @@
+import mmap
+import os
+import struct
+
+MAGIC = b"DECK\x00\x00\x00\x01"
+HEADER = struct.Struct("<8s16sQQQQ")
+HEADER_SIZE = 64
+STATE = struct.Struct("<QQQ")
+STATE_OFFSET = 32
+
+
+class BufferDeck:
+    """Двунаправленная очередь записей фиксированной длины в буфере.
+
+    Буфер начинается с заголовка `HEADER`: сигнатура, формат записи
+    `struct`, размер и состояние (`head`, `tail`, `empty`), за которым
+    следуют записи кольцевого буфера. Состояние читается из заголовка
+    при каждой операции, поэтому очередь можно открыть заново по тому
+    же буферу без восстановления. Добавление и удаление затрагивают
+    только одну запись и состояние в заголовке.
+
+    Методы и возвращаемое `error` совпадают с `deck.Deck`.
+
+    Attributes:
+        _buffer (Buffer): Записываемый буфер с заголовком и записями.
+        _record (struct.Struct): Формат одной записи.
+        __size (int): Количество записей.
+
+    Examples:
+        >>> buffer = bytearray(BufferDeck.nbytes(2, "d"))
+        >>> BufferDeck.format(buffer, 2, "d")
+        >>> deck = BufferDeck(buffer)
+        >>> deck.push_back(1.5)
+        >>> deck.push_front(0.5)
+        >>> deck.push_back(2.5)
+        'error'
+        >>> BufferDeck(buffer).pop_back()
+        1.5
+        >>> deck
+        BufferDeck('d'): size=2, fullness=1
+    """
+
+    def __init__(self, buffer):
+        magic, fmt, size, *_ = HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise ValueError("Буфер не содержит очередь.")
+        self._buffer = buffer
+        self._record = struct.Struct("<" + fmt.rstrip(b"\x00").decode())
+        self.__size = size
+        if len(buffer) < self.nbytes(size, self.fmt):
+            raise ValueError("Размер буфера меньше размера очереди.")
+
+    @staticmethod
+    def nbytes(size, fmt):
+        """Возвращает размер буфера для `size` записей формата `fmt`."""
+        return HEADER_SIZE + size * struct.calcsize("<" + fmt)
+
+    @staticmethod
+    def format(buffer, size, fmt):
+        """Записывает в буфер заголовок пустой очереди.
+
+        Args:
+            buffer (Buffer): Записываемый буфер размера `nbytes`.
+            size (int): Количество записей.
+            fmt (str): Формат записи `struct` из одного поля,
+            например `q`, `d` или `16s`.
+
+        Raises:
+            ValueError: Формат не из одного поля или буфер мал.
+        """
+        record = struct.Struct("<" + fmt)
+        fields = record.unpack(bytes(record.size))
+        if len(fmt.encode()) > 16 or len(fields) != 1:
+            raise ValueError("Формат записи должен состоять из одного поля.")
+        if len(buffer) < BufferDeck.nbytes(size, fmt):
+            raise ValueError("Размер буфера меньше размера очереди.")
+        HEADER.pack_into(buffer, 0, MAGIC, fmt.encode(), size, 0, 0, size)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}({self.fmt!r}): "
+            f"size={self.__size}, fullness={len(self)}"
+        )
+
+    def __len__(self):
+        return self.__size - STATE.unpack_from(self._buffer, STATE_OFFSET)[2]
+
+    @property
+    def fmt(self):
+        return self._record.format[1:]
+
+    def size(self):
+        return self.__size
+
+    def _changed(self):
+        """Вызывается после каждого изменения очереди."""
+
+    def clear(self):
+        STATE.pack_into(self._buffer, STATE_OFFSET, 0, 0, self.__size)
+        self._changed()
+
+    def __offset(self, index):
+        return HEADER_SIZE + index * self._record.size
+
+    def push_back(self, value):
+        """Добавляет запись в конец последовательности.
+
+        Returns:
+            str: `error`, если последовательность заполнена.
+        """
+        buffer = self._buffer
+        head, tail, empty = STATE.unpack_from(buffer, STATE_OFFSET)
+        if not empty:
+            return 'error'
+        self._record.pack_into(buffer, self.__offset(tail), value)
+        tail += 1
+        if tail == self.__size:
+            tail = 0
+        STATE.pack_into(buffer, STATE_OFFSET, head, tail, empty - 1)
+        self._changed()
+
+    def push_front(self, value):
+        """Добавляет запись в начало последовательности.
+
+        Returns:
+            str: `error`, если последовательность заполнена.
+        """
+        buffer = self._buffer
+        head, tail, empty = STATE.unpack_from(buffer, STATE_OFFSET)
+        if not empty:
+            return 'error'
+        head = (head or self.__size) - 1
+        self._record.pack_into(buffer, self.__offset(head), value)
+        STATE.pack_into(buffer, STATE_OFFSET, head, tail, empty - 1)
+        self._changed()
+
+    def pop_back(self):
+        """Удаляет и возвращает запись в конце последовательности.
+
+        Returns:
+            str: `error`, если последовательность пустая.
+        """
+        buffer = self._buffer
+        head, tail, empty = STATE.unpack_from(buffer, STATE_OFFSET)
+        if empty == self.__size:
+            return 'error'
+        tail = (tail or self.__size) - 1
+        value, = self._record.unpack_from(buffer, self.__offset(tail))
+        STATE.pack_into(buffer, STATE_OFFSET, head, tail, empty + 1)
+        self._changed()
+        return value
+
+    def pop_front(self):
+        """Удаляет и возвращает запись в начале последовательности.
+
+        Returns:
+            str: `error`, если последовательность пустая.
+        """
+        buffer = self._buffer
+        head, tail, empty = STATE.unpack_from(buffer, STATE_OFFSET)
+        if empty == self.__size:
+            return 'error'
+        value, = self._record.unpack_from(buffer, self.__offset(head))
+        head += 1
+        if head == self.__size:
+            head = 0
+        STATE.pack_into(buffer, STATE_OFFSET, head, tail, empty + 1)
+        self._changed()
+        return value
+
+    def get_back(self):
+        """Возвращает последнюю запись или `error`, если их нет."""
+        _, tail, empty = STATE.unpack_from(self._buffer, STATE_OFFSET)
+        if empty == self.__size:
+            return 'error'
+        index = (tail or self.__size) - 1
+        return self._record.unpack_from(
+            self._buffer, self.__offset(index)
+        )[0]
+
+    def get_front(self):
+        """Возвращает первую запись или `error`, если их нет."""
+        head, _, empty = STATE.unpack_from(self._buffer, STATE_OFFSET)
+        if empty == self.__size:
+            return 'error'
+        return self._record.unpack_from(self._buffer, self.__offset(head))[0]
+
+
+class MappedDeck(BufferDeck):
+    """Очередь `BufferDeck` в отображённом в память файле.
+
+    Если файла нет, он создаётся для `size` записей формата `fmt`
+    (по умолчанию `q`), иначе очередь открывается с сохранённым
+    состоянием, а заданные `size` и `fmt` сверяются с файлом.
+
+    Запись на диск выполняет операционная система. `flush` сбрасывает
+    изменённые страницы явно, а `sync_every` делает это после каждых
+    `sync_every` изменений: 1 - надёжнее всего, 0 - только при `flush`
+    и `close`.
+
+    Объект сериализуется `pickle` по пути файла без копирования
+    записей. Одновременная запись из нескольких процессов не
+    синхронизируется.
+
+    Attributes:
+        path (str): Путь к файлу.
+        sync_every (int): Количество изменений между сбросами на диск.
+        __changes (int): Изменения после последнего сброса.
+
+    Examples:
+        >>> import tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "deck")
+        >>> with MappedDeck(path, 3, "q") as deck:
+        ...     deck.push_back(7)
+        ...     deck.push_front(6)
+        >>> with MappedDeck(path) as deck:
+        ...     deck.pop_front(), len(deck)
+        (6, 1)
+    """
+
+    def __init__(self, path, size=None, fmt=None, sync_every=0):
+        self.path = path
+        self.sync_every = sync_every
+        self.__changes = 0
+        create = not os.path.exists(path) or not os.path.getsize(path)
+        if create and size is None:
+            raise ValueError("Для новой очереди нужен размер `size`.")
+        with open(path, "r+b" if not create else "w+b") as file:
+            if create:
+                fmt = fmt or "q"
+                file.truncate(self.nbytes(size, fmt))
+            buffer = mmap.mmap(file.fileno(), 0)
+        try:
+            if create:
+                self.format(buffer, size, fmt)
+            super().__init__(buffer)
+            if size not in (None, self.size()) or fmt not in (None, self.fmt):
+                raise ValueError(
+                    f"Очередь в файле: size={self.size()}, fmt={self.fmt!r}."
+                )
+        except BaseException:
+            buffer.close()
+            if create:
+                os.remove(path)
+            raise
+
+    def __reduce__(self):
+        return self.__class__, (self.path, None, self.fmt, self.sync_every)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _changed(self):
+        if self.sync_every:
+            self.__changes += 1
+            if self.__changes >= self.sync_every:
+                self.flush()
+
+    def flush(self):
+        """Сбрасывает изменённые страницы файла на диск."""
+        self._buffer.flush()
+        self.__changes = 0
+
+    def close(self):
+        if not self._buffer.closed:
+            self.flush()
+            self._buffer.close()
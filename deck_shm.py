@@ -0,0 +1,193 @@
+import multiprocessing
+import os
+import sys
+from multiprocessing import resource_tracker, shared_memory
+
+from deck_mmap import BufferDeck
+
+
+class SharedDeck(BufferDeck):
+    """Очередь `BufferDeck` в разделяемой памяти для нескольких процессов.
+
+    Записи фиксированной длины и состояние очереди лежат в
+    `multiprocessing.shared_memory`, поэтому процессы обмениваются
+    числами или байтами без сериализации объектов и каналов. Все
+    операции выполняются под общей блокировкой процессов. Методы
+    совпадают с `deck.Deck`, но `push_*` и `pop_*` могут ждать места
+    или записи до `timeout` секунд, прежде чем вернуть `error`.
+
+    Очередь передаётся процессам при их создании (аргументом
+    `multiprocessing.Process` или `initializer` пула): при этом
+    разделяемая память открывается по имени, а блокировка наследуется.
+    Создавший процесс освобождает память через `close` или `with`.
+
+    Attributes:
+        __memory (SharedMemory): Разделяемая память очереди.
+        __owner (int): Идентификатор процесса, создавшего очередь.
+        _lock (Lock): Блокировка доступа к очереди.
+        _not_empty (Condition): Появилась запись.
+        _not_full (Condition): Появилось свободное место.
+
+    Examples:
+        >>> with SharedDeck(2, "d") as deck:
+        ...     deck.push_back(1.5)
+        ...     deck.push_front(0.5)
+        ...     deck.push_back(2.5, timeout=0.01)
+        ...     deck.pop_back(), deck.pop_front(), deck.pop_front()
+        'error'
+        (1.5, 0.5, 'error')
+    """
+
+    def __init__(self, size, fmt="q", ctx=None):
+        ctx = ctx or multiprocessing.get_context()
+        memory = shared_memory.SharedMemory(
+            create=True, size=self.nbytes(size, fmt)
+        )
+        try:
+            self.format(memory.buf, size, fmt)
+        except BaseException:
+            memory.close()
+            memory.unlink()
+            raise
+        lock = ctx.Lock()
+        self.__attach(
+            memory, lock, ctx.Condition(lock), ctx.Condition(lock),
+            os.getpid()
+        )
+
+    def __attach(self, memory, lock, not_empty, not_full, owner):
+        super().__init__(memory.buf)
+        self.__memory = memory
+        self.__owner = owner
+        self._lock = lock
+        self._not_empty = not_empty
+        self._not_full = not_full
+
+    @classmethod
+    def _open(cls, name, lock, not_empty, not_full):
+        # Память освобождает создатель, открывший процесс не должен
+        # учитывать её в своём `resource_tracker`.
+        if sys.version_info >= (3, 13):
+            memory = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            memory = shared_memory.SharedMemory(name=name)
+            # Дочерние процессы `multiprocessing` (в том числе во время
+            # распаковки аргументов при `spawn`) используют
+            # `resource_tracker` родителя, где память уже учтена
+            # создателем, а удаление учёта лишило бы его записи.
+            inheriting = getattr(
+                multiprocessing.current_process(), "_inheriting", False
+            )
+            if multiprocessing.parent_process() is None and not inheriting:
+                resource_tracker.unregister(memory._name, "shared_memory")
+        deck = cls.__new__(cls)
+        deck.__attach(memory, lock, not_empty, not_full, None)
+        return deck
+
+    def __reduce__(self):
+        return self._open, (
+            self.name, self._lock, self._not_empty, self._not_full
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def name(self):
+        return self.__memory.name
+
+    def close(self):
+        """Закрывает разделяемую память, создатель её освобождает."""
+        if self._buffer is None:
+            return
+        self._buffer = None
+        self.__memory.close()
+        if self.__owner == os.getpid():
+            self.__memory.unlink()
+
+    def __len__(self):
+        with self._lock:
+            return super().__len__()
+
+    def __has_space(self):
+        return BufferDeck.__len__(self) < self.size()
+
+    def __has_records(self):
+        return BufferDeck.__len__(self) > 0
+
+    def __push(self, push, value, timeout):
+        with self._not_full:
+            if timeout != 0 and not self._not_full.wait_for(
+                self.__has_space, timeout
+            ):
+                return 'error'
+            result = push(self, value)
+            if result is None:
+                self._not_empty.notify()
+            return result
+
+    def __pop(self, pop, timeout):
+        with self._not_empty:
+            if timeout != 0 and not self._not_empty.wait_for(
+                self.__has_records, timeout
+            ):
+                return 'error'
+            result = pop(self)
+            if result != 'error':
+                self._not_full.notify()
+            return result
+
+    def clear(self):
+        with self._lock:
+            super().clear()
+            self._not_full.notify_all()
+
+    def push_back(self, value, timeout=0):
+        """Добавляет запись в конец последовательности.
+
+        Args:
+            value (int | float | bytes): Запись формата `fmt`.
+            timeout (float, optional): Наибольшее время ожидания места в
+            секундах, `None` - без ограничения. Defaults to 0.
+
+        Returns:
+            str: `error`, если место не освободилось.
+        """
+        return self.__push(BufferDeck.push_back, value, timeout)
+
+    def push_front(self, value, timeout=0):
+        """Добавляет запись в начало последовательности.
+
+        Аргументы совпадают с `push_back`.
+        """
+        return self.__push(BufferDeck.push_front, value, timeout)
+
+    def pop_back(self, timeout=0):
+        """Удаляет и возвращает запись в конце последовательности.
+
+        Args:
+            timeout (float, optional): Наибольшее время ожидания записи в
+            секундах, `None` - без ограничения. Defaults to 0.
+
+        Returns:
+            str: `error`, если запись не появилась.
+        """
+        return self.__pop(BufferDeck.pop_back, timeout)
+
+    def pop_front(self, timeout=0):
+        """Удаляет и возвращает запись в начале последовательности.
+
+        Аргументы совпадают с `pop_back`.
+        """
+        return self.__pop(BufferDeck.pop_front, timeout)
+
+    def get_back(self):
+        with self._lock:
+            return super().get_back()
+
+    def get_front(self):
+        with self._lock:
+            return super().get_front()
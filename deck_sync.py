@@ -0,0 +1,325 @@
+import asyncio
+import queue
+import threading
+import time
+from collections import deque
+
+from deck import Deck
+
+
+class BlockingDeck:
+    """Потокобезопасная двунаправленная очередь фиксированного размера.
+
+    Оборачивает `deck.Deck` для связки производителей и потребителей.
+    Вместо возврата `error` операции ждут свободного места или элемента:
+    заполненная очередь останавливает производителей (backpressure), а
+    пустая - потребителей. Ожидание построено на двух условных
+    переменных над одной блокировкой, поэтому опроса в цикле нет.
+
+    Ошибки переполнения и пустоты совпадают с `queue.Queue`:
+    `queue.Full` и `queue.Empty`.
+
+    Attributes:
+        __deck (Deck): Очередь с элементами.
+        __size (int): Размер очереди.
+        __mutex (threading.Lock): Блокировка доступа к `__deck`.
+        __not_empty (threading.Condition): Появился элемент.
+        __not_full (threading.Condition): Появилось свободное место.
+
+    Examples:
+        >>> deck = BlockingDeck(2)
+        >>> deck.push_back(1)
+        >>> deck.push_front(0)
+        >>> deck.push_back(2, timeout=0.01)
+        Traceback (most recent call last):
+        ...
+        queue.Full
+        >>> deck.pop_back(), deck.pop_front()
+        (1, 0)
+        >>> deck.pop_front(block=False)  # doctest: +IGNORE_EXCEPTION_DETAIL
+        Traceback (most recent call last):
+        ...
+        queue.Empty
+    """
+
+    def __init__(self, __size):
+        if __size < 1:
+            raise ValueError(
+                "Размер очереди должен быть натуральным числом."
+            )
+        self.__deck = Deck(__size)
+        self.__size = __size
+        self.__mutex = threading.Lock()
+        self.__not_empty = threading.Condition(self.__mutex)
+        self.__not_full = threading.Condition(self.__mutex)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}: "
+            f"size={self.size()}, fullness={len(self)}"
+        )
+
+    def __len__(self):
+        with self.__mutex:
+            return len(self.__deck)
+
+    def size(self):
+        """
+        Examples:
+        >>> BlockingDeck(5).size()
+        5
+        """
+        return self.__size
+
+    @staticmethod
+    def __wait(condition, ready, block, timeout, error):
+        """Ждёт на `condition`, пока `ready()` не станет истинным.
+
+        Вызывается под блокировкой. При невозможности дождаться
+        поднимает `error`.
+        """
+        if not block:
+            raise error
+        if timeout is None:
+            while not ready():
+                condition.wait()
+            return
+        if timeout < 0:
+            raise ValueError("Значение `timeout` не может быть меньше 0.")
+        deadline = time.monotonic() + timeout
+        while not ready():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise error
+            condition.wait(remaining)
+
+    def __put(self, push, value, block, timeout):
+        deck, size = self.__deck, self.__size
+        with self.__not_full:
+            if len(deck) >= size:
+                self.__wait(
+                    self.__not_full, lambda: len(deck) < size,
+                    block, timeout, queue.Full
+                )
+            push(value)
+            self.__not_empty.notify()
+
+    def __pop(self, pop, block, timeout):
+        deck = self.__deck
+        with self.__not_empty:
+            if not len(deck):
+                self.__wait(
+                    self.__not_empty, lambda: len(deck) > 0,
+                    block, timeout, queue.Empty
+                )
+            value = pop()
+            self.__not_full.notify()
+            return value
+
+    def push_back(self, value, block=True, timeout=None):
+        """Добавляет элемент в конец последовательности.
+
+        Args:
+            value (object): Добавляемый объект.
+            block (bool, optional): Ждать свободного места.
+            Defaults to True.
+            timeout (float, optional): Наибольшее время ожидания в
+            секундах. Defaults to None (без ограничения).
+
+        Raises:
+            queue.Full: Место не освободилось.
+        """
+        self.__put(self.__deck.push_back, value, block, timeout)
+
+    def push_front(self, value, block=True, timeout=None):
+        """Добавляет элемент в начало последовательности.
+
+        Аргументы и ошибки совпадают с `push_back`.
+        """
+        self.__put(self.__deck.push_front, value, block, timeout)
+
+    def pop_front(self, block=True, timeout=None):
+        """Удаляет и возвращает элемент из начала последовательности.
+
+        Args:
+            block (bool, optional): Ждать появления элемента.
+            Defaults to True.
+            timeout (float, optional): Наибольшее время ожидания в
+            секундах. Defaults to None (без ограничения).
+
+        Raises:
+            queue.Empty: Элемент не появился.
+
+        Returns:
+            object: Первый элемент.
+        """
+        return self.__pop(self.__deck.pop_front, block, timeout)
+
+    def pop_back(self, block=True, timeout=None):
+        """Удаляет и возвращает элемент из конца последовательности.
+
+        Аргументы и ошибки совпадают с `pop_front`.
+        """
+        return self.__pop(self.__deck.pop_back, block, timeout)
+
+
+class AsyncDeck:
+    """Двунаправленная очередь фиксированного размера для asyncio.
+
+    Аналог `BlockingDeck` с теми же именами методов для сопрограмм
+    одного цикла событий: `push_*` ждут свободного места, `pop_*` -
+    элемента. Ожидающие будятся по очереди через futures, как в
+    `asyncio.Queue`. Для ограничения времени ожидания используется
+    `asyncio.wait_for`.
+
+    Не потокобезопасна. Ошибки неблокирующих вариантов:
+    `asyncio.QueueFull` и `asyncio.QueueEmpty`.
+
+    Attributes:
+        __deck (Deck): Очередь с элементами.
+        __size (int): Размер очереди.
+        __getters (deque): Futures ожидающих элемента.
+        __putters (deque): Futures ожидающих свободного места.
+
+    Examples:
+        >>> async def example():
+        ...     deck = AsyncDeck(1)
+        ...     await deck.push_back(1)
+        ...     waiting = asyncio.ensure_future(deck.push_front(0))
+        ...     first = await deck.pop_back()
+        ...     await waiting
+        ...     return first, await deck.pop_front()
+        >>> asyncio.run(example())
+        (1, 0)
+    """
+
+    def __init__(self, __size):
+        if __size < 1:
+            raise ValueError(
+                "Размер очереди должен быть натуральным числом."
+            )
+        self.__deck = Deck(__size)
+        self.__size = __size
+        self.__getters = deque()
+        self.__putters = deque()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}: "
+            f"size={self.size()}, fullness={len(self)}"
+        )
+
+    def __len__(self):
+        return len(self.__deck)
+
+    def size(self):
+        """
+        Examples:
+        >>> AsyncDeck(5).size()
+        5
+        """
+        return self.__size
+
+    def full(self):
+        return len(self.__deck) >= self.__size
+
+    def empty(self):
+        return not len(self.__deck)
+
+    @staticmethod
+    def __wakeup_next(waiters):
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    async def __wait(self, waiters, ready):
+        """Ждёт, пока `ready()` не станет истинным.
+
+        Если ожидание отменено, но условие уже выполнено, будит
+        следующего ожидающего, чтобы не потерять сигнал.
+        """
+        while not ready():
+            waiter = asyncio.get_running_loop().create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    pass
+                if ready() and not waiter.cancelled():
+                    self.__wakeup_next(waiters)
+                raise
+
+    def __put_nowait(self, push, value):
+        if self.full():
+            raise asyncio.QueueFull
+        push(value)
+        self.__wakeup_next(self.__getters)
+
+    def __pop_nowait(self, pop):
+        if self.empty():
+            raise asyncio.QueueEmpty
+        value = pop()
+        self.__wakeup_next(self.__putters)
+        return value
+
+    def push_back_nowait(self, value):
+        """Добавляет элемент в конец без ожидания.
+
+        Raises:
+            asyncio.QueueFull: Последовательность заполнена.
+        """
+        self.__put_nowait(self.__deck.push_back, value)
+
+    def push_front_nowait(self, value):
+        """Добавляет элемент в начало без ожидания.
+
+        Raises:
+            asyncio.QueueFull: Последовательность заполнена.
+        """
+        self.__put_nowait(self.__deck.push_front, value)
+
+    def pop_front_nowait(self):
+        """Удаляет и возвращает первый элемент без ожидания.
+
+        Raises:
+            asyncio.QueueEmpty: Последовательность пуста.
+        """
+        return self.__pop_nowait(self.__deck.pop_front)
+
+    def pop_back_nowait(self):
+        """Удаляет и возвращает последний элемент без ожидания.
+
+        Raises:
+            asyncio.QueueEmpty: Последовательность пуста.
+        """
+        return self.__pop_nowait(self.__deck.pop_back)
+
+    async def push_back(self, value):
+        """Добавляет элемент в конец, дожидаясь свободного места."""
+        if self.full():
+            await self.__wait(self.__putters, lambda: not self.full())
+        self.push_back_nowait(value)
+
+    async def push_front(self, value):
+        """Добавляет элемент в начало, дожидаясь свободного места."""
+        if self.full():
+            await self.__wait(self.__putters, lambda: not self.full())
+        self.push_front_nowait(value)
+
+    async def pop_front(self):
+        """Удаляет и возвращает первый элемент, дожидаясь его появления."""
+        if self.empty():
+            await self.__wait(self.__getters, lambda: not self.empty())
+        return self.pop_front_nowait()
+
+    async def pop_back(self):
+        """Удаляет и возвращает последний элемент, дожидаясь появления."""
+        if self.empty():
+            await self.__wait(self.__getters, lambda: not self.empty())
+        return self.pop_back_nowait()
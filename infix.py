@@ -0,0 +1,216 @@
+import re
+from functools import lru_cache
+from typing import List, Sequence, Tuple
+
+from calculator import (
+    COMPILE_TEXT_LIMIT, Calculator, ReversePolishCalculator
+)
+
+INFIX_CACHE_SIZE = 1024
+
+# Символ -> (приоритет, правоассоциативность).
+BINARY_OPERATORS = {
+    "+": (1, False),
+    "-": (1, False),
+    "*": (2, False),
+    "/": (2, False),
+}
+UNARY_MINUS = "neg"
+UNARY_PRECEDENCE = 3
+_OPEN = -1
+
+_TOKEN = re.compile(
+    r"\d+\.?\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?|\w+|\S"
+)
+_SYMBOLS = frozenset("+-*/(),")
+
+
+def _lex(formula: str) -> List[str]:
+    """Разбивает инфиксную формулу на токены.
+
+    Examples:
+        >>> _lex("max(x1, 2.5e1)-.5")
+        ['max', '(', 'x1', ',', '2.5e1', ')', '-', '.5']
+    """
+    return _TOKEN.findall(formula)
+
+
+def to_rpn(formula: str) -> List[str]:
+    """Переводит инфиксную формулу в токены обратной польской нотации.
+
+    Разбор выполняется алгоритмом сортировочной станции: `*` и `/`
+    связывают сильнее `+` и `-`, все бинарные операции
+    левоассоциативны, скобки меняют порядок, унарный минус становится
+    операцией `neg`, а унарный плюс опускается. Операции `ACTIONS` с
+    именами записываются как вызовы функций: `sqrt(x)`, `max(a, b, c)`
+    (для вариативных операций - токен `max/3`). Остальные имена
+    считаются переменными.
+
+    Результат для формул не длиннее `COMPILE_TEXT_LIMIT` кэшируется по
+    тексту (LRU на `INFIX_CACHE_SIZE` записей), изменение реестра
+    `ACTIONS` делает кэш неактуальным.
+
+    Args:
+        formula (str): Инфиксная формула.
+
+    Raises:
+        ValueError: Некорректная формула.
+
+    Returns:
+        list: Токены для `ReversePolishCalculator`.
+
+    Examples:
+        >>> to_rpn("2 * (3 + x) - 4 / 2")
+        ['2', '3', 'x', '+', '*', '4', '2', '/', '-']
+        >>> to_rpn("-a * -(b - c)")
+        ['a', 'neg', 'b', 'c', '-', 'neg', '*']
+        >>> to_rpn("max(1, sqrt(16), 3) + sum(a, b)")
+        ['1', '16', 'sqrt', '3', 'max/3', 'a', 'b', 'sum', '+']
+    """
+    if len(formula) > COMPILE_TEXT_LIMIT:
+        return list(_to_rpn(formula))
+    return list(_to_rpn_cached(formula, Calculator.ACTIONS.version))
+
+
+@lru_cache(maxsize=INFIX_CACHE_SIZE)
+def _to_rpn_cached(formula: str, version: int) -> Tuple[str, ...]:
+    return _to_rpn(formula)
+
+
+def _to_rpn(formula: str) -> Tuple[str, ...]:
+    actions = Calculator.ACTIONS.entries
+    tokens = _lex(formula)
+    output: List[str] = []
+    # Операции (символ, приоритет, правоассоциативность) и открытые
+    # скобки (символ, `_OPEN`, это вызов функции).
+    pending: List[Tuple[str, int, bool]] = []
+    arguments: List[int] = []
+    emit, push = output.append, pending.append
+    expect_operand = True
+    after_call = False
+
+    def fail(reason: str):
+        return ValueError(f"Некорректная формула `{formula}`: {reason}")
+
+    def close(reason: str) -> Tuple[str, int, bool]:
+        """Выталкивает операции до ближайшей открывающей скобки."""
+        while pending:
+            entry = pending.pop()
+            if entry[1] == _OPEN:
+                return entry
+            emit(entry[0])
+        raise fail(reason)
+
+    for index, text in enumerate(tokens):
+        if after_call:
+            # Скобка вызова `name(` уже в `pending`.
+            after_call = False
+            continue
+        if text not in _SYMBOLS:
+            head = text[0]
+            if not (
+                head.isalnum() or head == "_" or head == "." and text != "."
+            ):
+                raise fail(f"не поддерживаемый символ `{text}`")
+            if not expect_operand:
+                raise fail(f"пропущена операция перед `{text}`")
+            is_call = index + 1 < len(tokens) and tokens[index + 1] == "("
+            if text in actions:
+                if not is_call:
+                    raise fail(f"операция `{text}` без аргументов")
+                push((text, _OPEN, True))
+                arguments.append(0)
+                after_call = True
+                continue
+            if is_call:
+                raise fail(f"неизвестная функция `{text}`")
+            emit(text)
+            expect_operand = False
+        elif text == "(":
+            if not expect_operand:
+                raise fail("пропущена операция перед `(`")
+            push((text, _OPEN, False))
+        elif text in ",)":
+            empty_call = (
+                text == ")" and tokens[index - 1] == "("
+                and pending[-1:] != [] and pending[-1][2]
+            )
+            if expect_operand and not empty_call:
+                raise fail(f"пропущен операнд перед `{text}`")
+            symbol, _, is_call = close(f"лишний символ `{text}`")
+            if text == ",":
+                if not is_call:
+                    raise fail("`,` вне вызова функции")
+                arguments[-1] += 1
+                push((symbol, _OPEN, True))
+                expect_operand = True
+                continue
+            if is_call:
+                count = arguments.pop() + (not empty_call)
+                emit(_call(symbol, count, fail))
+            expect_operand = False
+        elif expect_operand:
+            if text == "-":
+                push((UNARY_MINUS, UNARY_PRECEDENCE, True))
+            elif text != "+":
+                raise fail(f"пропущен операнд перед `{text}`")
+        else:
+            precedence, right = BINARY_OPERATORS[text]
+            while pending and (
+                pending[-1][1] > precedence
+                or pending[-1][1] == precedence and not right
+            ):
+                emit(pending.pop()[0])
+            push((text, precedence, right))
+            expect_operand = True
+    if expect_operand:
+        raise fail("формула не закончена")
+    while pending:
+        symbol, precedence, _ = pending.pop()
+        if precedence == _OPEN:
+            raise fail("не закрыта скобка")
+        emit(symbol)
+    return tuple(output)
+
+
+def _call(symbol: str, count: int, fail) -> str:
+    """Возвращает токен вызова операции с `count` аргументами."""
+    entry = Calculator.ACTIONS.entries[symbol]
+    if count == entry.arity:
+        return symbol
+    if not entry.variadic:
+        raise fail(
+            f"`{symbol}` ожидает {entry.arity} аргумент(а), передано {count}"
+        )
+    if count < entry.min_arity:
+        raise fail(
+            f"`{symbol}` ожидает не меньше {entry.min_arity} аргумент(а), "
+            f"передано {count}"
+        )
+    return f"{symbol}/{count}"
+
+
+class InfixCalculator(ReversePolishCalculator):
+    """Калькулятор инфиксных формул.
+
+    Формула переводится в обратную польскую нотацию функцией `to_rpn`
+    и вычисляется как в `ReversePolishCalculator`, поэтому `/` - целая
+    часть от деления для `int`. Строковые формулы `get_result` и
+    `compile` кэшируются уже скомпилированными, `optimize` возвращает
+    токены в обратной польской нотации.
+
+    Examples:
+        >>> calculator = InfixCalculator()
+        >>> calculator.get_result("2 * (3 + 4) - -1")
+        15
+        >>> calculator.compile("(a + 1) * (2 + 3)")
+        Program: a 1 + 5 *
+    """
+
+    @staticmethod
+    def _normal_input_data(data: Sequence, typ=int) -> list:
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            data = bytes(data).decode()
+        elif not isinstance(data, str):
+            data = " ".join(map(str, data))
+        return to_rpn(data)
@@ -0,0 +1,170 @@
+import argparse
+import mmap
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Sequence, TextIO, Tuple
+
+from calculator import ReversePolishCalculator
+
+CHUNK_SIZE = 1 << 20
+
+
+def split_chunks(
+    path: str, chunk_size: int = CHUNK_SIZE
+) -> Iterator[Tuple[int, int]]:
+    """Делит файл на диапазоны байт, выровненные по концам строк.
+
+    Args:
+        path (str): Путь к файлу с выражениями.
+        chunk_size (int, optional): Желаемый размер диапазона в байтах.
+        Defaults to CHUNK_SIZE.
+
+    Raises:
+        ValueError: Размер диапазона не натуральное число.
+
+    Yields:
+        Tuple[int, int]: Начало и конец (не включая) диапазона.
+    """
+    if chunk_size < 1:
+        raise ValueError(
+            "Значение `chunk_size` должно быть натуральным числом."
+        )
+    size = os.path.getsize(path)
+    if not size:
+        return
+    with open(path, "rb") as file, mmap.mmap(
+        file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as data:
+        start = 0
+        while start < size:
+            end = data.find(b"\n", min(start + chunk_size, size) - 1)
+            end = size if end == -1 else end + 1
+            yield start, end
+            start = end
+
+
+def evaluate_chunk(
+    path: str, start: int, end: int, typ=int
+) -> Tuple[str, List[Tuple[int, str]], int]:
+    """Вычисляет выражения из диапазона байт файла.
+
+    Выполняется в отдельном процессе. Результаты строк возвращаются одним
+    текстом, чтобы не передавать между процессами объект на каждую строку.
+
+    Args:
+        path (str): Путь к файлу с выражениями.
+        start (int): Начало диапазона.
+        end (int): Конец диапазона (не включая).
+        typ (_type_, optional): Тип чисел для вычислений.
+        Defaults to int.
+
+    Returns:
+        Tuple[str, list, int]: Результаты, ошибки в виде пар
+        (номер строки в диапазоне, описание) и количество строк.
+    """
+    with open(path, "rb") as file, mmap.mmap(
+        file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as data:
+        lines = data[start:end].decode("utf-8").split("\n")
+    if not lines[-1]:
+        lines.pop()
+
+    calculator = ReversePolishCalculator()
+    results: list = []
+    errors: list = []
+    for number, line in enumerate(lines, 1):
+        if not line or line.isspace():
+            continue
+        try:
+            results.append(str(calculator.get_result(line, typ)))
+        except Exception as error:
+            results.append("error")
+            errors.append((number, repr(error)))
+    if results:
+        results.append("")
+    return "\n".join(results), errors, len(lines)
+
+
+def evaluate_file(
+    path: str, output: TextIO, errors: Optional[TextIO] = None,
+    workers: Optional[int] = None, chunk_size: int = CHUNK_SIZE, typ=int
+) -> int:
+    """Параллельно вычисляет файл выражений в обратной польской нотации.
+
+    Файл делится на диапазоны байт, которые вычисляются пулом процессов.
+    Результаты пишутся в `output` в исходном порядке строк, в формате
+    `calculator.evaluate_stream`. Одновременно в работе находится не
+    больше `2 * workers` диапазонов, поэтому память не растёт с размером
+    файла.
+
+    Args:
+        path (str): Путь к файлу с выражениями.
+        output (TextIO): Поток для результатов.
+        errors (TextIO, optional): Поток для описания ошибок.
+        Defaults to None.
+        workers (int, optional): Количество процессов.
+        Defaults to os.cpu_count().
+        chunk_size (int, optional): Размер диапазона в байтах.
+        Defaults to CHUNK_SIZE.
+        typ (_type_, optional): Тип чисел для вычислений.
+        Defaults to int.
+
+    Returns:
+        int: Количество строк с ошибками.
+    """
+    workers = workers or os.cpu_count() or 1
+    failed: int = 0
+    offset: int = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: deque = deque()
+        chunks = split_chunks(path, chunk_size)
+        while True:
+            for start, end in chunks:
+                pending.append(
+                    executor.submit(evaluate_chunk, path, start, end, typ)
+                )
+                if len(pending) >= 2 * workers:
+                    break
+            if not pending:
+                break
+            text, chunk_errors, lines = pending.popleft().result()
+            output.write(text)
+            failed += len(chunk_errors)
+            if errors is not None:
+                for number, error in chunk_errors:
+                    errors.write(f"{offset + number}: {error}\n")
+            offset += lines
+    return failed
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Параллельное вычисление файла выражений."
+    )
+    parser.add_argument("file", help="Файл с выражениями.")
+    parser.add_argument(
+        "-w", "--workers", type=int, default=None,
+        help="Количество процессов (по умолчанию - число ядер)."
+    )
+    parser.add_argument(
+        "-c", "--chunk-size", type=int, default=CHUNK_SIZE,
+        help="Размер диапазона файла в байтах."
+    )
+    args = parser.parse_args(argv)
+
+    # `sys.stdout` буферизуется блоками, если вывод не терминал.
+    output = sys.stdout
+    try:
+        failed = evaluate_file(
+            args.file, output, sys.stderr, args.workers, args.chunk_size
+        )
+    finally:
+        output.flush()
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
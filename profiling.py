@@ -0,0 +1,311 @@
+import time
+from functools import lru_cache
+from typing import Callable, Dict, Optional
+
+from calculator import (
+    COMPILE_CACHE_SIZE, Calculator, OperatorRegistry, PolishCalculator,
+    Program
+)
+
+PROMETHEUS_PREFIX = "calculator"
+
+
+def _escape(value: str) -> str:
+    """Экранирует значение метки в текстовом формате Prometheus.
+
+    Examples:
+        >>> _escape('a"b\\\\c')
+        'a\\\\"b\\\\\\\\c'
+    """
+    return (
+        value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    )
+
+
+class Profiler:
+    """Профилирование вычислений калькуляторов.
+
+    Пока профилирование включено (`enable` или `with`),
+    `Calculator.ACTIONS` заменён собственным реестром профилировщика с
+    теми же операциями, обёрнутыми подсчётом вызовов и времени, а
+    разбор (`PolishCalculator._compile`) и вычисление
+    (`PolishCalculator._run`, `Program.evaluate`) - обёртками с учётом
+    времени, обработанных токенов и наибольшей глубины стека. Общий
+    реестр и его версия не изменяются. `disable` возвращает исходные
+    объекты, поэтому выключенное профилирование не добавляет во
+    внутренние циклы ни одной проверки.
+
+    Выражения компилируются в собственный кэш профилировщика, поэтому
+    компилируются заново и попадают в статистику разбора, а после
+    выключения общий кэш не возвращает программы с обёртками.
+    Программа, сохранённая во время профилирования, продолжает вызывать
+    обёртки, но после выключения они ничего не считают. Вызовы операций
+    при свёртке констант тоже учитываются. Для обратной польской нотации
+    без компиляции токены разбираются лениво, и их разбор входит во
+    время вычисления. Операции, зарегистрированные во время
+    профилирования, действуют до выключения. Одновременно может быть
+    включён только один профилировщик.
+
+    Attributes:
+        operators (dict): Символ операции -> [вызовы, секунды].
+        tokens (int): Количество обработанных при вычислении токенов.
+        max_stack_depth (int): Наибольшая глубина стека.
+        parse_count (int): Количество разборов выражений.
+        parse_seconds (float): Время разбора.
+        evaluate_count (int): Количество вычислений.
+        evaluate_seconds (float): Время вычисления.
+
+    Examples:
+        >>> from calculator import ReversePolishCalculator
+        >>> with Profiler() as profiler:
+        ...     ReversePolishCalculator().get_result(["3", "2", "*"])
+        6
+        >>> profiler.operators["*"][0], profiler.tokens
+        (1, 3)
+    """
+    __active: Optional["Profiler"] = None
+
+    def __init__(self) -> None:
+        self.reset()
+        self.__restore: list = []
+
+    def __enter__(self) -> "Profiler":
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.disable()
+
+    @property
+    def enabled(self) -> bool:
+        return Profiler.__active is self
+
+    def reset(self) -> None:
+        """Обнуляет собранную статистику."""
+        self.operators: Dict[str, list] = {}
+        self.tokens: int = 0
+        self.max_stack_depth: int = 0
+        self.parse_count: int = 0
+        self.parse_seconds: float = 0.0
+        self.evaluate_count: int = 0
+        self.evaluate_seconds: float = 0.0
+        self.__program_depths: Dict[Program, int] = {}
+
+    def enable(self) -> None:
+        """Включает профилирование.
+
+        Raises:
+            RuntimeError: Уже включён другой профилировщик.
+        """
+        if Profiler.__active is not None:
+            if Profiler.__active is self:
+                return
+            raise RuntimeError("Профилирование уже включено.")
+        Profiler.__active = self
+
+        actions = Calculator.ACTIONS
+        for symbol in actions:
+            self.operators.setdefault(symbol, [0, 0.0])
+        profiled = OperatorRegistry({
+            symbol: action._replace(
+                function=self.__timed_operator(symbol, action.function)
+            )
+            for symbol, action in actions.entries.items()
+        })
+        # У реестра своя версия, поэтому кэши, зависящие от версии
+        # (например, `infix`), не смешивают его записи с общим реестром.
+        self.__patch(Calculator, "ACTIONS", profiled)
+        self.__patch(PolishCalculator, "_compile", self.__timed_compile)
+        self.__patch(
+            PolishCalculator, "_compile_cached",
+            classmethod(lru_cache(maxsize=COMPILE_CACHE_SIZE)(
+                lambda cls, data, typ, optimize, version: cls._compile(
+                    data, typ, optimize
+                )
+            ))
+        )
+        self.__patch(PolishCalculator, "_run", self.__timed_run)
+        evaluate = self.__timed_evaluate(Program.evaluate)
+        self.__patch(Program, "evaluate", evaluate)
+        self.__patch(Program, "__call__", evaluate)
+
+    def disable(self) -> None:
+        """Выключает профилирование и возвращает исходные объекты."""
+        if Profiler.__active is not self:
+            return
+        while self.__restore:
+            self.__restore.pop()()
+        self.__program_depths.clear()
+        Profiler.__active = None
+
+    def __patch(self, owner: type, name: str, replacement) -> None:
+        original = owner.__dict__[name]
+        setattr(owner, name, replacement)
+        self.__restore.append(lambda: setattr(owner, name, original))
+
+    def __timed_operator(self, symbol: str, function: Callable) -> Callable:
+        stats = self.operators[symbol]
+        clock = time.perf_counter
+        profiler = self
+
+        def timed(*operands):
+            if Profiler.__active is not profiler:
+                return function(*operands)
+            start = clock()
+            try:
+                return function(*operands)
+            finally:
+                stats[1] += clock() - start
+                stats[0] += 1
+
+        timed.__wrapped__ = function
+        return timed
+
+    @property
+    def __timed_compile(self) -> classmethod:
+        compile_program = PolishCalculator.__dict__["_compile"].__func__
+        profiler = self
+
+        def _compile(cls, data, typ, optimize=True):
+            start = time.perf_counter()
+            try:
+                return compile_program(cls, data, typ, optimize)
+            finally:
+                profiler.parse_seconds += time.perf_counter() - start
+                profiler.parse_count += 1
+
+        return classmethod(_compile)
+
+    @property
+    def __timed_run(self) -> Callable:
+        run = PolishCalculator.__dict__["_run"]
+        profiler = self
+
+        def _run(calculator, tokens, typ, numbers):
+            def counted():
+                for token in tokens:
+                    yield token
+                    profiler.tokens += 1
+                    if len(numbers) > profiler.max_stack_depth:
+                        profiler.max_stack_depth = len(numbers)
+
+            start = time.perf_counter()
+            try:
+                return run(calculator, counted(), typ, numbers)
+            finally:
+                profiler.evaluate_seconds += time.perf_counter() - start
+                profiler.evaluate_count += 1
+
+        return _run
+
+    def __timed_evaluate(self, evaluate: Callable) -> Callable:
+        profiler = self
+
+        def timed_evaluate(program, **variables):
+            depth = profiler.__program_depths.get(program)
+            if depth is None:
+                depth = profiler.__program_depths[program] = (
+                    _stack_depth(program.tokens)
+                )
+            profiler.max_stack_depth = max(profiler.max_stack_depth, depth)
+            profiler.tokens += len(program.tokens)
+            start = time.perf_counter()
+            try:
+                return evaluate(program, **variables)
+            finally:
+                profiler.evaluate_seconds += time.perf_counter() - start
+                profiler.evaluate_count += 1
+
+        return timed_evaluate
+
+    def snapshot(self) -> dict:
+        """Возвращает статистику в виде словаря.
+
+        Examples:
+            >>> snapshot = Profiler().snapshot()
+            >>> sorted(snapshot)  # doctest: +NORMALIZE_WHITESPACE
+            ['evaluate_count', 'evaluate_seconds', 'max_stack_depth',
+             'operators', 'parse_count', 'parse_seconds', 'tokens']
+        """
+        return {
+            "operators": {
+                symbol: {"count": count, "seconds": seconds}
+                for symbol, (count, seconds) in self.operators.items()
+            },
+            "tokens": self.tokens,
+            "max_stack_depth": self.max_stack_depth,
+            "parse_count": self.parse_count,
+            "parse_seconds": self.parse_seconds,
+            "evaluate_count": self.evaluate_count,
+            "evaluate_seconds": self.evaluate_seconds,
+        }
+
+    def to_prometheus(self, prefix: str = PROMETHEUS_PREFIX) -> str:
+        """Возвращает статистику в текстовом формате Prometheus.
+
+        Examples:
+            >>> print(Profiler().to_prometheus().splitlines()[-1])
+            calculator_evaluate_seconds_total 0.0
+        """
+        lines: list = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            for labels, value in samples:
+                lines.append(f"{prefix}_{name}{labels} {value}")
+
+        def by_operator(index):
+            return [
+                (f'{{operator="{_escape(symbol)}"}}', stats[index])
+                for symbol, stats in self.operators.items()
+            ]
+
+        metric(
+            "operator_calls_total", "counter",
+            "Вызовы операции.", by_operator(0)
+        )
+        metric(
+            "operator_seconds_total", "counter",
+            "Время выполнения операции.", by_operator(1)
+        )
+        metric(
+            "tokens_total", "counter",
+            "Обработанные при вычислении токены.", [("", self.tokens)]
+        )
+        metric(
+            "stack_depth_max", "gauge",
+            "Наибольшая глубина стека.", [("", self.max_stack_depth)]
+        )
+        metric(
+            "parse_total", "counter",
+            "Разборы выражений.", [("", self.parse_count)]
+        )
+        metric(
+            "parse_seconds_total", "counter",
+            "Время разбора выражений.", [("", self.parse_seconds)]
+        )
+        metric(
+            "evaluate_total", "counter",
+            "Вычисления выражений.", [("", self.evaluate_count)]
+        )
+        metric(
+            "evaluate_seconds_total", "counter",
+            "Время вычисления выражений.", [("", self.evaluate_seconds)]
+        )
+        return "\n".join(lines) + "\n"
+
+
+def _stack_depth(tokens) -> int:
+    """Наибольшая глубина стека при вычислении токенов в обратной нотации.
+
+    Examples:
+        >>> _stack_depth("1 2 3 + + 4 *".split())
+        3
+    """
+    depth = deepest = 0
+    for token in tokens:
+        action = Calculator.ACTIONS.resolve(token)
+        depth += 1 if action is None else 1 - action.arity
+        deepest = max(deepest, depth)
+    return deepest
@@ -0,0 +1,226 @@
+import argparse
+import asyncio
+from collections import deque
+from typing import Optional, Sequence
+
+from calculator import ReversePolishCalculator
+from deck_sync import AsyncDeck
+
+BATCH_SIZE = 256
+QUEUE_SIZE = 4096
+LINE_LIMIT = 1 << 20
+
+
+def evaluate_line(calculator: ReversePolishCalculator, line: bytes, typ=int):
+    """Вычисляет строку запроса и возвращает строку ответа.
+
+    Examples:
+        >>> calculator = ReversePolishCalculator()
+        >>> evaluate_line(calculator, b"4 13 5 / +\\n")
+        '6\\n'
+        >>> evaluate_line(calculator, b"1 0 /\\n")
+        'error\\n'
+    """
+    try:
+        return f"{calculator.get_result(line.decode(), typ)}\n"
+    except Exception:
+        return "error\n"
+
+
+class EvaluationServer:
+    """Сервер вычисления выражений в обратной польской нотации.
+
+    Принимает по TCP или Unix-сокету строки с выражениями и отвечает
+    строкой с результатом или `error` на каждую строку запроса в том же
+    порядке. Клиент может отправлять запросы, не дожидаясь ответов.
+
+    Запросы всех соединений попадают в общую ограниченную очередь
+    `AsyncDeck`. Обработчики `workers` со своими экземплярами
+    `ReversePolishCalculator` забирают из неё до `batch_size` запросов
+    за одно пробуждение, а готовые подряд ответы соединения
+    отправляются одной записью. Заполненная очередь приостанавливает
+    чтение из соединений.
+
+    Обработчики - сопрограммы одного цикла событий, поэтому вычисления
+    не выполняются параллельно: больше одного обработчика имеет смысл,
+    только чтобы пакеты чередовались. Кэш скомпилированных выражений
+    (`PolishCalculator._compile_cached`) общий для всего процесса.
+
+    Attributes:
+        workers (int): Количество обработчиков.
+        batch_size (int): Наибольшее количество запросов в пакете.
+        queue_size (int): Размер очереди запросов и окна неотвеченных
+        запросов соединения.
+        typ (_type_): Тип чисел для вычислений.
+        __requests (AsyncDeck): Очередь пар (строка, future).
+        __tasks (list): Задачи обработчиков.
+
+    Examples:
+        >>> async def example():
+        ...     async with EvaluationServer() as server:
+        ...         return await server.evaluate("7 2 *")
+        >>> asyncio.run(example())
+        '14'
+    """
+
+    def __init__(
+        self, workers: int = 1, batch_size: int = BATCH_SIZE,
+        queue_size: int = QUEUE_SIZE, typ=int
+    ) -> None:
+        if workers < 1 or batch_size < 1:
+            raise ValueError(
+                "Значения `workers` и `batch_size` должны быть "
+                "натуральными числами."
+            )
+        self.workers = workers
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.typ = typ
+        self.__requests: Optional[AsyncDeck] = None
+        self.__tasks: list = []
+
+    async def __aenter__(self) -> "EvaluationServer":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    def start(self) -> None:
+        """Запускает обработчики в текущем цикле событий."""
+        if self.__tasks:
+            return
+        self.__requests = AsyncDeck(self.queue_size)
+        self.__tasks = [
+            asyncio.create_task(self.__work()) for _ in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        for task in self.__tasks:
+            task.cancel()
+        await asyncio.gather(*self.__tasks, return_exceptions=True)
+        self.__tasks = []
+
+    async def __work(self) -> None:
+        calculator = ReversePolishCalculator()
+        requests = self.__requests
+        typ = self.typ
+        while True:
+            batch = [await requests.pop_front()]
+            while len(batch) < self.batch_size and not requests.empty():
+                batch.append(requests.pop_front_nowait())
+            for line, future in batch:
+                if not future.done():
+                    future.set_result(evaluate_line(calculator, line, typ))
+            # Очередь может не пустеть, поэтому после пакета чтение и
+            # запись соединений получают управление явно.
+            await asyncio.sleep(0)
+
+    async def submit(self, line: bytes) -> asyncio.Future:
+        """Ставит строку в очередь и возвращает future строки ответа."""
+        future = asyncio.get_running_loop().create_future()
+        await self.__requests.push_back((line, future))
+        return future
+
+    async def evaluate(self, data: str) -> str:
+        """Вычисляет одно выражение без сетевого соединения."""
+        response = await (await self.submit(data.encode()))
+        return response.rstrip("\n")
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Обслуживает одно соединение."""
+        pending: deque = deque()
+        arrived = asyncio.Event()
+        window = asyncio.Semaphore(self.queue_size)
+
+        async def respond() -> None:
+            while True:
+                while not pending:
+                    arrived.clear()
+                    await arrived.wait()
+                future = pending.popleft()
+                if future is None:
+                    return
+                chunks = [await future]
+                while pending and pending[0] is not None and pending[0].done():
+                    chunks.append(pending.popleft().result())
+                for _ in chunks:
+                    window.release()
+                writer.write("".join(chunks).encode())
+                await writer.drain()
+
+        responder = asyncio.create_task(respond())
+        try:
+            async for line in reader:
+                await window.acquire()
+                pending.append(await self.submit(line))
+                arrived.set()
+            pending.append(None)
+            arrived.set()
+            await responder
+        except (ConnectionError, ValueError):
+            # ValueError - строка длиннее `LINE_LIMIT`.
+            pass
+        finally:
+            responder.cancel()
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def start_tcp(
+        self, host: str = "127.0.0.1", port: int = 0
+    ) -> asyncio.AbstractServer:
+        """Запускает сервер на TCP-порту (`0` - любой свободный)."""
+        self.start()
+        return await asyncio.start_server(
+            self.handle, host, port, limit=LINE_LIMIT
+        )
+
+    async def start_unix(self, path: str) -> asyncio.AbstractServer:
+        """Запускает сервер на Unix-сокете."""
+        self.start()
+        return await asyncio.start_unix_server(
+            self.handle, path, limit=LINE_LIMIT
+        )
+
+
+async def serve(args: argparse.Namespace) -> None:
+    async with EvaluationServer(
+        args.workers, args.batch_size, args.queue_size
+    ) as server:
+        if args.unix:
+            listener = await server.start_unix(args.unix)
+        else:
+            listener = await server.start_tcp(args.host, args.port)
+        async with listener:
+            await listener.serve_forever()
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Сервер вычисления выражений обратной польской нотации."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--unix", default=None, help="Путь к Unix-сокету вместо TCP."
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="Сопрограммы-обработчики в одном потоке (не параллельно)."
+    )
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--queue-size", type=int, default=QUEUE_SIZE)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,649 @@
+import io
+import os
+import operator
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+import calculator
+
+
+class TestTokenize(unittest.TestCase):
+    """Тестирование разбора выражений `calculator.tokenize`.
+    """
+    def test_numbers(self):
+        error_msg = "Некорректное работа функции: `tokenize()`"
+        self.assertEqual(
+            list(calculator.tokenize("-3 + -  +4 x1 _")),
+            [-3, "+", "-", 4, "x1", "_"],
+            error_msg
+        )
+        with self.assertRaises(ValueError, msg=error_msg):
+            list(calculator.tokenize("1 1-"))
+        self.assertEqual(
+            list(calculator.tokenize("1. .5 -2.5e-1 3E2", float)),
+            [1.0, 0.5, -0.25, 300.0],
+            error_msg
+        )
+        for data in ("1e3", "2 1.5 +", "7 -1e3 *"):
+            with self.assertRaisesRegex(ValueError, "типа `int`"):
+                list(calculator.tokenize(data))
+            with self.assertRaisesRegex(ValueError, "типа `int`"):
+                calculator.ReversePolishCalculator().get_result(data.split())
+
+    def test_bytes(self):
+        error_msg = "Некорректное работа функции: `tokenize()`"
+        expected = [7, 2, "+", "yä", "*", 1234]
+        for data in (
+            "7 2 + yä * 1234", b"7 2 + y\xc3\xa4 * 1234",
+            bytearray("7\t2\n+ yä *  1234".encode()),
+            memoryview("  7 2 + yä * 1234 ".encode()),
+        ):
+            for block_size in (1, 2, 3, 5, 64):
+                self.assertEqual(
+                    list(calculator.tokenize(data, block_size=block_size)),
+                    expected,
+                    error_msg
+                )
+        with self.assertRaises(TypeError, msg=error_msg):
+            calculator.tokenize(7)
+
+    def test_calculators(self):
+        error_msg = "Некорректное работа функции: `get_result()`"
+        self.assertEqual(
+            calculator.ReversePolishCalculator().get_result("-3 -4 -"), 1,
+            error_msg
+        )
+        self.assertEqual(
+            calculator.PolishCalculator().get_result(
+                memoryview(b"* -2.5 4"), float
+            ),
+            -10.0,
+            error_msg
+        )
+        self.assertEqual(
+            calculator.ReversePolishCalculator().compile("x1 2 *")(x1=4), 8,
+            error_msg
+        )
+
+
+class TestArrayStack(unittest.TestCase):
+    """Тестирование стека `calculator.ArrayStack`.
+    """
+    def test_matches_stack(self):
+        error_msg = "Некорректное работа функции: `ArrayStack`"
+        for typecode, values in (("q", [1, -3, 5, 7]), ("d", [0.5, 2.0])):
+            stack = calculator.Stack()
+            array_stack = calculator.ArrayStack(typecode)
+            for current in (stack, array_stack):
+                current.extend(values)
+                current.add(values[0])
+            self.assertEqual(len(array_stack), len(stack), error_msg)
+            self.assertEqual(array_stack.last(), stack.last(), error_msg)
+            self.assertEqual(
+                array_stack.get_operands(2), stack.get_operands(2),
+                error_msg
+            )
+            self.assertEqual(array_stack.pop(), stack.pop(), error_msg)
+            array_stack.clear()
+            self.assertEqual(len(array_stack), 0, error_msg)
+            with self.assertRaises(IndexError, msg=error_msg):
+                array_stack.pop()
+            with self.assertRaises(IndexError, msg=error_msg):
+                array_stack.last()
+
+    def test_calculator_overflow(self):
+        error_msg = "Некорректное работа функции: `get_result()`"
+        calc = calculator.ReversePolishCalculator()
+        big = str(2 ** 62)
+        self.assertEqual(
+            calc.get_result([big, big, "*", "1", "+"]), 2 ** 124 + 1,
+            error_msg
+        )
+        self.assertEqual(
+            calc.get_result(["7", "2", "/"], float), 3.0, error_msg
+        )
+        # Строки вычисляются на стеке `_get_stack`, а не в `Program`.
+        calc = calculator.ReversePolishCalculator()
+        data = " ".join(["1"] * 3000 + ["+"] * 2999)
+        self.assertEqual(calc.get_result(data), 3000, error_msg)
+        self.assertIsInstance(
+            calc._get_stack(int), calculator.ArrayStack, error_msg
+        )
+        self.assertEqual(
+            calc.get_result(f"{big} {big} * 1 +"), 2 ** 124 + 1, error_msg
+        )
+        self.assertIsInstance(
+            calc._get_stack(int), calculator.Stack, error_msg
+        )
+
+    def test_calculator_float_result(self):
+        error_msg = "Некорректное работа функции: `get_result()`"
+
+        class DivCalculator(calculator.ReversePolishCalculator):
+            ACTIONS = calculator.OperatorRegistry(
+                calculator.Calculator.ACTIONS.entries
+            )
+
+        DivCalculator.ACTIONS.register("div", operator.truediv)
+        calc = DivCalculator()
+        self.assertEqual(calc.get_result("7 2 div"), 3.5, error_msg)
+        self.assertIsInstance(
+            calc._get_stack(int), calculator.Stack, error_msg
+        )
+        calc = calculator.ReversePolishCalculator()
+        self.assertEqual(calc.get_result([1.5, 2, "+"]), 3.5, error_msg)
+
+
+class TestCalculator(unittest.TestCase):
+    """Тестирование `calculator.PolishCalculator.get_result`.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.error_func_msg = "Некорректное работа функции: "
+
+    def test_state_reset(self):
+        error_msg = f"{TestCalculator.error_func_msg}`get_result()`"
+        for calc, division in (
+            (calculator.PolishCalculator(), ["/", "1", "0"]),
+            (calculator.ReversePolishCalculator(), ["1", "0", "/"]),
+        ):
+            self.assertEqual(calc.get_result(["1", "1"]), 1, error_msg)
+            with self.assertRaises(IndexError, msg=error_msg):
+                calc.get_result(["+"])
+            with self.assertRaises(ZeroDivisionError, msg=error_msg):
+                calc.get_result(division)
+            with self.assertRaises(IndexError, msg=error_msg):
+                calc.get_result(["+"])
+
+    def test_sequence_input(self):
+        error_msg = f"{TestCalculator.error_func_msg}`get_result()`"
+        self.assertEqual(
+            calculator.PolishCalculator().get_result(("-", "13", "4")), 9,
+            error_msg
+        )
+        self.assertEqual(
+            calculator.ReversePolishCalculator().get_result(
+                ["13", "4", "-"]
+            ), 9,
+            error_msg
+        )
+        with self.assertRaises(AttributeError, msg=error_msg):
+            calculator.ReversePolishCalculator().get_result(["1", "2", "%"])
+
+
+class TestOperatorRegistry(unittest.TestCase):
+    """Тестирование операций с разным количеством операндов.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.polish = calculator.PolishCalculator()
+        cls.reverse = calculator.ReversePolishCalculator()
+        cls.error_func_msg = "Некорректное работа функции: "
+
+    def test_arity(self):
+        error_msg = f"{TestOperatorRegistry.error_func_msg}`get_result()`"
+        expressions = (
+            ("7 neg 2 -", "- neg 7 2", -9),
+            ("17 sqrt", "sqrt 17", 4),
+            ("1 2 3 sum/3 10 -", "- sum/3 1 2 3 10", -4),
+            ("3 9 max 4 -", "- max 3 9 4", 5),
+            ("8 1 5 2 min/4", "min/4 8 1 5 2", 1),
+            ("10 4 3 2 - - -", "- 10 - 4 - 3 2", 7),
+        )
+        for postfix, prefix, expected in expressions:
+            for calc, data in (
+                (TestOperatorRegistry.reverse, postfix),
+                (TestOperatorRegistry.polish, prefix),
+            ):
+                self.assertEqual(calc.get_result(data), expected, error_msg)
+                self.assertEqual(
+                    calc.get_result(data.split()), expected, error_msg
+                )
+                self.assertEqual(
+                    calc.compile(data, optimize=False)(), expected, error_msg
+                )
+
+    def test_compiled_variables(self):
+        error_msg = f"{TestOperatorRegistry.error_func_msg}`Program`"
+        program = TestOperatorRegistry.reverse.compile("x neg y z sum/3")
+        self.assertEqual(program(x=1, y=5, z=7), 11, error_msg)
+        self.assertEqual(
+            [int(value) for value in program.evaluate_batch(
+                x=[1, 2], y=[3, 4], z=[5, 6]
+            )],
+            [7, 8],
+            error_msg
+        )
+        program = TestOperatorRegistry.reverse.compile("x y max sqrt")
+        self.assertEqual(
+            list(program.evaluate_batch(x=[1, 16], y=[9, 2])), [3, 4],
+            error_msg
+        )
+        with self.assertRaises(IndexError, msg=error_msg):
+            TestOperatorRegistry.reverse.compile("1 2 sum/3")
+        with self.assertRaises(AttributeError, msg=error_msg):
+            TestOperatorRegistry.reverse.compile("1 2 neg/2")
+        for data in ("5 max/1", "5 min/1"):
+            self.assertIsNone(
+                calculator.Calculator.ACTIONS.resolve(data.split()[1]),
+                error_msg
+            )
+            with self.assertRaises(AttributeError, msg=error_msg):
+                TestOperatorRegistry.reverse.compile(data)
+            with self.assertRaises(AttributeError, msg=error_msg):
+                TestOperatorRegistry.reverse.get_result(data)
+        self.assertEqual(
+            TestOperatorRegistry.reverse.get_result("5 sum/1"), 5, error_msg
+        )
+
+    def test_calculation(self):
+        error_msg = f"{TestOperatorRegistry.error_func_msg}`calculation()`"
+        self.assertEqual(
+            calculator.Calculator.calculation("neg", (3,)), -3, error_msg
+        )
+        with self.assertRaises(ValueError, msg=error_msg):
+            calculator.Calculator.calculation("neg", (3, 4))
+        with self.assertRaises(AttributeError, msg=error_msg):
+            calculator.Calculator.calculation("%", (3, 4))
+
+    def test_register(self):
+        error_msg = f"{TestOperatorRegistry.error_func_msg}`register()`"
+
+        class ModCalculator(calculator.ReversePolishCalculator):
+            ACTIONS = calculator.OperatorRegistry(
+                calculator.Calculator.ACTIONS.entries
+            )
+
+        calc = ModCalculator()
+        with self.assertRaises(AttributeError, msg=error_msg):
+            calc.get_result("7 3 %")
+        program = calc.compile("7 3 +")
+        ModCalculator.ACTIONS.register("%", lambda x, y: x % y)
+        self.assertEqual(calc.get_result("7 3 %"), 1, error_msg)
+        self.assertIsNot(calc.compile("7 3 +"), program, error_msg)
+        with self.assertRaises(AttributeError, msg=error_msg):
+            TestOperatorRegistry.reverse.get_result("7 3 %")
+        for symbol, arity in (("", 2), ("a b", 2), ("-1", 2), ("f", 0)):
+            with self.assertRaises(ValueError, msg=error_msg):
+                ModCalculator.ACTIONS.register(symbol, abs, arity)
+
+
+class TestProgram(unittest.TestCase):
+    """Тестирование компиляции выражений `calculator.Program`.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.polish = calculator.PolishCalculator()
+        cls.reverse = calculator.ReversePolishCalculator()
+        cls.error_func_msg = "Некорректное работа функции: "
+
+    def test_compile_matches_get_result(self):
+        error_msg = f"{TestProgram.error_func_msg}`compile()`"
+        expressions = (
+            (TestProgram.polish, "- * 5 8 3", 37),
+            (TestProgram.polish, "/ 13 5", 2),
+            (TestProgram.reverse, "7 2 + 4 * 2 +", 38),
+            (TestProgram.reverse, "4 13 5 / +", 6),
+        )
+        for calc, data, expected in expressions:
+            self.assertEqual(
+                calc.compile(data).evaluate(), expected, error_msg
+            )
+            self.assertEqual(
+                calc.get_result(data), expected, error_msg
+            )
+            self.assertEqual(
+                calc.get_result(data.split()), expected, error_msg
+            )
+
+    def test_variables(self):
+        error_msg = f"{TestProgram.error_func_msg}`Program.evaluate()`"
+        program = TestProgram.reverse.compile("x 2 * y +")
+        self.assertEqual(program.variables, ("x", "y"), error_msg)
+        self.assertEqual(program(x=7, y=3), 17, error_msg)
+        self.assertEqual(program(x=-1, y=0), -2, error_msg)
+        with self.assertRaises(NameError, msg=error_msg):
+            program(x=1)
+
+    def test_cache(self):
+        error_msg = f"{TestProgram.error_func_msg}`compile()`"
+        program = TestProgram.reverse.compile("1 2 +")
+        self.assertIs(
+            TestProgram.reverse.compile("1 2 +"), program, error_msg
+        )
+        self.assertIsNot(
+            TestProgram.reverse.compile("1 2 +", float), program, error_msg
+        )
+        self.assertIsNot(
+            TestProgram.polish.compile("+ 1 2"), program, error_msg
+        )
+        data = " ".join(["1"] * 3000 + ["+"] * 2999)
+        self.assertGreater(len(data), calculator.COMPILE_TEXT_LIMIT)
+        self.assertIsNot(
+            TestProgram.reverse.compile(data),
+            TestProgram.reverse.compile(data), error_msg
+        )
+
+    def test_get_result_cache(self):
+        error_msg = f"{TestProgram.error_func_msg}`get_result()`"
+        cached = calculator.PolishCalculator._compile_cached
+        cached.cache_clear()
+        calc = calculator.ReversePolishCalculator()
+        for _ in range(3):
+            self.assertEqual(calc.get_result("2 3 4 * +"), 14, error_msg)
+        # Первое вычисление на стеке, второе компилирует, третье из кэша.
+        self.assertEqual(cached.cache_info()[:2], (1, 1), error_msg)
+        data = " ".join(["1"] * 3000 + ["+"] * 2999)
+        for _ in range(2):
+            self.assertEqual(calc.get_result(data), 3000, error_msg)
+        self.assertEqual(cached.cache_info().currsize, 1, error_msg)
+        for _ in range(2):
+            with self.assertRaises(AttributeError, msg=error_msg):
+                calc.get_result("1 2 mod")
+            with self.assertRaises(AttributeError, msg=error_msg):
+                TestProgram.polish.get_result("mod 1 2")
+
+    def test_errors(self):
+        error_msg = f"{TestProgram.error_func_msg}`compile()`"
+        with self.assertRaises(IndexError, msg=error_msg):
+            TestProgram.reverse.compile("1 +")
+        with self.assertRaises(IndexError, msg=error_msg):
+            TestProgram.polish.compile("+ 1")
+        with self.assertRaises(IndexError, msg=error_msg):
+            TestProgram.reverse.compile("")
+        with self.assertRaises(AttributeError, msg=error_msg):
+            TestProgram.reverse.compile("1 2 %")
+
+
+class TestCodegen(unittest.TestCase):
+    """Тестирование генерации функций `calculator.Program.to_function`.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.polish = calculator.PolishCalculator()
+        cls.reverse = calculator.ReversePolishCalculator()
+        cls.error_func_msg = "Некорректное работа функции: "
+
+    def test_source(self):
+        error_msg = f"{TestCodegen.error_func_msg}`to_function()`"
+        cases = (
+            (TestCodegen.reverse, "x 2 * y +", "x * 2 + y"),
+            (TestCodegen.polish, "+ * x 2 y", "x * 2 + y"),
+            (TestCodegen.reverse, "x y z - -", "x - (y - z)"),
+            (TestCodegen.reverse, "x y - z -", "x - y - z"),
+            (TestCodegen.reverse, "x y + z /", "(x + y) // z"),
+            (TestCodegen.reverse, "x neg -3 *", "-x * -3"),
+            (TestCodegen.reverse, "x y - neg", "-(x - y)"),
+        )
+        for calc, data, expected in cases:
+            function = calc.compile(data).to_function()
+            self.assertEqual(
+                function.source_code.splitlines()[-1],
+                f"    return {expected}", error_msg
+            )
+        program = TestCodegen.reverse.compile("x 2 * y +")
+        self.assertIs(program.to_function(), program.to_function(), error_msg)
+        with self.assertRaises(ValueError, msg=error_msg):
+            TestCodegen.reverse.compile("if 1 +").to_function()
+
+    def test_matches_evaluate(self):
+        error_msg = f"{TestCodegen.error_func_msg}`to_function()`"
+        rng = random.Random(25)
+        tokens = ("x", "y", "_f0", "3", "-7", "0")
+        operators = (
+            "+", "-", "*", "/", "neg", "sqrt", "sum/3", "max", "min/4"
+        )
+        for length in (1, 5, 40, 400):
+            for _ in range(20):
+                expression = [rng.choice(tokens)]
+                depth = 1
+                for _ in range(length):
+                    symbol = rng.choice(operators)
+                    arity = calculator.Calculator.ACTIONS.resolve(
+                        symbol
+                    ).arity
+                    while depth < arity or rng.random() < 0.5:
+                        expression.append(rng.choice(tokens))
+                        depth += 1
+                    expression.append(symbol)
+                    depth -= arity - 1
+                expression += ["+"] * (depth - 1)
+                program = TestCodegen.reverse.compile(expression)
+                function = program.to_function()
+                values = {
+                    name: rng.randint(0, 50) for name in program.variables
+                }
+                results = []
+                for run in (program, function):
+                    try:
+                        results.append(run(**values))
+                    except (ZeroDivisionError, ValueError) as error:
+                        results.append(type(error))
+                self.assertEqual(results[0], results[1], error_msg)
+
+    def test_right_deep(self):
+        error_msg = f"{TestCodegen.error_func_msg}`to_function()`"
+        # Выносы во временные переменные не повторяются для нижней части
+        # стека, поэтому генерация длинного выражения линейна.
+        program = TestCodegen.reverse.compile(
+            ["x", "y"] * 2000 + ["-"] * 3999
+        )
+        self.assertEqual(
+            program.to_function()(5, 2), program(x=5, y=2), error_msg
+        )
+
+
+class TestOptimizer(unittest.TestCase):
+    """Тестирование свёртки констант `PolishCalculator.optimize`.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.polish = calculator.PolishCalculator()
+        cls.reverse = calculator.ReversePolishCalculator()
+        cls.error_func_msg = "Некорректное работа функции: "
+
+    @staticmethod
+    def random_postfix(rng, size):
+        tokens = [rng.choice(("x", "y", str(rng.randint(-9, 20))))]
+        for _ in range(size):
+            operand = rng.choice(("x", "y", str(rng.randint(1, 20))))
+            if rng.random() < 0.5:
+                tokens = [operand] + tokens + [rng.choice("+-*/")]
+            else:
+                tokens += [operand, rng.choice("+-*/")]
+        return tokens
+
+    def test_fold(self):
+        error_msg = f"{TestOptimizer.error_func_msg}`optimize()`"
+        self.assertEqual(
+            TestOptimizer.reverse.optimize("3 4 * x +"), ["12", "x", "+"],
+            error_msg
+        )
+        self.assertEqual(
+            TestOptimizer.reverse.optimize("x 3 4 - 2 / *"),
+            ["x", "-1", "*"],
+            error_msg
+        )
+        self.assertEqual(
+            TestOptimizer.reverse.optimize("7 2 /", float), ["3.0"],
+            error_msg
+        )
+        self.assertEqual(
+            TestOptimizer.reverse.optimize("x 1 0 / +"),
+            ["x", "1", "0", "/", "+"],
+            error_msg
+        )
+        self.assertEqual(
+            TestOptimizer.polish.optimize("+ x * 3 4"), ["+", "x", "12"],
+            error_msg
+        )
+
+    def test_huge_int(self):
+        error_msg = f"{TestOptimizer.error_func_msg}`optimize()`"
+        # Произведение длиннее предела перевода `int` в строку.
+        data = "1" + " 1000000000 *" * 500
+        expected = 10 ** 4500
+        calc = calculator.ReversePolishCalculator()
+        for _ in range(3):
+            self.assertEqual(calc.get_result(data), expected, error_msg)
+        self.assertEqual(calc.compile(data)(), expected, error_msg)
+        tokens = calc.optimize(data)
+        self.assertEqual(tokens[-2:], ["1000000000", "*"], error_msg)
+        self.assertEqual(calc.get_result(tokens), expected, error_msg)
+
+    def test_results_unchanged(self):
+        error_msg = f"{TestOptimizer.error_func_msg}`optimize()`"
+        rng = random.Random(7)
+        values = [{"x": x, "y": y} for x in (-7, 3, 11) for y in (-2, 5)]
+        for _ in range(200):
+            postfix = TestOptimizer.random_postfix(rng, rng.randint(1, 12))
+            prefix = calculator._emit_prefix(
+                calculator._build_tree(
+                    postfix, calculator.Calculator.ACTIONS, True
+                )
+            )
+            for calc, tokens in (
+                (TestOptimizer.reverse, postfix),
+                (TestOptimizer.polish, prefix),
+            ):
+                for typ in (int, float):
+                    plain = calc.compile(tokens, typ, optimize=False)
+                    folded = calc.compile(tokens, typ)
+                    self.assertLessEqual(
+                        len(folded.tokens), len(plain.tokens), error_msg
+                    )
+                    for variables in values:
+                        try:
+                            expected = plain(**variables)
+                        except ZeroDivisionError:
+                            with self.assertRaises(
+                                ZeroDivisionError, msg=error_msg
+                            ):
+                                folded(**variables)
+                            continue
+                        self.assertEqual(
+                            folded(**variables), expected, error_msg
+                        )
+
+
+class TestBatch(unittest.TestCase):
+    """Тестирование пакетного вычисления `Program.evaluate_batch`.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.reverse = calculator.ReversePolishCalculator()
+        cls.error_func_msg = "Некорректное работа функции: "
+        cls.columns = {
+            "x": [7, -7, 0, 13, -13],
+            "y": [2, 2, 5, -4, -4],
+        }
+
+    def test_matches_scalar(self):
+        error_msg = f"{TestBatch.error_func_msg}`evaluate_batch()`"
+        for data in ("x y /", "x y - 3 *", "x 2 + y y * -"):
+            program = TestBatch.reverse.compile(data)
+            expected = [
+                program(x=x, y=y)
+                for x, y in zip(TestBatch.columns["x"], TestBatch.columns["y"])
+            ]
+            result = program.evaluate_batch(**TestBatch.columns)
+            self.assertEqual(
+                [int(value) for value in result], expected, error_msg
+            )
+
+    def test_errors(self):
+        error_msg = f"{TestBatch.error_func_msg}`evaluate_batch()`"
+        program = TestBatch.reverse.compile("x y /")
+        with self.assertRaises(ZeroDivisionError, msg=error_msg):
+            program.evaluate_batch(x=[1, 2], y=[1, 0])
+        with self.assertRaises(ValueError, msg=error_msg):
+            program.evaluate_batch(x=[1, 2], y=[1])
+        with self.assertRaises(NameError, msg=error_msg):
+            program.evaluate_batch(x=[1, 2])
+
+    @unittest.skipIf(calculator.np is None, "NumPy не установлен")
+    def test_numpy_columns(self):
+        error_msg = f"{TestBatch.error_func_msg}`evaluate_batch()`"
+        np = calculator.np
+        result = TestBatch.reverse.get_batch_result(
+            "x y / 1 +",
+            x=np.array(TestBatch.columns["x"]),
+            y=np.array(TestBatch.columns["y"]),
+        )
+        self.assertIsInstance(result, np.ndarray, error_msg)
+        self.assertEqual(result.tolist(), [4, -3, 1, -3, 4], error_msg)
+
+    def test_big_integers(self):
+        error_msg = f"{TestBatch.error_func_msg}`evaluate_batch()`"
+        reverse = TestBatch.reverse
+        result = reverse.compile("x x *").evaluate_batch(x=[2 ** 40, 3])
+        self.assertEqual(
+            [int(value) for value in result], [2 ** 80, 9], error_msg
+        )
+        result = reverse.compile("x 99999999999999999999 *").evaluate_batch(
+            x=[1, 2]
+        )
+        self.assertEqual(
+            [int(value) for value in result],
+            [99999999999999999999, 199999999999999999998],
+            error_msg
+        )
+
+    @unittest.skipIf(calculator.np is None, "NumPy не установлен")
+    def test_numpy_narrow_integers(self):
+        error_msg = f"{TestBatch.error_func_msg}`evaluate_batch()`"
+        np = calculator.np
+        program = TestBatch.reverse.compile("x 3 * y +")
+        result = program.evaluate_batch(
+            x=np.array([100, -100], dtype=np.int8),
+            y=np.array([True, False]),
+        )
+        self.assertIsInstance(result, np.ndarray, error_msg)
+        self.assertEqual(result.tolist(), [301, -300], error_msg)
+
+
+class TestStream(unittest.TestCase):
+    """Тестирование потокового вычисления `calculator.evaluate_stream`.
+    """
+    def test_stream(self):
+        error_msg = "Некорректное работа функции: `evaluate_stream()`"
+        source = io.StringIO("1 2 +\n1 0 /\n\n2 +\n4 13 5 / +\n")
+        output = io.StringIO()
+        errors = io.StringIO()
+        failed = calculator.evaluate_stream(source, output, errors)
+        self.assertEqual(failed, 2, error_msg)
+        self.assertEqual(
+            output.getvalue(), "3\nerror\nerror\n6\n", error_msg
+        )
+        self.assertEqual(
+            [line.split(":")[0] for line in errors.getvalue().splitlines()],
+            ["2", "4"],
+            error_msg
+        )
+
+    def test_main(self):
+        error_msg = "Некорректное работа функции: `main()`"
+        data = "1 2 +\n1 0 /\n4 13 5 / +\n"
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".txt", delete=False
+        ) as file:
+            file.write(data)
+        self.addCleanup(os.remove, file.name)
+        for argv, stdin in (
+            (["--stream"], data), (["-"], data), ([file.name], ""),
+        ):
+            output, errors = io.StringIO(), io.StringIO()
+            with mock.patch.multiple(
+                "sys", stdin=io.StringIO(stdin), stdout=output, stderr=errors
+            ):
+                with self.assertRaises(SystemExit, msg=error_msg) as exit:
+                    calculator.main(argv)
+            self.assertEqual(exit.exception.code, 1, error_msg)
+            self.assertEqual(output.getvalue(), "3\nerror\n6\n", error_msg)
+            self.assertTrue(errors.getvalue().startswith("2: "), error_msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,10 @@
+import io
+import random
 import sys
 import unittest
+from collections import deque
 from pathlib import Path
+from unittest import mock
 
 import deck
 
@@ -284,5 +288,361 @@ class TestDeck(unittest.TestCase):
         )
 
 
+class TestGrowableDeck(unittest.TestCase):
+    """Тестирование последовательности `deck.Deck` в режиме `growable`.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.error_func_msg = "Некорректное работа функции: "
+
+    def test_grow_and_shrink(self):
+        error_msg = f"{TestGrowableDeck.error_func_msg}`growable`"
+        test_deck = deck.Deck(2, growable=True)
+        test_deck.push_back(1)
+        test_deck.push_front(0)
+        self.assertIsNone(test_deck.push_back(2), error_msg)
+        self.assertEqual(test_deck.size(), 4, error_msg)
+        self.assertEqual(str(test_deck), "[0, ..., 2]", error_msg)
+        for value in range(3, 9):
+            test_deck.push_back(value)
+        self.assertEqual(test_deck.size(), 16, error_msg)
+        for value in range(7):
+            self.assertEqual(test_deck.pop_front(), value, error_msg)
+        self.assertEqual(test_deck.size(), 4, error_msg)
+        self.assertEqual(str(test_deck), "[7, ..., 8]", error_msg)
+        test_deck.clear()
+        self.assertEqual(test_deck.size(), 2, error_msg)
+
+    def test_matches_deque(self):
+        error_msg = f"{TestGrowableDeck.error_func_msg}`growable`"
+        rng = random.Random(11)
+        test_deck = deck.Deck(3, growable=True)
+        model = deque()
+        for step in range(5000):
+            command = rng.choice(
+                ("push_back", "push_front", "pop_back", "pop_front")
+                if step % 1000 < 600 else ("pop_back", "pop_front")
+            )
+            if command.startswith("push"):
+                getattr(test_deck, command)(step)
+                getattr(model, "append" if command == "push_back"
+                        else "appendleft")(step)
+            elif model:
+                expected = (
+                    model.pop() if command == "pop_back" else model.popleft()
+                )
+                self.assertEqual(
+                    getattr(test_deck, command)(), expected, error_msg
+                )
+            else:
+                self.assertEqual(
+                    getattr(test_deck, command)(), "error", error_msg
+                )
+            self.assertEqual(len(test_deck), len(model), error_msg)
+            self.assertGreaterEqual(test_deck.size(), len(model), error_msg)
+            self.assertGreaterEqual(test_deck.size(), 3, error_msg)
+
+
+class TestBulkDeck(unittest.TestCase):
+    """Тестирование пакетных операций `deck.Deck`.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.error_func_msg = "Некорректное работа функции: "
+
+    def test_error(self):
+        error_msg = f"{TestBulkDeck.error_func_msg}пакетных операций"
+        test_deck = deck.Deck(4)
+        test_deck.extend_back([1, 2])
+        self.assertEqual(test_deck.extend_back([3, 4, 5]), "error", error_msg)
+        self.assertEqual(test_deck.extend_front([3, 4, 5]), "error", error_msg)
+        self.assertEqual(len(test_deck), 2, error_msg)
+        self.assertEqual(test_deck.pop_back_many(3), "error", error_msg)
+        self.assertEqual(test_deck.pop_front_many(-1), "error", error_msg)
+        self.assertEqual(test_deck.pop_front_many(0), [], error_msg)
+        growable = deck.Deck(2, growable=True)
+        growable.extend_front(range(9))
+        self.assertEqual(growable.size(), 16, error_msg)
+        self.assertEqual(
+            growable.pop_back_many(8), list(range(8)), error_msg
+        )
+        self.assertEqual(growable.size(), 2, error_msg)
+
+    def test_matches_deque(self):
+        error_msg = f"{TestBulkDeck.error_func_msg}пакетных операций"
+        rng = random.Random(5)
+        for growable in (False, True):
+            test_deck = deck.Deck(7, growable=growable)
+            model = deque()
+            for step in range(3000):
+                command = rng.choice((
+                    "extend_back", "extend_front",
+                    "pop_back_many", "pop_front_many", "push_front",
+                ))
+                amount = rng.randint(0, 5)
+                if command.startswith("extend"):
+                    values = list(range(step, step + amount))
+                    fits = growable or len(model) + amount <= 7
+                    result = getattr(test_deck, command)(values)
+                    self.assertEqual(
+                        result, None if fits else "error", error_msg
+                    )
+                    if fits:
+                        getattr(model, "extend" if command == "extend_back"
+                                else "extendleft")(values)
+                elif command == "push_front":
+                    if test_deck.push_front(step) is None:
+                        model.appendleft(step)
+                elif amount <= len(model):
+                    expected = [
+                        model.pop() if command == "pop_back_many"
+                        else model.popleft()
+                        for _ in range(amount)
+                    ]
+                    self.assertEqual(
+                        getattr(test_deck, command)(amount), expected,
+                        error_msg
+                    )
+                else:
+                    self.assertEqual(
+                        getattr(test_deck, command)(amount), "error",
+                        error_msg
+                    )
+                self.assertEqual(len(test_deck), len(model), error_msg)
+            self.assertEqual(
+                test_deck.pop_front_many(len(model)), list(model), error_msg
+            )
+
+
+class TestTypedDeck(unittest.TestCase):
+    """Тестирование последовательности `deck.TypedDeck`.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.error_func_msg = "Некорректное работа функции: "
+
+    def test_error(self):
+        error_msg = f"{TestTypedDeck.error_func_msg}переполнения"
+        test_deck = deck.TypedDeck("q", 2)
+        self.assertEqual(test_deck.pop_front(), "error", error_msg)
+        self.assertEqual(test_deck.get_back(), "error", error_msg)
+        test_deck.extend_front([1, 2])
+        self.assertEqual(test_deck.push_back(3), "error", error_msg)
+        self.assertEqual(test_deck.extend_back([3]), "error", error_msg)
+        with self.assertRaises(TypeError, msg=error_msg):
+            deck.TypedDeck("q", 2).push_back(1.5)
+        with self.assertRaises(OverflowError, msg=error_msg):
+            deck.TypedDeck("q", 2).push_front(1 << 64)
+        self.assertEqual(
+            deck.TypedDeck("d", 0).extend_back([]), None, error_msg
+        )
+
+    def test_matches_deck(self):
+        error_msg = f"{TestTypedDeck.error_func_msg}`TypedDeck`"
+        rng = random.Random(14)
+        commands = (
+            "push_back", "push_front", "pop_back", "pop_front",
+            "get_back", "get_front", "extend_back", "extend_front",
+            "pop_front_many", "pop_back_many",
+        )
+        test_deck = deck.TypedDeck("d", 9)
+        model = deck.Deck(9)
+        for step in range(3000):
+            command = rng.choice(commands)
+            if command.startswith("push"):
+                args = (float(step),)
+            elif command.startswith("extend"):
+                args = ([float(step + i) for i in range(rng.randint(0, 4))],)
+            elif command.endswith("many"):
+                args = (rng.randint(0, 4),)
+            else:
+                args = ()
+            self.assertEqual(
+                getattr(test_deck, command)(*args),
+                getattr(model, command)(*args), error_msg
+            )
+            self.assertEqual(len(test_deck), len(model), error_msg)
+            contents = [
+                value for segment in test_deck.segments()
+                for value in segment.tolist()
+            ]
+            self.assertEqual(len(contents), len(model), error_msg)
+            if contents:
+                self.assertEqual(
+                    (contents[0], contents[-1]),
+                    (model.get_front(), model.get_back()), error_msg
+                )
+        self.assertEqual(
+            contents, model.pop_front_many(len(model)), error_msg
+        )
+
+
+class TestStrictDeck(unittest.TestCase):
+    """Тестирование режима `strict` последовательности `deck.Deck`.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.error_func_msg = "Некорректное работа функции: "
+
+    def test_exceptions(self):
+        error_msg = f"{TestStrictDeck.error_func_msg}режима `strict`"
+        test_deck = deck.Deck(2, strict=True)
+        for method in ("pop_back", "pop_front", "get_back", "get_front"):
+            with self.assertRaises(deck.DeckEmpty, msg=error_msg):
+                getattr(test_deck, method)()
+        with self.assertRaises(deck.DeckEmpty, msg=error_msg):
+            test_deck.pop_front_many(1)
+        with self.assertRaises(ValueError, msg=error_msg):
+            test_deck.pop_back_many(-1)
+        test_deck.push_back("error")
+        test_deck.push_front(None)
+        for method in ("push_back", "push_front"):
+            with self.assertRaises(deck.DeckFull, msg=error_msg):
+                getattr(test_deck, method)(1)
+        with self.assertRaises(deck.DeckError, msg=error_msg):
+            test_deck.extend_back([1])
+        self.assertEqual(test_deck.pop_back(), "error", error_msg)
+        self.assertEqual(test_deck.pop_back(), None, error_msg)
+        growable = deck.Deck(1, growable=True, strict=True)
+        growable.extend_front([1, 2, 3])
+        self.assertEqual(growable.pop_back_many(3), [1, 2, 3], error_msg)
+
+    def test_matches_lenient(self):
+        error_msg = f"{TestStrictDeck.error_func_msg}режима `strict`"
+        rng = random.Random(20)
+        strict, lenient = deck.Deck(5, strict=True), deck.Deck(5)
+        for step in range(2000):
+            command = rng.choice((
+                "push_back", "push_front", "pop_back", "pop_front",
+                "get_back", "get_front",
+            ))
+            args = (step,) if command.startswith("push") else ()
+            expected = getattr(lenient, command)(*args)
+            if expected == "error":
+                with self.assertRaises(deck.DeckError, msg=error_msg):
+                    getattr(strict, command)(*args)
+            else:
+                self.assertEqual(
+                    getattr(strict, command)(*args), expected, error_msg
+                )
+            self.assertEqual(strict, lenient, error_msg)
+
+
+class TestDeckIteration(unittest.TestCase):
+    """Тестирование обхода и индексации `deck.Deck`.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.error_func_msg = "Некорректное работа функции: "
+
+    def test_matches_deque(self):
+        error_msg = f"{TestDeckIteration.error_func_msg}обхода"
+        rng = random.Random(17)
+        for growable in (False, True):
+            test_deck = deck.Deck(6, growable=growable)
+            model = deque()
+            for step in range(2000):
+                if rng.random() < 0.55:
+                    if test_deck.push_front(step) is None:
+                        model.appendleft(step)
+                elif test_deck.pop_back() != "error":
+                    model.pop()
+                self.assertEqual(list(test_deck), list(model), error_msg)
+                self.assertEqual(
+                    list(reversed(test_deck)), list(reversed(model)),
+                    error_msg
+                )
+                self.assertEqual(test_deck.to_list(), list(model), error_msg)
+                for index in range(-len(model), len(model)):
+                    self.assertEqual(
+                        test_deck[index], model[index], error_msg
+                    )
+                self.assertEqual(step in test_deck, step in model, error_msg)
+                self.assertEqual(
+                    step - 3 in test_deck, step - 3 in model, error_msg
+                )
+        with self.assertRaises(IndexError, msg=error_msg):
+            deck.Deck(3)[0]
+        with self.assertRaises(TypeError, msg=error_msg):
+            test_deck["0"]
+
+    def test_mutation(self):
+        error_msg = f"{TestDeckIteration.error_func_msg}изменения при обходе"
+        for mutate in (
+            lambda test_deck: test_deck.push_back(0),
+            lambda test_deck: test_deck.pop_front(),
+            lambda test_deck: test_deck.extend_front([1]),
+            lambda test_deck: test_deck.pop_back_many(1),
+            lambda test_deck: test_deck.clear(),
+        ):
+            test_deck = deck.Deck(5)
+            test_deck.extend_back([1, 2, 3])
+            iterator = iter(test_deck)
+            next(iterator)
+            mutate(test_deck)
+            with self.assertRaises(RuntimeError, msg=error_msg):
+                next(iterator)
+        full = deck.Deck(1)
+        full.push_back(1)
+        iterator = iter(full)
+        self.assertEqual(full.push_back(2), "error", error_msg)
+        self.assertEqual(list(iterator), [1], error_msg)
+
+    def test_eq_contents(self):
+        error_msg = f"{TestDeckIteration.error_func_msg}`__eq__()`"
+        deck_1, deck_2 = deck.Deck(4), deck.Deck(4)
+        deck_1.extend_back([1, 2, 3])
+        deck_2.extend_front([3, 2, 1])
+        self.assertEqual(deck_1, deck_2, error_msg)
+        deck_2.pop_back()
+        deck_2.push_back(float("nan"))
+        self.assertNotEqual(deck_1, deck_2, error_msg)
+        deck_1.pop_back()
+        deck_1.push_back(deck_2.get_back())
+        self.assertEqual(deck_1, deck_2, error_msg)
+
+
+class TestDeckCommands(unittest.TestCase):
+    """Тестирование интерпретатора команд `deck.main`.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.error_func_msg = "Некорректное работа функции: "
+
+    def test_read_lines(self):
+        error_msg = f"{TestDeckCommands.error_func_msg}`read_lines()`"
+        data = b"5\n\npush_back 12\r\npop_back\n"
+        for block_size in range(1, len(data) + 2):
+            self.assertEqual(
+                list(deck.read_lines(io.BytesIO(data), block_size)),
+                [b"5", b"", b"push_back 12\r", b"pop_back"], error_msg
+            )
+
+    def test_execute(self):
+        error_msg = f"{TestDeckCommands.error_func_msg}`execute()`"
+        commands = [
+            b"pop_front", b"push_back 10", b" push_front  -3 ", b"",
+            b"size\r", b"push_back 1", b"get_front", b"pop_back",
+        ]
+        self.assertEqual(
+            deck.execute(deck.Deck(2), commands),
+            ["error", "2", "error", "-3", "10"], error_msg
+        )
+        with self.assertRaises(ValueError, msg=error_msg):
+            deck.execute(deck.Deck(2), [b"__len__"])
+        with self.assertRaises(ValueError, msg=error_msg):
+            deck.execute(deck.Deck(2), [b"push_back x"])
+
+    def test_main(self):
+        error_msg = f"{TestDeckCommands.error_func_msg}`main()`"
+        data = b"4\n3\npush_front 1\npush_back 2\npop_back\nsize\nget_back\n"
+        stdin = io.TextIOWrapper(io.BytesIO(data))
+        with mock.patch.object(sys, "stdin", stdin), mock.patch.object(
+            sys, "stdout", io.StringIO()
+        ) as stdout:
+            deck.main()
+        self.assertEqual(stdout.getvalue(), "2\n3\n", error_msg)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,100 @@
+import os
+import pickle
+import random
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import deck
+import deck_mmap
+
+
+class TestMappedDeck(unittest.TestCase):
+    """Тестирование очереди в файле `deck_mmap.MappedDeck`.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.error_func_msg = "Некорректное работа функции: "
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "deck")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_matches_deck(self):
+        error_msg = f"{TestMappedDeck.error_func_msg}`MappedDeck`"
+        rng = random.Random(18)
+        commands = (
+            "push_back", "push_front", "pop_back", "pop_front",
+            "get_back", "get_front",
+        )
+        model = deck.Deck(7)
+        test_deck = deck_mmap.MappedDeck(self.path, 7, "d", sync_every=50)
+        for step in range(2000):
+            command = rng.choice(commands)
+            args = (step / 4,) if command.startswith("push") else ()
+            self.assertEqual(
+                getattr(test_deck, command)(*args),
+                getattr(model, command)(*args), error_msg
+            )
+            self.assertEqual(len(test_deck), len(model), error_msg)
+            if not step % 500:
+                test_deck.close()
+                test_deck = deck_mmap.MappedDeck(self.path)
+        test_deck.clear()
+        self.assertEqual(test_deck.pop_back(), "error", error_msg)
+        test_deck.close()
+
+    def test_crash(self):
+        error_msg = f"{TestMappedDeck.error_func_msg}восстановления"
+        code = (
+            "import os, sys, deck_mmap\n"
+            "deck = deck_mmap.MappedDeck(sys.argv[1], 4, '8s')\n"
+            "deck.push_back(b'first')\n"
+            "deck.push_front(b'zero')\n"
+            "deck.pop_back()\n"
+            "deck.push_back(b'second')\n"
+            "os._exit(0)\n"
+        )
+        subprocess.run(
+            [sys.executable, "-c", code, self.path], check=True,
+            cwd=os.path.dirname(os.path.abspath(deck_mmap.__file__))
+        )
+        with deck_mmap.MappedDeck(self.path) as test_deck:
+            self.assertEqual(
+                (len(test_deck), test_deck.fmt), (2, "8s"), error_msg
+            )
+            self.assertEqual(
+                test_deck.pop_front(), b"zero\x00\x00\x00\x00", error_msg
+            )
+            self.assertEqual(
+                test_deck.pop_front().rstrip(b"\x00"), b"second", error_msg
+            )
+
+    def test_errors_and_pickle(self):
+        error_msg = f"{TestMappedDeck.error_func_msg}открытия"
+        with self.assertRaises(ValueError, msg=error_msg):
+            deck_mmap.MappedDeck(self.path)
+        with self.assertRaises(ValueError, msg=error_msg):
+            deck_mmap.MappedDeck(self.path, 4, "qq")
+        with deck_mmap.MappedDeck(self.path, 4) as test_deck:
+            test_deck.push_back(5)
+            copy = pickle.loads(pickle.dumps(test_deck))
+            self.assertEqual(copy.pop_back(), 5, error_msg)
+            self.assertEqual(len(test_deck), 0, error_msg)
+            copy.close()
+        with self.assertRaises(ValueError, msg=error_msg):
+            deck_mmap.MappedDeck(self.path, 5)
+        with self.assertRaises(ValueError, msg=error_msg):
+            deck_mmap.MappedDeck(self.path, fmt="d")
+        with open(self.path, "r+b") as file:
+            file.write(b"garbage!")
+        with self.assertRaises(ValueError, msg=error_msg):
+            deck_mmap.MappedDeck(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
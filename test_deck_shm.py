@@ -0,0 +1,100 @@
+import multiprocessing
+import os
+import subprocess
+import sys
+import unittest
+
+import deck_shm
+
+
+def produce(shared_deck, start, count):
+    for value in range(start, start + count):
+        shared_deck.push_back(value, timeout=None)
+
+
+def consume(shared_deck, count, results):
+    total = 0
+    for _ in range(count):
+        total += shared_deck.pop_front(timeout=None)
+    results.put(total)
+
+
+class TestSharedDeck(unittest.TestCase):
+    """Тестирование очереди в разделяемой памяти `deck_shm.SharedDeck`.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.error_func_msg = "Некорректное работа функции: "
+
+    def test_deck_api(self):
+        error_msg = f"{TestSharedDeck.error_func_msg}`SharedDeck`"
+        with deck_shm.SharedDeck(3, "4s") as test_deck:
+            self.assertEqual(test_deck.pop_back(), "error", error_msg)
+            self.assertEqual(
+                test_deck.pop_front(timeout=0.01), "error", error_msg
+            )
+            test_deck.push_back(b"ab")
+            test_deck.push_front(b"cd")
+            test_deck.push_back(b"ef")
+            self.assertEqual(
+                test_deck.push_front(b"gh", timeout=0.01), "error", error_msg
+            )
+            self.assertEqual(len(test_deck), 3, error_msg)
+            self.assertEqual(test_deck.get_front(), b"cd\0\0", error_msg)
+            self.assertEqual(test_deck.pop_back(), b"ef\0\0", error_msg)
+            test_deck.clear()
+            self.assertEqual(test_deck.get_back(), "error", error_msg)
+
+    def check_processes(self, ctx):
+        error_msg = f"{TestSharedDeck.error_func_msg}обмена между процессами"
+        producers, consumers, count = 3, 2, 600
+        results = ctx.Queue()
+        with deck_shm.SharedDeck(4, ctx=ctx) as test_deck:
+            processes = [
+                ctx.Process(
+                    target=produce,
+                    args=(test_deck, number * count, count)
+                )
+                for number in range(producers)
+            ] + [
+                ctx.Process(
+                    target=consume,
+                    args=(test_deck, producers * count // consumers, results)
+                )
+                for _ in range(consumers)
+            ]
+            for process in processes:
+                process.start()
+            total = sum(results.get(timeout=60) for _ in range(consumers))
+            for process in processes:
+                process.join(timeout=60)
+                self.assertEqual(process.exitcode, 0, error_msg)
+            self.assertEqual(len(test_deck), 0, error_msg)
+        expected = sum(range(producers * count))
+        self.assertEqual(total, expected, error_msg)
+
+    def test_fork(self):
+        if "fork" not in multiprocessing.get_all_start_methods():
+            self.skipTest("fork недоступен")
+        self.check_processes(multiprocessing.get_context("fork"))
+
+    def test_spawn(self):
+        self.check_processes(multiprocessing.get_context("spawn"))
+
+    def test_spawn_tracker(self):
+        error_msg = f"{TestSharedDeck.error_func_msg}`resource_tracker`"
+        # `resource_tracker` пишет ошибки учёта памяти в stderr.
+        result = subprocess.run(
+            [
+                sys.executable, "-m", "unittest", "-q",
+                f"{__name__}.TestSharedDeck.test_spawn",
+            ],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, timeout=120
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertNotIn("Traceback", result.stderr, error_msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+import asyncio
+import queue
+import threading
+import unittest
+
+import deck_sync
+
+
+class TestBlockingDeck(unittest.TestCase):
+    """Тестирование потокобезопасной очереди `deck_sync.BlockingDeck`.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.error_func_msg = "Некорректное работа функции: "
+
+    def test_timeout(self):
+        error_msg = f"{TestBlockingDeck.error_func_msg}ожидания"
+        test_deck = deck_sync.BlockingDeck(1)
+        with self.assertRaises(queue.Empty, msg=error_msg):
+            test_deck.pop_back(timeout=0.01)
+        test_deck.push_front(1)
+        with self.assertRaises(queue.Full, msg=error_msg):
+            test_deck.push_back(2, block=False)
+        with self.assertRaises(ValueError, msg=error_msg):
+            test_deck.push_back(2, timeout=-1)
+        with self.assertRaises(ValueError, msg=error_msg):
+            deck_sync.BlockingDeck(0)
+
+    def test_producers_consumers(self):
+        error_msg = f"{TestBlockingDeck.error_func_msg}обмена между потоками"
+        test_deck = deck_sync.BlockingDeck(3)
+        producers, consumers, items = 4, 3, 600
+        received = []
+        lock = threading.Lock()
+
+        def produce(start):
+            for value in range(start, items, producers):
+                if value % 2:
+                    test_deck.push_back(value)
+                else:
+                    test_deck.push_front(value)
+
+        def consume():
+            values = []
+            while True:
+                value = (
+                    test_deck.pop_front() if len(values) % 2
+                    else test_deck.pop_back()
+                )
+                if value is None:
+                    break
+                values.append(value)
+            with lock:
+                received.extend(values)
+
+        threads = [
+            threading.Thread(target=produce, args=(start,))
+            for start in range(producers)
+        ] + [threading.Thread(target=consume) for _ in range(consumers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads[:producers]:
+            thread.join()
+        for _ in range(consumers):
+            test_deck.push_back(None)
+        for thread in threads[producers:]:
+            thread.join()
+        self.assertEqual(sorted(received), list(range(items)), error_msg)
+        self.assertEqual(len(test_deck), 0, error_msg)
+
+
+class TestAsyncDeck(unittest.TestCase):
+    """Тестирование очереди для asyncio `deck_sync.AsyncDeck`.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.error_func_msg = "Некорректное работа функции: "
+
+    def test_nowait(self):
+        error_msg = f"{TestAsyncDeck.error_func_msg}`*_nowait()`"
+        test_deck = deck_sync.AsyncDeck(2)
+        test_deck.push_back_nowait(1)
+        test_deck.push_front_nowait(0)
+        with self.assertRaises(asyncio.QueueFull, msg=error_msg):
+            test_deck.push_back_nowait(2)
+        self.assertEqual(test_deck.pop_back_nowait(), 1, error_msg)
+        self.assertEqual(test_deck.pop_front_nowait(), 0, error_msg)
+        with self.assertRaises(asyncio.QueueEmpty, msg=error_msg):
+            test_deck.pop_front_nowait()
+
+    def test_producers_consumers(self):
+        error_msg = f"{TestAsyncDeck.error_func_msg}обмена между задачами"
+        producers, consumers, items = 4, 3, 600
+
+        async def run():
+            test_deck = deck_sync.AsyncDeck(3)
+            received = []
+
+            async def produce(start):
+                for value in range(start, items, producers):
+                    await test_deck.push_back(value)
+
+            async def consume():
+                while (value := await test_deck.pop_front()) is not None:
+                    received.append(value)
+
+            tasks = [
+                asyncio.create_task(consume()) for _ in range(consumers)
+            ]
+            await asyncio.gather(*map(produce, range(producers)))
+            for _ in range(consumers):
+                await test_deck.push_front(None)
+            await asyncio.gather(*tasks)
+            return received
+
+        received = asyncio.run(run())
+        self.assertEqual(sorted(received), list(range(items)), error_msg)
+
+    def test_cancel(self):
+        error_msg = f"{TestAsyncDeck.error_func_msg}отмены ожидания"
+
+        async def run():
+            test_deck = deck_sync.AsyncDeck(1)
+            with self.assertRaises(asyncio.TimeoutError, msg=error_msg):
+                await asyncio.wait_for(test_deck.pop_back(), 0.01)
+            waiting = asyncio.create_task(test_deck.pop_back())
+            await asyncio.sleep(0)
+            await test_deck.push_back(1)
+            return await waiting
+
+        self.assertEqual(asyncio.run(run()), 1, error_msg)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import random
+import unittest
+
+import infix
+from calculator import Calculator, ReversePolishCalculator
+
+
+class TestInfix(unittest.TestCase):
+    """Тестирование перевода инфиксных формул `infix`.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.error_func_msg = "Некорректное работа функции: "
+
+    def test_to_rpn(self):
+        error_msg = f"{TestInfix.error_func_msg}`to_rpn`"
+        cases = {
+            "1 + 2 * 3": "1 2 3 * +",
+            "(1 + 2) * 3": "1 2 + 3 *",
+            "a - b - c": "a b - c -",
+            "8 / 2 / 2": "8 2 / 2 /",
+            "-x * 2": "x neg 2 *",
+            "2 * -(x + 1)": "2 x 1 + neg *",
+            "- - 2 + +3": "2 neg neg 3 +",
+            "1.5e3 - .5": "1.5e3 .5 -",
+            "sqrt(a * a)": "a a * sqrt",
+            "max(1, (2), 3) - min(x, y)": "1 2 3 max/3 x y min -",
+            "sum(1)": "1 sum/1",
+        }
+        for formula, expected in cases.items():
+            self.assertEqual(
+                infix.to_rpn(formula), expected.split(), error_msg
+            )
+
+    def test_errors(self):
+        error_msg = f"{TestInfix.error_func_msg}некорректных формул"
+        for formula in (
+            "", "1 +", "* 2", "1 2", "(1 + 2", "1 + 2)", "()", "1, 2",
+            "f(1)", "sqrt", "sqrt()", "sqrt(1, 2)", "max(1,)", "2 ^ 3",
+            "x (1)", "max(5)", "min(x) + 1",
+        ):
+            with self.assertRaises(ValueError, msg=f"{error_msg}: {formula}"):
+                infix.to_rpn(formula)
+
+    def test_min_arity(self):
+        error_msg = f"{TestInfix.error_func_msg}`InfixCalculator`"
+        calculator = infix.InfixCalculator()
+        with self.assertRaisesRegex(ValueError, "не меньше 2", msg=error_msg):
+            calculator.get_result("max(5) + 1")
+        self.assertEqual(
+            calculator.get_result("max(5, 2) + sum(1)"), 6, error_msg
+        )
+
+    def test_matches_rpn(self):
+        error_msg = f"{TestInfix.error_func_msg}`InfixCalculator`"
+        rng = random.Random(24)
+        calculator = infix.InfixCalculator()
+        reference = ReversePolishCalculator()
+        for _ in range(300):
+            numbers = [str(rng.randint(1, 9)) for _ in range(5)]
+            operators = [rng.choice("+-*") for _ in range(4)]
+            rpn = " ".join(numbers[:2] + [operators[0]])
+            formula = f"{numbers[0]} {operators[0]} {numbers[1]}"
+            for number, symbol in zip(numbers[2:], operators[1:]):
+                if rng.random() < 0.5:
+                    rpn = f"{rpn} {number} {symbol}"
+                    formula = f"({formula}) {symbol} {number}"
+                else:
+                    rpn = f"{number} {rpn} {symbol}"
+                    formula = f"{number} {symbol} ({formula})"
+            expected = reference.get_result(rpn)
+            self.assertEqual(
+                calculator.get_result(formula), expected, error_msg
+            )
+            self.assertEqual(
+                calculator.get_result(formula.split()), expected, error_msg
+            )
+            self.assertEqual(eval(formula), expected, error_msg)
+        self.assertEqual(
+            calculator.compile("x * (2 + 3) - y")(x=2, y=1), 9, error_msg
+        )
+        self.assertEqual(calculator.get_result(b"7 / 2"), 3, error_msg)
+
+    def test_cache(self):
+        error_msg = f"{TestInfix.error_func_msg}кэша формул"
+        infix._to_rpn_cached.cache_clear()
+        first = infix.to_rpn("1 + 2 * 3")
+        first.append("mutated")
+        self.assertEqual(
+            infix.to_rpn("1 + 2 * 3"), "1 2 3 * +".split(), error_msg
+        )
+        info = infix._to_rpn_cached.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1), error_msg)
+        self.assertEqual(info.maxsize, infix.INFIX_CACHE_SIZE, error_msg)
+        formula = " + ".join(["1"] * 3000)
+        self.assertEqual(
+            len(infix.to_rpn(formula)), 2 * 3000 - 1, error_msg
+        )
+        self.assertEqual(
+            infix._to_rpn_cached.cache_info().currsize, 1, error_msg
+        )
+        Calculator.ACTIONS.register(
+            "avg", lambda *operands: sum(operands) // len(operands),
+            variadic=True
+        )
+        try:
+            self.assertEqual(
+                infix.to_rpn("avg(2, 4, 9)"), ["2", "4", "9", "avg/3"],
+                error_msg
+            )
+            self.assertEqual(
+                infix.InfixCalculator().get_result("avg(2, 4, 9) + 1"), 6,
+                error_msg
+            )
+        finally:
+            Calculator.ACTIONS.unregister("avg")
+        with self.assertRaises(ValueError, msg=error_msg):
+            infix.to_rpn("avg(2, 4)")
+
+
+if __name__ == "__main__":
+    unittest.main()
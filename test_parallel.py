@@ -0,0 +1,85 @@
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import calculator
+import parallel
+
+
+class TestParallel(unittest.TestCase):
+    """Тестирование параллельного вычисления `parallel.evaluate_file`.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.error_func_msg = "Некорректное работа функции: "
+        lines = []
+        for number in range(500):
+            lines.append(f"{number} {number % 7} / 3 +")
+            if not number % 97:
+                lines.append("1 +")
+        cls.text = "\n".join(lines) + "\n"
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".txt", delete=False
+        ) as file:
+            file.write(cls.text)
+        cls.path = file.name
+
+    @classmethod
+    def tearDownClass(cls):
+        os.remove(cls.path)
+
+    def test_split_chunks(self):
+        error_msg = f"{TestParallel.error_func_msg}`split_chunks()`"
+        chunks = list(parallel.split_chunks(TestParallel.path, 100))
+        self.assertEqual(chunks[0][0], 0, error_msg)
+        self.assertEqual(
+            chunks[-1][1], len(TestParallel.text.encode()), error_msg
+        )
+        for (_, end), (start, _) in zip(chunks, chunks[1:]):
+            self.assertEqual(end, start, error_msg)
+            self.assertEqual(
+                TestParallel.text.encode()[end - 1:end], b"\n", error_msg
+            )
+
+    def test_matches_stream(self):
+        error_msg = f"{TestParallel.error_func_msg}`evaluate_file()`"
+        expected_output = io.StringIO()
+        expected_errors = io.StringIO()
+        expected_failed = calculator.evaluate_stream(
+            io.StringIO(TestParallel.text), expected_output, expected_errors
+        )
+        output = io.StringIO()
+        errors = io.StringIO()
+        failed = parallel.evaluate_file(
+            TestParallel.path, output, errors, workers=2, chunk_size=256
+        )
+        self.assertEqual(failed, expected_failed, error_msg)
+        self.assertEqual(
+            output.getvalue(), expected_output.getvalue(), error_msg
+        )
+        self.assertEqual(
+            errors.getvalue(), expected_errors.getvalue(), error_msg
+        )
+
+    def test_main(self):
+        error_msg = f"{TestParallel.error_func_msg}`main()`"
+        expected_output = io.StringIO()
+        calculator.evaluate_stream(
+            io.StringIO(TestParallel.text), expected_output
+        )
+        output, errors = io.StringIO(), io.StringIO()
+        with mock.patch.multiple("sys", stdout=output, stderr=errors):
+            with self.assertRaises(SystemExit, msg=error_msg) as exit:
+                parallel.main(
+                    [TestParallel.path, "--workers", "2", "-c", "256"]
+                )
+        self.assertEqual(exit.exception.code, 1, error_msg)
+        self.assertEqual(
+            output.getvalue(), expected_output.getvalue(), error_msg
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+import unittest
+
+from calculator import (
+    Calculator, PolishCalculator, Program, ReversePolishCalculator
+)
+import infix
+from profiling import Profiler
+
+
+class TestProfiler(unittest.TestCase):
+    """Тестирование профилирования калькуляторов `Profiler`.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.error_func_msg = "Некорректное работа функции: "
+
+    def test_counts(self):
+        error_msg = f"{TestProfiler.error_func_msg}подсчёта статистики"
+        calculator = ReversePolishCalculator()
+        with Profiler() as profiler:
+            self.assertEqual(
+                calculator.get_result(["1", "2", "3", "+", "+", "4", "*"]),
+                24, error_msg
+            )
+            self.assertEqual(
+                PolishCalculator().get_result("- 9 * 2 3"), 3, error_msg
+            )
+            program = calculator.compile("a 2 b * -")
+            self.assertEqual(program(a=10, b=3), 4, error_msg)
+            self.assertEqual(program.evaluate(a=1, b=1), -1, error_msg)
+        snapshot = profiler.snapshot()
+        self.assertEqual(snapshot["operators"]["+"]["count"], 2, error_msg)
+        self.assertEqual(snapshot["operators"]["*"]["count"], 4, error_msg)
+        self.assertEqual(snapshot["operators"]["-"]["count"], 3, error_msg)
+        self.assertEqual(snapshot["operators"]["/"]["count"], 0, error_msg)
+        self.assertEqual(snapshot["tokens"], 7 + 5 + 5 + 5, error_msg)
+        self.assertEqual(snapshot["max_stack_depth"], 3, error_msg)
+        self.assertEqual(snapshot["parse_count"], 1, error_msg)
+        self.assertEqual(snapshot["evaluate_count"], 4, error_msg)
+        self.assertGreater(snapshot["parse_seconds"], 0, error_msg)
+        self.assertGreater(snapshot["evaluate_seconds"], 0, error_msg)
+        profiler.reset()
+        self.assertEqual(profiler.tokens, 0, error_msg)
+
+    def test_disabled_restores(self):
+        error_msg = f"{TestProfiler.error_func_msg}выключения профилирования"
+        functions = {
+            symbol: action.function
+            for symbol, action in Calculator.ACTIONS.entries.items()
+        }
+        methods = (
+            PolishCalculator.__dict__["_compile"],
+            PolishCalculator.__dict__["_run"],
+            Program.__dict__["evaluate"], Program.__dict__["__call__"],
+        )
+        profiler = Profiler()
+        profiler.enable()
+        self.assertTrue(profiler.enabled, error_msg)
+        self.assertIsNot(
+            Calculator.ACTIONS.resolve("+").function, functions["+"],
+            error_msg
+        )
+        with self.assertRaises(RuntimeError, msg=error_msg):
+            Profiler().enable()
+        profiler.disable()
+        self.assertFalse(profiler.enabled, error_msg)
+        self.assertEqual(
+            {
+                symbol: action.function
+                for symbol, action in Calculator.ACTIONS.entries.items()
+            },
+            functions, error_msg
+        )
+        self.assertEqual(
+            (
+                PolishCalculator.__dict__["_compile"],
+                PolishCalculator.__dict__["_run"],
+                Program.__dict__["evaluate"], Program.__dict__["__call__"],
+            ),
+            methods, error_msg
+        )
+        ReversePolishCalculator().get_result("1 2 +")
+        self.assertEqual(profiler.snapshot()["tokens"], 0, error_msg)
+
+    def test_shared_state(self):
+        error_msg = f"{TestProfiler.error_func_msg}выключения профилирования"
+        calculator = ReversePolishCalculator()
+        version = Calculator.ACTIONS.version
+        for _ in range(3):
+            with Profiler() as profiler:
+                kept = calculator.compile("x 2 * 1 +")
+                self.assertEqual(kept(x=4), 9, error_msg)
+                for _ in range(3):
+                    calculator.get_result("3 4 +")
+        self.assertEqual(Calculator.ACTIONS.version, version, error_msg)
+        # Вызов в `kept`, первое вычисление "3 4 +" (у реестра
+        # профилировщика новая версия) и свёртка при компиляции в кэш
+        # профилировщика, дальше строка берётся из этого кэша.
+        self.assertEqual(profiler.operators["+"][0], 3, error_msg)
+        # Общий кэш не хранит программы с обёртками операций.
+        program = calculator.compile("x 2 * 1 +")
+        self.assertIsNot(program, kept, error_msg)
+        self.assertEqual(
+            program.to_function().source_code.splitlines()[-1],
+            "    return x * 2 + 1", error_msg
+        )
+        for _ in range(2):
+            calculator.get_result("3 4 +")
+        self.assertEqual(kept(x=1), 3, error_msg)
+        self.assertEqual(profiler.operators["+"][0], 3, error_msg)
+
+    def test_private_registry(self):
+        error_msg = f"{TestProfiler.error_func_msg}реестра профилировщика"
+        with Profiler():
+            Calculator.ACTIONS.register("mod", lambda x, y: x % y)
+            self.assertEqual(
+                infix.to_rpn("mod(7, 3)"), ["7", "3", "mod"], error_msg
+            )
+        self.assertNotIn("mod", Calculator.ACTIONS, error_msg)
+        # Изменение общего реестра не должно повторить версию реестра
+        # профилировщика и вернуть его записи из кэша `infix`.
+        Calculator.ACTIONS.register("half", lambda x: x // 2, 1)
+        try:
+            with self.assertRaises(ValueError, msg=error_msg):
+                infix.to_rpn("mod(7, 3)")
+        finally:
+            Calculator.ACTIONS.unregister("half")
+
+    def test_prometheus(self):
+        error_msg = f"{TestProfiler.error_func_msg}экспорта Prometheus"
+        with Profiler() as profiler:
+            ReversePolishCalculator().get_result(["6", "2", "/"])
+        lines = profiler.to_prometheus().splitlines()
+        self.assertIn(
+            'calculator_operator_calls_total{operator="/"} 1', lines,
+            error_msg
+        )
+        self.assertIn("calculator_tokens_total 3", lines, error_msg)
+        self.assertIn("calculator_stack_depth_max 2", lines, error_msg)
+        self.assertIn(
+            "# TYPE calculator_stack_depth_max gauge", lines, error_msg
+        )
+        for line in lines:
+            if not line.startswith("#"):
+                float(line.rsplit(" ", 1)[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+import server
+
+
+async def request(reader, writer, lines):
+    writer.write("".join(f"{line}\n" for line in lines).encode())
+    await writer.drain()
+    return [
+        (await reader.readline()).decode().rstrip("\n") for _ in lines
+    ]
+
+
+class TestEvaluationServer(unittest.TestCase):
+    """Тестирование сервера вычислений `server.EvaluationServer`.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.error_func_msg = "Некорректное работа функции: "
+        cls.lines = [f"{number} 3 * 2 /" for number in range(300)]
+        cls.lines[7] = "1 0 /"
+        cls.lines[8] = ""
+        cls.expected = [str(number * 3 // 2) for number in range(300)]
+        cls.expected[7] = cls.expected[8] = "error"
+
+    def test_tcp_pipelining(self):
+        error_msg = f"{TestEvaluationServer.error_func_msg}TCP-сервера"
+
+        async def run():
+            async with server.EvaluationServer(
+                workers=2, batch_size=16, queue_size=32
+            ) as evaluation:
+                listener = await evaluation.start_tcp()
+                port = listener.sockets[0].getsockname()[1]
+                connections = [
+                    await asyncio.open_connection("127.0.0.1", port)
+                    for _ in range(3)
+                ]
+                results = await asyncio.gather(*(
+                    request(reader, writer, self.lines)
+                    for reader, writer in connections
+                ))
+                for _, writer in connections:
+                    writer.close()
+                listener.close()
+                await listener.wait_closed()
+                return results
+
+        for result in asyncio.run(run()):
+            self.assertEqual(result, self.expected, error_msg)
+
+    def test_unix(self):
+        error_msg = f"{TestEvaluationServer.error_func_msg}Unix-сервера"
+
+        async def run(path):
+            async with server.EvaluationServer() as evaluation:
+                listener = await evaluation.start_unix(path)
+                reader, writer = await asyncio.open_unix_connection(path)
+                result = await request(reader, writer, ["2 3 +", "+"])
+                writer.write_eof()
+                self.assertEqual(await reader.read(), b"", error_msg)
+                writer.close()
+                listener.close()
+                await listener.wait_closed()
+                return result
+
+        with tempfile.TemporaryDirectory() as directory:
+            result = asyncio.run(run(os.path.join(directory, "socket")))
+        self.assertEqual(result, ["5", "error"], error_msg)
+
+    def test_arguments(self):
+        error_msg = f"{TestEvaluationServer.error_func_msg}`__init__()`"
+        with self.assertRaises(ValueError, msg=error_msg):
+            server.EvaluationServer(workers=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
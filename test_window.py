@@ -0,0 +1,111 @@
+import math
+import random
+import unittest
+from collections import deque
+
+import window
+
+
+class TestSlidingWindow(unittest.TestCase):
+    """Тестирование агрегатов скользящего окна `window`.
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.error_func_msg = "Некорректное работа функции: "
+
+    def test_empty(self):
+        error_msg = f"{TestSlidingWindow.error_func_msg}пустого окна"
+        for cls in (
+            window.SlidingMin, window.SlidingMax,
+            window.SlidingSum, window.SlidingMean,
+        ):
+            test_window = cls(3)
+            self.assertEqual(test_window.value, "error", error_msg)
+            test_window.extend([4, 2])
+            test_window.clear()
+            self.assertEqual(test_window.value, "error", error_msg)
+            self.assertEqual(test_window.push(7), 7, error_msg)
+            with self.assertRaises(ValueError, msg=error_msg):
+                cls(0)
+
+    def test_matches_rescan(self):
+        aggregates = {
+            window.SlidingMin: min,
+            window.SlidingMax: max,
+            window.SlidingSum: sum,
+            window.SlidingMean: lambda values: sum(values) / len(values),
+        }
+        rng = random.Random(16)
+        values = [rng.randint(-20, 20) for _ in range(2000)]
+        for cls, aggregate in aggregates.items():
+            error_msg = f"{TestSlidingWindow.error_func_msg}`{cls.__name__}`"
+            for size in (1, 2, 3, 7, 64, 3000):
+                test_window = cls(size)
+                model = deque(maxlen=size)
+                expected = []
+                for value in values:
+                    model.append(value)
+                    expected.append(aggregate(model))
+                half = len(values) // 2
+                result = [test_window.push(value) for value in values[:half]]
+                result += test_window.extend(values[half:])
+                self.assertEqual(result, expected, error_msg)
+                self.assertEqual(len(test_window), len(model), error_msg)
+
+    def test_float_sum(self):
+        error_msg = f"{TestSlidingWindow.error_func_msg}`SlidingSum`"
+        self.assertEqual(
+            window.SlidingSum(2).extend([1e20, 1.0, 1.0, 1.0]),
+            [1e20, 1e20, 2.0, 2.0],
+            error_msg
+        )
+        self.assertEqual(
+            window.SlidingMean(2).extend([1.0, 1e100, 1.0, 3.0])[-1], 2.0,
+            error_msg
+        )
+        rng = random.Random(16)
+        values = [
+            rng.uniform(-1, 1) * 10 ** rng.randint(-5, 15)
+            for _ in range(5000)
+        ]
+        test_window = window.SlidingSum(10)
+        result = test_window.extend(values)
+        for index in range(9, len(values)):
+            self.assertAlmostEqual(
+                result[index], math.fsum(values[index - 9:index + 1]),
+                delta=1e-3, msg=error_msg
+            )
+        self.assertEqual(
+            window.SlidingSum(2).extend([1.0, math.inf, 2.0, 3.0, 4.0]),
+            [1.0, math.inf, math.inf, 5.0, 7.0], error_msg
+        )
+        self.assertEqual(
+            window.SlidingMean(2).extend([-math.inf, 2.0, 4.0]),
+            [-math.inf, -math.inf, 3.0], error_msg
+        )
+        result = window.SlidingSum(2).extend(
+            [math.inf, -math.inf, math.nan, 1.0, 2.0]
+        )
+        self.assertEqual(result[0], math.inf, error_msg)
+        self.assertTrue(all(map(math.isnan, result[1:4])), error_msg)
+        self.assertEqual(result[4], 3.0, error_msg)
+
+    def test_abstract(self):
+        error_msg = f"{TestSlidingWindow.error_func_msg}`SlidingWindow`"
+        with self.assertRaises(TypeError, msg=error_msg):
+            window.SlidingWindow(3)
+
+    def test_nan(self):
+        nan = math.nan
+        for cls in (window.SlidingMin, window.SlidingMax):
+            error_msg = f"{TestSlidingWindow.error_func_msg}`{cls.__name__}`"
+            result = cls(2).extend([nan, 1, 2, 3])
+            self.assertTrue(math.isnan(result[0]), error_msg)
+            self.assertEqual(
+                result[2:], [1, 2] if cls is window.SlidingMin else [2, 3],
+                error_msg
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
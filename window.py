@@ -0,0 +1,254 @@
+import math
+import operator
+from abc import ABC, abstractmethod
+
+from deck import Deck
+
+
+class SlidingWindow(ABC):
+    """Агрегат по скользящему окну из последних `size` значений.
+
+    Значения окна хранятся в `deck.Deck` фиксированного размера. При
+    добавлении значения в заполненное окно самое старое значение
+    вытесняется, а агрегат обновляется за амортизированное O(1) без
+    просмотра всего окна. Подклассы определяют `_add`, `_remove` и
+    `_result`.
+
+    Attributes:
+        __values (Deck): Значения окна от старого к новому.
+        __size (int): Размер окна.
+
+    Examples:
+        >>> window = SlidingSum(3)
+        >>> window.extend([1, 2, 3, 4])
+        [1, 3, 6, 9]
+        >>> window.push(10)
+        17
+        >>> window
+        SlidingSum: size=3, fullness=3, value=17
+    """
+
+    def __init__(self, __size):
+        if __size < 1:
+            raise ValueError("Размер окна должен быть натуральным числом.")
+        self.__values = Deck(__size)
+        self.__size = __size
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}: size={self.__size}, "
+            f"fullness={len(self)}, value={self.value}"
+        )
+
+    def __len__(self):
+        return len(self.__values)
+
+    def size(self):
+        return self.__size
+
+    @property
+    def value(self):
+        """Текущий агрегат или `error`, если окно пустое."""
+        if not len(self.__values):
+            return 'error'
+        return self._result()
+
+    def push(self, value):
+        """Добавляет значение в окно.
+
+        Args:
+            value (int | float): Новое значение.
+
+        Returns:
+            int | float: Агрегат окна после добавления.
+        """
+        values = self.__values
+        if len(values) == self.__size:
+            self._remove(values.pop_front())
+        values.push_back(value)
+        self._add(value)
+        return self._result()
+
+    def extend(self, values):
+        """Добавляет значения в окно по одному.
+
+        Args:
+            values (iterable): Новые значения.
+
+        Returns:
+            list: Агрегат окна после каждого значения.
+        """
+        push = self.push
+        return [push(value) for value in values]
+
+    def clear(self):
+        self.__values.clear()
+
+    @abstractmethod
+    def _add(self, value):
+        """Учитывает значение, добавленное в окно."""
+
+    @abstractmethod
+    def _remove(self, value):
+        """Учитывает значение, вытесненное из окна."""
+
+    @abstractmethod
+    def _result(self):
+        """Возвращает агрегат непустого окна."""
+
+
+class SlidingSum(SlidingWindow):
+    """Сумма скользящего окна.
+
+    Сумма поддерживается нарастающим итогом с компенсацией ошибки
+    округления (суммирование Ноймайера): младшие разряды, потерянные
+    при сложении с большим значением, накапливаются отдельно, поэтому
+    малые значения `float` не пропадают после вытеснения большого. Для
+    `int` сумма точная. Бесконечности и NaN в итог не входят, а
+    считаются отдельно, поэтому после их вытеснения сумма снова
+    конечна.
+
+    Attributes:
+        _total (int | float): Нарастающий итог конечных значений.
+        _compensation (int | float): Потерянные при сложении разряды.
+        _positive_inf (int): Количество `inf` в окне.
+        _negative_inf (int): Количество `-inf` в окне.
+        _nan (int): Количество NaN в окне.
+
+    Examples:
+        >>> SlidingSum(2).extend([1, 2, 3])
+        [1, 3, 5]
+        >>> SlidingSum(2).extend([1e20, 1.0, 1.0, 1.0])
+        [1e+20, 1e+20, 2.0, 2.0]
+        >>> SlidingSum(2).extend([1.0, math.inf, 2.0, 3.0])
+        [1.0, inf, inf, 5.0]
+    """
+
+    def __init__(self, __size):
+        super().__init__(__size)
+        self._reset()
+
+    def clear(self):
+        super().clear()
+        self._reset()
+
+    def _reset(self):
+        self._total = 0
+        self._compensation = 0
+        self._positive_inf = 0
+        self._negative_inf = 0
+        self._nan = 0
+
+    def _add(self, value):
+        # `value - value` равно нулю только для конечных значений.
+        if value - value == 0:
+            self._accumulate(value)
+        else:
+            self._count_special(value, 1)
+
+    def _remove(self, value):
+        if value - value == 0:
+            self._accumulate(-value)
+        else:
+            self._count_special(value, -1)
+
+    def _accumulate(self, value):
+        total = self._total
+        updated = total + value
+        if abs(total) >= abs(value):
+            self._compensation += (total - updated) + value
+        else:
+            self._compensation += (value - updated) + total
+        self._total = updated
+
+    def _count_special(self, value, step):
+        if value != value:
+            self._nan += step
+        elif value > 0:
+            self._positive_inf += step
+        else:
+            self._negative_inf += step
+
+    def _result(self):
+        if self._nan or self._positive_inf and self._negative_inf:
+            return math.nan
+        if self._positive_inf:
+            return math.inf
+        if self._negative_inf:
+            return -math.inf
+        return self._total + self._compensation
+
+
+class SlidingMean(SlidingSum):
+    """Среднее скользящего окна.
+
+    Examples:
+        >>> SlidingMean(2).extend([1, 2, 6])
+        [1.0, 1.5, 4.0]
+    """
+
+    def _result(self):
+        return super()._result() / len(self)
+
+
+class SlidingMin(SlidingWindow):
+    """Минимум скользящего окна на монотонной очереди.
+
+    Вспомогательная `Deck` хранит неубывающую последовательность
+    кандидатов: новое значение вытесняет с конца все большие значения,
+    которые уже никогда не станут минимумом. Каждое значение добавляется
+    и удаляется из неё не больше одного раза, поэтому обновление
+    амортизированно O(1), а минимум всегда в начале. Кандидаты хранятся
+    с номерами значений и покидают окно по номеру, поэтому значения,
+    не равные самим себе (NaN), тоже вытесняются.
+
+    Attributes:
+        _drop (Callable): Условие вытеснения кандидата новым значением.
+        _candidates (Deck): Пары (номер значения, значение).
+        _pushed (int): Номер следующего добавляемого значения.
+        _evicted (int): Номер следующего вытесняемого значения.
+
+    Examples:
+        >>> SlidingMin(3).extend([5, 3, 4, 6, 7, 1])
+        [5, 3, 3, 3, 4, 1]
+    """
+    _drop = operator.gt
+
+    def __init__(self, __size):
+        super().__init__(__size)
+        self._candidates = Deck(__size)
+        self._pushed = 0
+        self._evicted = 0
+
+    def clear(self):
+        super().clear()
+        self._candidates.clear()
+        self._pushed = 0
+        self._evicted = 0
+
+    def _add(self, value):
+        candidates = self._candidates
+        drop = self._drop
+        while len(candidates) and drop(candidates.get_back()[1], value):
+            candidates.pop_back()
+        candidates.push_back((self._pushed, value))
+        self._pushed += 1
+
+    def _remove(self, value):
+        # Вытесняемое значение либо в начале очереди, либо уже удалено.
+        if self._candidates.get_front()[0] == self._evicted:
+            self._candidates.pop_front()
+        self._evicted += 1
+
+    def _result(self):
+        return self._candidates.get_front()[1]
+
+
+class SlidingMax(SlidingMin):
+    """Максимум скользящего окна на монотонной очереди.
+
+    Examples:
+        >>> SlidingMax(3).extend([5, 3, 4, 6, 7, 1])
+        [5, 5, 5, 6, 7, 7]
+    """
+    _drop = operator.lt